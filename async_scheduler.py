@@ -0,0 +1,81 @@
+import typing as t
+from datetime import date as Date
+from weakref import WeakValueDictionary
+import asyncio
+
+from event import Event
+from scheduler import Scheduler
+
+
+class AsyncScheduler:
+    """An asyncio facade of a scheduler. Scheduling an event holds a lock on the date it's inserted
+    into until the optional on_scheduled callback has been awaited, so bookings on the same date are
+    handled one at a time while bookings on different dates proceed concurrently.
+
+    Finding a free span and inserting an event into it never awaits, so no other booking can take
+    the span in between. The reschedule decisions are the same as the wrapped scheduler's.
+    """
+
+    def __init__(
+        self,
+        scheduler: t.Optional[Scheduler] = None,
+        on_scheduled: t.Optional[t.Callable[[Event, bool], t.Awaitable[None]]] = None
+    ) -> None:
+        """Create an async scheduler.
+
+        :param scheduler: The scheduler to schedule events with. Defaults to a new scheduler.
+        :param on_scheduled: Awaited with each event and whether it was rescheduled, after it's
+            inserted and while its date is still locked. For example, to persist the event.
+        """
+        self.scheduler = scheduler or Scheduler()
+        self.on_scheduled = on_scheduled
+        # Locks per date. A lock is dropped once no booking holds or waits for it.
+        self._locks: t.MutableMapping[Date, asyncio.Lock] = WeakValueDictionary()
+
+    def _get_lock(self, date: Date):
+        """Get the lock of a date, creating it if needed."""
+        lock = self._locks.get(date)
+        if lock is None:
+            lock = self._locks[date] = asyncio.Lock()
+        return lock
+
+    async def _insert_event(self, event: Event, rescheduled: bool):
+        """Inserts an event into the schedule at its datetime span, if that span is free, while
+        holding the lock of its date.
+
+        :param event: The event to insert.
+        :param rescheduled: Whether the event was rescheduled.
+        :return: A flag denoting if the event was inserted.
+        """
+        async with self._get_lock(event.start.date()):
+            if not self.scheduler.insert_event(event):
+                return False
+            if self.on_scheduled is not None:
+                await self.on_scheduled(event, rescheduled)
+            return True
+
+    async def schedule_event(self, event: Event) -> bool:
+        """Schedules an event at the requested datetime span. If the event overlaps with an existing
+        event, it will be rescheduled at next availability.
+
+        :param event: The event to schedule.
+        :raises Scheduler.RescheduleRetriesExceededError: If too many of the availabilities found
+            were taken. See Scheduler.reschedule_attempts.
+        :return: A flag denoting if the event was overlapping and rescheduled.
+        """
+        if await self._insert_event(event, rescheduled=False):
+            return False
+
+        # If event overlaps with an existing event, reschedule it. An availability may be taken
+        # while waiting for its date's lock, in which case the scheduler searches again.
+        for event in self.scheduler.reschedule_attempts(event):
+            if await self._insert_event(event, rescheduled=True):
+                return True
+
+    async def get_availabilities(self, date: Date):
+        """Get all the unused datetime spans for a given date. Reading never waits for a lock.
+
+        :param date: The date to get availabilities for.
+        :return: The availabilities for that date.
+        """
+        return self.scheduler.get_availabilities(date)
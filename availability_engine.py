@@ -0,0 +1,139 @@
+import typing as t
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from scheduler import Scheduler
+
+_EPOCH = DateTime(year=1970, month=1, day=1)
+_MICROSECOND = TimeDelta(microseconds=1)
+
+
+class FreeSlots(t.NamedTuple):
+    """The start and end of each availability in a horizon, in order, as arrays of datetime64."""
+
+    starts: 'np.ndarray'
+    ends: 'np.ndarray'
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def dates(self):
+        """The date of each availability, as an array of datetime64."""
+        return self.starts.astype('datetime64[D]')
+
+    @property
+    def timedeltas(self):
+        """The duration of each availability, as an array of timedelta64."""
+        return self.ends - self.starts
+
+    def to_availabilities(self):
+        """Convert the free slots to availabilities.
+
+        :return: The availabilities, in order.
+        """
+        # Free slots are valid by construction, so they need not be validated.
+        return [
+            Scheduler.Availability.construct(start=start, end=end)
+            for start, end in zip(
+                self.starts.astype(DateTime).tolist(),
+                self.ends.astype(DateTime).tolist()
+            )
+        ]
+
+
+class AvailabilityEngine:
+    """Computes the free slots of every date in a horizon at once with vectorised operations,
+    instead of looking up each date in turn. Requires numpy.
+
+    The scheduled events and the start and end of each date are bounds in one sorted array. The free
+    slots are the gaps between each bound's end, carried forward, and the next bound's start.
+    """
+
+    # Datetimes are held to the microsecond, the same as datetime objects.
+    _UNIT = 'datetime64[us]'
+
+    def __init__(self, scheduler: Scheduler) -> None:
+        """Create an availability engine.
+
+        :param scheduler: The scheduler whose free slots are computed.
+        """
+        if np is None:
+            raise ImportError('The availability engine requires numpy')
+        self.scheduler = scheduler
+
+    @classmethod
+    def _to_datetime64(cls, datetimes: t.List[DateTime]):
+        """Convert datetimes to an array of datetime64. Counting microseconds is much faster than
+        converting each datetime object.
+        """
+        return np.fromiter(
+            ((datetime - _EPOCH) // _MICROSECOND for datetime in datetimes),
+            dtype=np.int64,
+            count=len(datetimes)
+        ).view(cls._UNIT)
+
+    def get_free_slots(self, start: Date, end: Date):
+        """Get the free slots of every date between two dates, inclusive. Only dates on a valid
+        weekday are included.
+
+        :param start: The first date to include.
+        :param end: The last date to include.
+        :return: The start and end of each availability, in order.
+        """
+        calendar = self.scheduler.calendar
+
+        # Get each date on a valid weekday. 1970/01/01 was a Thursday.
+        dates = np.arange(np.datetime64(start, 'D'), np.datetime64(end, 'D') + 1)
+        weekdays = (dates.astype(np.int64) + 3) % 7
+        dates = dates[np.isin(weekdays, list(calendar.valid_weekdays))]
+        if not len(dates):
+            return FreeSlots(np.array([], dtype=self._UNIT), np.array([], dtype=self._UNIT))
+        start_of_day = np.timedelta64(calendar.start_of(Date.min) - DateTime.min, 'us')
+        end_of_day = np.timedelta64(calendar.end_of(Date.min) - DateTime.min, 'us')
+        day_starts = dates.astype(self._UNIT) + start_of_day
+        day_ends = dates.astype(self._UNIT) + end_of_day
+
+        # Get the events on those dates, cut to fit inside each date.
+        events = list(self.scheduler.events_between(
+            calendar.start_of(start),
+            calendar.end_of(end)
+        ))
+        event_starts = self._to_datetime64([event.start for event in events])
+        event_ends = self._to_datetime64([event.end for event in events])
+        event_dates = event_starts.astype('datetime64[D]')
+        i = np.searchsorted(dates, event_dates)
+        on_valid_date = (i < len(dates)) & (dates[np.minimum(i, len(dates) - 1)] == event_dates)
+        i = i[on_valid_date]
+        event_starts = np.clip(event_starts[on_valid_date], day_starts[i], day_ends[i])
+        event_ends = np.clip(event_ends[on_valid_date], day_starts[i], day_ends[i])
+
+        # Bound each date with an empty span at its start and end, then order all bounds.
+        bound_starts = np.concatenate([day_starts, day_ends, event_starts])
+        bound_ends = np.concatenate([day_starts, day_ends, event_ends])
+        bound_dates = np.concatenate([np.arange(len(dates))] * 2 + [i])
+        order = np.lexsort((bound_ends, bound_starts))
+        bound_starts = bound_starts[order]
+        bound_ends = bound_ends[order]
+        bound_dates = bound_dates[order]
+
+        # A free slot starts at the latest end so far and ends at the next start on the same date.
+        slot_starts = np.maximum.accumulate(bound_ends)[:-1]
+        slot_ends = bound_starts[1:]
+        is_free = (slot_starts < slot_ends) & (bound_dates[:-1] == bound_dates[1:])
+        return FreeSlots(slot_starts[is_free], slot_ends[is_free])
+
+    def get_availabilities(self, start: Date, end: Date):
+        """Get all the unused datetime spans of every date between two dates, inclusive.
+
+        :param start: The first date to include.
+        :param end: The last date to include.
+        :return: The availabilities, in order.
+        """
+        return self.get_free_slots(start, end).to_availabilities()
@@ -0,0 +1,120 @@
+from argparse import ArgumentParser
+import json
+import platform
+import sys
+
+from benchmarks.suite import BENCHMARKS, run, compare
+from benchmarks.workloads import WORKLOADS
+
+
+def print_result(result):
+    peak_memory = result['peak_memory']
+    print('{key:<50} {throughput:>14,.0f}/s {p50:>10.1f} {p95:>10.1f} {p99:>10.1f} {memory:>12}'.format(
+        key=f"{result['benchmark']}/{result['workload']}/{result['size']}",
+        throughput=result['throughput'],
+        p50=result['p50_us'],
+        p95=result['p95_us'],
+        p99=result['p99_us'],
+        memory='-' if peak_memory is None else f'{peak_memory / 1024:,.0f} KiB'
+    ))
+
+
+def main():
+    arg_parser = ArgumentParser(description='Benchmark the scheduler on synthetic workloads.')
+    arg_parser.add_argument(
+        '--benchmarks',
+        nargs='+',
+        choices=list(BENCHMARKS),
+        default=list(BENCHMARKS),
+        help='Which benchmarks to run.'
+    )
+    arg_parser.add_argument(
+        '--workloads',
+        nargs='+',
+        choices=list(WORKLOADS),
+        default=list(WORKLOADS),
+        help='Which workloads to run each benchmark on.'
+    )
+    arg_parser.add_argument(
+        '--sizes',
+        nargs='+',
+        type=int,
+        default=[100, 1000, 10000],
+        help='How many events each workload has. Sizes up to 1000000 are supported.'
+    )
+    arg_parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='The seed workloads are generated with.'
+    )
+    arg_parser.add_argument(
+        '--no-memory',
+        action='store_true',
+        help="Don't measure peak memory, which runs each benchmark a second time."
+    )
+    arg_parser.add_argument(
+        '--save-baseline',
+        metavar='PATH',
+        help='Save the results as a baseline to compare against later.'
+    )
+    arg_parser.add_argument(
+        '--baseline',
+        metavar='PATH',
+        help='Compare the results against a saved baseline. Exits with 1 if any regressed.'
+    )
+    arg_parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='How much worse than the baseline a result may be, as a fraction.'
+    )
+    args = arg_parser.parse_args()
+
+    print('{:<50} {:>16} {:>10} {:>10} {:>10} {:>12}'.format(
+        'benchmark/workload/size', 'throughput', 'p50 (us)', 'p95 (us)', 'p99 (us)', 'peak memory'
+    ))
+    results = []
+    for benchmark in args.benchmarks:
+        for workload in args.workloads:
+            for size in args.sizes:
+                result = run(benchmark, workload, size, args.seed, memory=not args.no_memory)
+                print_result(result)
+                results.append(result)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seed': args.seed,
+                'results': results
+            }, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline['seed'] != args.seed:
+            print(f"\nWarning: the baseline's workloads were generated with seed {baseline['seed']}.")
+
+        print(f'\nCompared to baseline (tolerance {args.tolerance:.0%}):')
+        regressions = 0
+        for key, throughput_ratio, memory_ratio, regressed in compare(
+            results,
+            baseline['results'],
+            args.tolerance
+        ):
+            regressions += regressed
+            print('{key:<50} throughput x{throughput:.2f} peak memory {memory} {status}'.format(
+                key=key,
+                throughput=throughput_ratio,
+                memory='-' if memory_ratio is None else f'x{memory_ratio:.2f}',
+                status='REGRESSED' if regressed else 'ok'
+            ))
+        if regressions:
+            print(f'\n{regressions} result(s) regressed.')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+import typing as t
+from datetime import datetime as DateTime
+from time import perf_counter_ns
+import gc
+import math
+import tracemalloc
+
+from event import Event
+from scheduler import Scheduler
+from date_time_span import DateTimeSpan
+from clock import FrozenClock
+from benchmarks.workloads import Workload, generate
+
+# What to time: a function, the arguments of each call to it and how many items each call handles.
+Operations = t.Tuple[t.Callable[..., t.Any], t.List[tuple], int]
+
+# Schedulers are frozen at a time before every workload.
+NOW = DateTime(year=2099, month=12, day=1, hour=9, minute=0)
+# Whole-workload operations are repeated until they have handled about this many items.
+REPEATED_ITEMS = 100_000
+
+
+def _create_events(workload: Workload):
+    return [Event.from_trusted(span.start, span.end, name, NOW) for span, name in workload]
+
+
+def _create_scheduler(workload: Workload):
+    scheduler = Scheduler(clock=FrozenClock(NOW))
+    scheduler.schedule_events(_create_events(workload))
+    return scheduler
+
+
+def _to_str(span, name: str):
+    return f'{span.start:%Y/%m/%d %H:%M} -> {span.end:%Y/%m/%d %H:%M} - {name}'
+
+
+def schedule_event(workload: Workload) -> Operations:
+    scheduler = Scheduler(clock=FrozenClock(NOW))
+    return scheduler.schedule_event, [(event,) for event in _create_events(workload)], 1
+
+
+def schedule_events(workload: Workload) -> Operations:
+    def schedule(events: t.List[Event]):
+        return Scheduler(clock=FrozenClock(NOW)).schedule_events(events)
+    # Each call schedules its own copy of the events into a new scheduler, as scheduling moves them.
+    repeats = max(1, min(20, REPEATED_ITEMS // len(workload)))
+    return schedule, [(_create_events(workload),) for _ in range(repeats)], len(workload)
+
+
+def get_next_availability(workload: Workload) -> Operations:
+    scheduler = _create_scheduler(workload)
+    return scheduler.get_next_availability, [
+        (span.start, span.timedelta) for span, _ in workload
+    ], 1
+
+
+def get_availabilities(workload: Workload) -> Operations:
+    scheduler = _create_scheduler(workload)
+    return scheduler.get_availabilities, [(span.start.date(),) for span, _ in workload], 1
+
+
+def merge_many(workload: Workload) -> Operations:
+    spans = [DateTimeSpan.construct(start=span.start, end=span.end) for span, _ in workload]
+    repeats = max(1, min(20, REPEATED_ITEMS // len(spans)))
+    return DateTimeSpan.merge_many, [(spans,)] * repeats, len(spans)
+
+
+def fields_from_str(workload: Workload) -> Operations:
+    return Event.fields_from_str, [(_to_str(span, name),) for span, name in workload], 1
+
+
+def create_event(workload: Workload) -> Operations:
+    def create(fields: t.Dict[str, t.Any]):
+        return Event(**fields)
+    return create, [
+        ({'start': span.start, 'end': span.end, 'name': name, 'created_at': NOW},)
+        for span, name in workload
+    ], 1
+
+
+BENCHMARKS: t.Dict[str, t.Callable[[Workload], Operations]] = {
+    'schedule_event': schedule_event,
+    'schedule_events': schedule_events,
+    'get_next_availability': get_next_availability,
+    'get_availabilities': get_availabilities,
+    'merge_many': merge_many,
+    'fields_from_str': fields_from_str,
+    'create_event': create_event
+}
+
+
+def _percentile(sorted_values: t.List[int], percent: float):
+    """Get a percentile of sorted values with the nearest-rank method."""
+    return sorted_values[max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)]
+
+
+def _time(operations: Operations):
+    """Time each call with garbage collection paused, so that collections are not timed."""
+    function, calls, _ = operations
+    latencies: t.List[int] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for args in calls:
+            start = perf_counter_ns()
+            function(*args)
+            latencies.append(perf_counter_ns() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return latencies
+
+
+def _measure_peak_memory(operations: Operations):
+    """Measure the peak memory allocated while making every call. Tracing memory slows down each
+    call, so this is done separately from timing them.
+    """
+    function, calls, _ = operations
+    tracemalloc.start()
+    try:
+        for args in calls:
+            function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(benchmark: str, workload: str, size: int, seed: int = 0, memory: bool = True):
+    """Run a benchmark on a generated workload.
+
+    :param benchmark: The name of the benchmark.
+    :param workload: The name of the workload.
+    :param size: How many events the workload has.
+    :param seed: The seed the workload is generated with.
+    :param memory: Whether to measure peak memory, which runs the benchmark a second time.
+    :return: A dict with the throughput in items per second, the latency percentiles of each call in
+        microseconds and the peak memory in bytes.
+    """
+    events = generate(workload, size, seed)
+    operations = BENCHMARKS[benchmark](events)
+    latencies = _time(operations)
+    items = len(latencies) * operations[2]
+    seconds = sum(latencies) / 1e9
+    latencies.sort()
+    result = {
+        'benchmark': benchmark,
+        'workload': workload,
+        'size': size,
+        'calls': len(latencies),
+        'seconds': seconds,
+        'throughput': items / seconds if seconds else math.inf,
+        'p50_us': _percentile(latencies, 50) / 1e3,
+        'p95_us': _percentile(latencies, 95) / 1e3,
+        'p99_us': _percentile(latencies, 99) / 1e3,
+        'peak_memory': None
+    }
+    if memory:
+        # Prepare the operations again, as calls may have changed their state.
+        result['peak_memory'] = _measure_peak_memory(BENCHMARKS[benchmark](events))
+    return result
+
+
+def get_key(result: t.Dict[str, t.Any]):
+    return f"{result['benchmark']}/{result['workload']}/{result['size']}"
+
+
+def compare(
+    results: t.List[t.Dict[str, t.Any]],
+    baseline: t.List[t.Dict[str, t.Any]],
+    tolerance: float = 0.2
+):
+    """Compare results against a baseline. A result regressed if its throughput is lower or its peak
+    memory is higher than the baseline's by more than the tolerance.
+
+    :param results: The results to compare.
+    :param baseline: The baseline results to compare against.
+    :param tolerance: How much worse a result may be, as a fraction of the baseline.
+    :return: A list with the key of each result that is in the baseline, how its throughput and peak
+        memory compare as a ratio to the baseline's and whether it regressed.
+    """
+    baseline_results = {get_key(result): result for result in baseline}
+    comparisons = []
+    for result in results:
+        baseline_result = baseline_results.get(get_key(result))
+        if baseline_result is None:
+            continue
+
+        throughput_ratio = result['throughput'] / baseline_result['throughput']
+        memory_ratio = None
+        if result['peak_memory'] is not None and baseline_result['peak_memory']:
+            memory_ratio = result['peak_memory'] / baseline_result['peak_memory']
+        regressed = throughput_ratio < 1 - tolerance or (
+            memory_ratio is not None and memory_ratio > 1 + tolerance
+        )
+        comparisons.append((get_key(result), throughput_ratio, memory_ratio, regressed))
+    return comparisons
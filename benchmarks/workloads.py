@@ -0,0 +1,146 @@
+import typing as t
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+from datetime import time as Time
+import random
+
+from date_time_span import Span
+
+# Workloads are in the future so that events are never in the past. 2100/01/04 is a Monday.
+FIRST_DATE = Date(year=2100, month=1, day=4)
+START_OF_DAY = Time(hour=9, minute=0)
+# Events start on a 15 minute grid, between 09:00 and 17:45.
+SLOTS_PER_DAY = 36
+SLOT = TimeDelta(minutes=15)
+# Uniform workloads average this many events per working day.
+EVENTS_PER_DAY = 8
+
+Workload = t.List[t.Tuple[Span, str]]
+
+
+def get_working_date(i: int):
+    """Get the i-th working date, from Monday to Friday, from the first date."""
+    weeks, weekday = divmod(i, 5)
+    return FIRST_DATE + TimeDelta(weeks=weeks, days=weekday)
+
+
+def _create(date: Date, slot: int, slots: int, name: str):
+    """Create an event's span and name, starting at a slot of a date and cut to fit in the day."""
+    start = DateTime.combine(date, START_OF_DAY) + slot * SLOT
+    slots = min(slots, SLOTS_PER_DAY - slot)
+    return Span(start, start + slots * SLOT), name
+
+
+def uniform(size: int, rng: random.Random) -> Workload:
+    """Events spread evenly over as many working days as needed for a steady number per day."""
+    days = max(1, size // EVENTS_PER_DAY)
+    return [
+        _create(
+            get_working_date(rng.randrange(days)),
+            rng.randrange(SLOTS_PER_DAY),
+            rng.choice([1, 2, 4, 8]),
+            f'Uniform event {i}'
+        )
+        for i in range(size)
+    ]
+
+
+def bursty(size: int, rng: random.Random) -> Workload:
+    """Most events requested in the mornings of a few busy days, the rest spread evenly."""
+    days = max(1, size // EVENTS_PER_DAY)
+    busy_days = max(1, days // 10)
+    workload = []
+    for i in range(size):
+        if rng.random() < 0.8:
+            date = get_working_date(rng.randrange(busy_days) * 10)
+            slot = rng.randrange(8)
+        else:
+            date = get_working_date(rng.randrange(days))
+            slot = rng.randrange(SLOTS_PER_DAY)
+        workload.append(_create(date, slot, rng.choice([1, 2, 4]), f'Bursty event {i}'))
+    return workload
+
+
+def fully_booked_weeks(size: int, rng: random.Random) -> Workload:
+    """Events which book whole weeks back to back, followed by events requested in those weeks,
+    which must be rescheduled past every booked week.
+    """
+    booked = size - size // 10
+    workload = [
+        _create(get_working_date(i // SLOTS_PER_DAY), i % SLOTS_PER_DAY, 1, f'Booked event {i}')
+        for i in range(booked)
+    ]
+    booked_days = max(1, booked // SLOTS_PER_DAY)
+    workload += [
+        _create(
+            get_working_date(rng.randrange(booked_days)),
+            rng.randrange(SLOTS_PER_DAY),
+            rng.choice([1, 2, 4]),
+            f'Overbooked event {i}'
+        )
+        for i in range(size - booked)
+    ]
+    return workload
+
+
+def heavy_overlap(size: int, rng: random.Random) -> Workload:
+    """Events all requested at one of a few spans on the first day, so nearly all of them overlap
+    and must be rescheduled.
+    """
+    return [
+        _create(FIRST_DATE, rng.randrange(4), rng.choice([1, 2, 4]), f'Overlapping event {i}')
+        for i in range(size)
+    ]
+
+
+def late_overlap(size: int, rng: random.Random) -> Workload:
+    """Events spread evenly over working days without overlapping, followed by a few days of events
+    requested at one of a few spans, which overlap. The events are requested in a random order. A
+    batch of them is merged in a single pass up to the first day with overlaps and scheduled one by
+    one from it.
+    """
+    days = max(1, size // EVENTS_PER_DAY)
+    free_days = max(1, days - days // 10)
+    # Each free day is split into blocks of 4 slots, which hold one event each.
+    free_events = min(size - size // 10, free_days * (SLOTS_PER_DAY // 4))
+    workload = [
+        _create(
+            get_working_date(i % free_days),
+            i // free_days * 4,
+            rng.choice([1, 2, 4]),
+            f'Free event {i}'
+        )
+        for i in range(free_events)
+    ]
+    workload += [
+        _create(
+            get_working_date(free_days + rng.randrange(max(1, days // 10))),
+            rng.randrange(4),
+            rng.choice([1, 2, 4]),
+            f'Overlapping event {i}'
+        )
+        for i in range(size - free_events)
+    ]
+    rng.shuffle(workload)
+    return workload
+
+
+WORKLOADS: t.Dict[str, t.Callable[[int, random.Random], Workload]] = {
+    'uniform': uniform,
+    'bursty': bursty,
+    'fully_booked_weeks': fully_booked_weeks,
+    'heavy_overlap': heavy_overlap,
+    'late_overlap': late_overlap
+}
+
+
+def generate(workload: str, size: int, seed: int = 0) -> Workload:
+    """Generate a workload. The same workload, size and seed always generate the same events.
+
+    :param workload: The name of the workload.
+    :param size: How many events to generate.
+    :param seed: The seed of the random number generator.
+    :return: The span and name of each event, in the order they are requested.
+    """
+    return WORKLOADS[workload](size, random.Random(seed))
@@ -0,0 +1,32 @@
+import typing as t
+from abc import ABC, abstractmethod
+from datetime import datetime as DateTime
+
+
+class Clock(ABC):
+    """A source of the current datetime."""
+
+    @abstractmethod
+    def now(self) -> DateTime:
+        """Get the current datetime."""
+
+
+class SystemClock(Clock):
+    """Reads the current datetime from the system."""
+
+    def now(self):
+        return DateTime.now()
+
+
+class FrozenClock(Clock):
+    """Always returns the same datetime, so that runs are deterministic and read the time once."""
+
+    def __init__(self, now: t.Optional[DateTime] = None) -> None:
+        """Create a frozen clock.
+
+        :param now: The datetime to freeze at. Defaults to the current datetime of the system.
+        """
+        self._now = DateTime.now() if now is None else now
+
+    def now(self):
+        return self._now
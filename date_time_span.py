@@ -8,6 +8,19 @@ from itertools import groupby
 from pydantic import BaseModel, Field, root_validator
 
 
+class Span(t.NamedTuple):
+    """A lightweight span between start and end datetimes. Unlike DateTimeSpan, it is not validated
+    and holds no more than its start and end, so it is cheap to create and store in bulk.
+    """
+
+    start: DateTime
+    end: DateTime
+
+    @property
+    def timedelta(self) -> TimeDelta:
+        return self.end - self.start
+
+
 class DateTimeSpan(BaseModel):
     """A span between start and end datetimes."""
 
@@ -59,11 +72,9 @@ class DateTimeSpan(BaseModel):
         :return: A flag determining if this span overlaps with the other.
         """
         return (
-            span.start <= self.start <= span.end
-            or span.start <= self.end <= span.end
+            self.start <= span.end and span.start <= self.end
         ) if equals else (
-            span.start <= self.start < span.end
-            or span.start < self.end <= span.end
+            self.start < span.end and span.start < self.end
         )
 
     @staticmethod
@@ -80,35 +91,76 @@ class DateTimeSpan(BaseModel):
                 end=span_1.end if span_1.end >= span_2.end else span_2.end
             )
 
+    @staticmethod
+    def merge_sorted(spans: t.Iterable[DateTimeSpan]):
+        """Merge all the spans that can be merged together in a single pass. The spans must already
+        be ordered by their start.
+
+        :param spans: The spans to merge together, ordered by start.
+        :return: The merged spans, in order.
+        """
+        merged_spans: t.List[Span] = []
+        spans = iter(spans)
+        for span in spans:
+            start, end = span.start, span.end
+            break
+        else:
+            return merged_spans
+
+        for span in spans:
+            # If span overlaps with or touches the current merged span, extend it.
+            if span.start <= end:
+                if span.end > end:
+                    end = span.end
+            else:
+                merged_spans.append(Span(start, end))
+                start, end = span.start, span.end
+        merged_spans.append(Span(start, end))
+        return merged_spans
+
+    @staticmethod
+    def intersect_sorted(spans_1: t.Iterable[DateTimeSpan], spans_2: t.Iterable[DateTimeSpan]):
+        """Intersect two lists of spans in a single pass. Each list must already be ordered by start
+        and have no overlapping spans, such as the free slots of a date.
+
+        :param spans_1: The first spans to intersect, ordered by start.
+        :param spans_2: The second spans to intersect, ordered by start.
+        :return: The spans covered by both lists, in order.
+        """
+        intersected_spans: t.List[Span] = []
+        spans_1, spans_2 = list(spans_1), list(spans_2)
+        i = j = 0
+        while i < len(spans_1) and j < len(spans_2):
+            start = max(spans_1[i].start, spans_2[j].start)
+            end = min(spans_1[i].end, spans_2[j].end)
+            if start < end:
+                intersected_spans.append(Span(start, end))
+            # Move past whichever span ends first.
+            if spans_1[i].end <= spans_2[j].end:
+                i += 1
+            else:
+                j += 1
+        return intersected_spans
+
     @classmethod
-    def merge_many(cls, spans: t.List[DateTimeSpan]):
-        """Merge the all the spans that can be merged together.
+    def merge_many(cls, spans: t.Iterable[DateTimeSpan], presorted: bool = False):
+        """Merge the all the spans that can be merged together. The spans are not modified.
 
-        :param spans: The list of spans to merge together.
+        :param spans: The spans to merge together.
+        :param presorted: Whether the spans are already ordered by start, so they need not be sorted.
         :return: A dict where the key is a date and the value is the merged spans for that date.
         """
-        # Group events by date.
-        def key(span: DateTimeSpan):
-            return span.start.date()
-        spans.sort(key=key)
-        grouped_spans = {
-            date: list(spans)
-            for date, spans in groupby(spans, key=key)
+        # Order spans by start.
+        if not presorted:
+            spans = sorted(spans, key=lambda span: (span.start, span.end))
+
+        # Group spans by date and, for each date, merge spans.
+        # Merged spans are valid by construction, so they need not be validated. They are plain
+        # spans whatever the spans' type, as they have no other fields.
+        return {
+            date: [
+                DateTimeSpan.construct(start=start, end=end)
+                for start, end in cls.merge_sorted(spans_for_date)
+            ]
+            for date, spans_for_date in groupby(spans, key=lambda span: span.start.date())
         }
-
-        # For each date, merge events' spans.
-        merged_spans: t.Dict[Date, t.List[DateTimeSpan]] = {}
-        for date, spans in grouped_spans.items():
-            merged_spans[date] = []
-            spans.sort()
-            while spans:
-                span = spans.pop(0)
-                while spans:
-                    merged_span = cls.merge(span, spans[0])
-                    if merged_span is None:
-                        break
-                    else:
-                        span = merged_span
-                        spans.pop(0)
-                merged_spans[date].append(span)
-        return merged_spans
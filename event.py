@@ -1,13 +1,41 @@
 from __future__ import annotations
 import typing as t
 from datetime import datetime as DateTime
-from datetime import date as Date
-from datetime import time as Time
 import re
 
-from pydantic import Field, validator, root_validator
+from pydantic import Field, ValidationError, validator, root_validator
 
 from date_time_span import DateTimeSpan
+from working_calendar import WorkingCalendar
+from clock import Clock, SystemClock
+
+
+class _CalendarSetting:
+    """A read only alias of a setting of an event type's working calendar, kept for code which read
+    the settings from before they were moved to the calendar.
+    """
+
+    def __init__(self, get: t.Callable[[WorkingCalendar], t.Any]) -> None:
+        self._get = get
+
+    def __get__(self, event: t.Optional[Event], event_type: t.Type[Event]):
+        return self._get(event_type._calendar)
+
+
+def _restore_calendar_event(base_type: t.Type[Event], calendar: WorkingCalendar, state: t.Any):
+    """Recreate an event of a calendar's event type when it is unpickled. The event type is looked
+    up again, so it does not need to exist before, such as in another process.
+    """
+    event_type = base_type.with_calendar(calendar)
+    event = event_type.__new__(event_type)
+    event.__setstate__(state)
+    return event
+
+
+def _reduce_calendar_event(event: Event):
+    """Pickle an event of a calendar's event type as its base type, calendar and fields."""
+    event_type = type(event)
+    return _restore_calendar_event, (event_type._base_type, event_type._calendar, event.__getstate__())
 
 
 class Event(DateTimeSpan):
@@ -25,40 +53,71 @@ class Event(DateTimeSpan):
     # autopep8: on
 
     name: str = Field(min_length=1)
-    created_at: DateTime = Field(default_factory=DateTime.now)
+    created_at: DateTime = Field(default_factory=lambda: Event._clock.now())
 
-    # Setting to control which weekdays an event can be created for. 0=Monday -> 6=Sunday.
-    _valid_weekdays = [0, 1, 2, 3, 4]
-    # Setting to control what time of day events may start at the earliest.
-    _start_of_day = Time(hour=9, minute=0)
-    # Setting to control what time of day events may end at the latest.
-    _end_of_day = Time(hour=18, minute=0)
+    # Setting to control which weekdays and what times of day an event can be created for.
+    _calendar = WorkingCalendar()
+    # Which weekdays an event can be created for. 0=Monday -> 6=Sunday. An alias of the calendar's.
+    _valid_weekdays = _CalendarSetting(lambda calendar: sorted(calendar.valid_weekdays))
+    # What time of day events may start at the earliest. An alias of the calendar's.
+    _start_of_day = _CalendarSetting(lambda calendar: calendar.start_of_day)
+    # What time of day events may end at the latest. An alias of the calendar's.
+    _end_of_day = _CalendarSetting(lambda calendar: calendar.end_of_day)
+    # Setting to control where the datetime stamp of when an event was created is read from.
+    _clock: Clock = SystemClock()
+    # Event types per base type and calendar, so each type is only created once per calendar.
+    _calendar_types: t.Dict[t.Tuple[t.Type[Event], WorkingCalendar], t.Type[Event]] = {}
+
+    @classmethod
+    def with_calendar(cls, calendar: WorkingCalendar) -> t.Type[Event]:
+        """Get the event type which is validated against a given working calendar.
+
+        Each subclass is named after its calendar, so it can be told apart from this type, and its
+        events pickle as this type and the calendar, so they unpickle even where the subclass was
+        not created yet.
+
+        :param calendar: The working calendar to validate events against.
+        :return: A subclass of this event type with the calendar set.
+        """
+        if calendar == cls._calendar:
+            return cls
+        event_type = cls._calendar_types.get((cls, calendar))
+        if event_type is None:
+            name = f'{cls.__name__}[{calendar!r}]'
+            event_type = cls._calendar_types[(cls, calendar)] = type(name, (cls,), {
+                '__module__': cls.__module__,
+                '__qualname__': f'{cls.__qualname__}[{calendar!r}]',
+                '__reduce__': _reduce_calendar_event,
+                '_calendar': calendar,
+                '_base_type': getattr(cls, '_base_type', cls)
+            })
+        return event_type
 
     @validator('start', 'end')
     def valid_weekday(cls, value: DateTime):
         """Validate start and end are on a valid weekday."""
-        if not value.weekday() in cls._valid_weekdays:
-            raise cls.InvalidWeekDayError('Dates must be between Monday and Friday')
+        if not cls._calendar.is_valid_weekday(value):
+            raise cls.InvalidWeekDayError(f'Dates must be {cls._calendar.weekdays_description}')
         return value
 
     @validator('start', 'end')
     def valid_time(cls, value: DateTime):
         """Validate start and end times are between the start and end of the day."""
-        if not (cls._start_of_day <= value.time() <= cls._end_of_day):
-            raise cls.InvalidTimeError('Times must be between 9:00 and 18:00')
+        if not (cls._calendar.start_of_day <= value.time() <= cls._calendar.end_of_day):
+            raise cls.InvalidTimeError(f'Times must be {cls._calendar.times_description}')
         return value
 
     @validator('start')
     def not_end_of_day(cls, value: DateTime):
         """Validate start is not at the end of the day."""
-        if value.time() == cls._end_of_day:
+        if value.time() == cls._calendar.end_of_day:
             raise cls.EndOfDayError('Cannot start an event at the end of the day')
         return value
 
     @validator('end')
     def not_start_of_day(cls, value: DateTime):
         """Validate end is not at the start of the day."""
-        if value.time() == cls._start_of_day:
+        if value.time() == cls._calendar.start_of_day:
             raise cls.StartOfDayError('Cannot end an event at the start of the day')
         return value
 
@@ -68,10 +127,7 @@ class Event(DateTimeSpan):
         start: t.Optional[DateTime] = values.get('start')
         end: t.Optional[DateTime] = values.get('end')
         if start is not None and end is not None:
-            today = Date.today()
-            start_of_day = DateTime.combine(today, cls._start_of_day)
-            end_of_day = DateTime.combine(today, cls._end_of_day)
-            if end - start > end_of_day - start_of_day:
+            if end - start > cls._calendar.max_timedelta:
                 raise cls.TimeDeltaTooLargeError('The timedelta between start and end is too large')
         return values
 
@@ -90,6 +146,81 @@ class Event(DateTimeSpan):
     def __eq__(self, event: Event) -> bool:
         return super().__eq__(event) and self.name == event.name
 
+    @classmethod
+    def from_trusted(
+        cls,
+        start: DateTime,
+        end: DateTime,
+        name: str,
+        created_at: t.Optional[DateTime] = None
+    ):
+        """Creates an event from fields which are already known to be valid, such as those of an
+        event that was validated before being stored, without running any validators. Fields which
+        are not known to be valid must be passed to the constructor instead.
+
+        :param start: The event's start.
+        :param end: The event's end.
+        :param name: The event's name.
+        :param created_at: When the event was created. Defaults to now.
+        :return: An event with the given fields.
+        """
+        return cls.construct(
+            start=start,
+            end=end,
+            name=name,
+            created_at=cls._clock.now() if created_at is None else created_at
+        )
+
+    @classmethod
+    def validate_many(cls, fields: t.Iterable[t.Dict[str, t.Any]]):
+        """Validates many events, one at a time. This is a convenience loop, not a vectorised pass:
+        the clock and the calendar's bounds are read once for the whole list, then each event's
+        fields are checked in turn with the same checks every validator makes, inlined. Fields which
+        pass them are trusted and built without running the validators. Any others are passed to the
+        constructor, so the outcome per event is the same as creating each event with Event(**fields).
+        Events without a created_at are given the same creation datetime stamp.
+
+        :param fields: A dict per event with the named fields needed to create it.
+        :return: A list with the created event or the raised validation error per event, in order.
+        """
+        # Get datetime stamp and validation bounds once for all events.
+        now = cls._clock.now()
+        valid_weekdays = cls._calendar.valid_weekdays
+        start_of_day, end_of_day = cls._calendar.start_of_day, cls._calendar.end_of_day
+        max_timedelta = cls._calendar.max_timedelta
+        field_names = set(cls.__fields__)
+
+        events: t.List[t.Union[Event, ValidationError]] = []
+        for event_fields in fields:
+            start = event_fields.get('start')
+            end = event_fields.get('end')
+            name = event_fields.get('name')
+            created_at = event_fields.get('created_at', now)
+            if (
+                field_names.issuperset(event_fields)
+                and type(start) is DateTime and start.tzinfo is None
+                and type(end) is DateTime and end.tzinfo is None
+                and type(created_at) is DateTime and created_at.tzinfo is None
+                and type(name) is str and len(name) >= 1
+                # start_lt_end and lte_max_timedelta.
+                and start < end and end - start <= max_timedelta
+                # valid_weekday.
+                and start.weekday() in valid_weekdays and end.weekday() in valid_weekdays
+                # valid_time, not_end_of_day and not_start_of_day.
+                and start_of_day <= start.time() < end_of_day
+                and start_of_day < end.time() <= end_of_day
+                # not_in_the_past.
+                and start >= created_at
+            ):
+                events.append(cls.from_trusted(start, end, name, created_at))
+            else:
+                try:
+                    # Events passed to the constructor are given the same creation datetime stamp.
+                    events.append(cls(**{'created_at': now, **event_fields}))
+                except ValidationError as error:
+                    events.append(error)
+        return events
+
     @classmethod
     def fields_from_str(cls, event: str):
         """Extracts the fields needed to instantiate an event from a string. 
@@ -100,23 +231,72 @@ class Event(DateTimeSpan):
         :return: A dict with the named fields needed to create an event. event = Event(**fields). 
         """
         # Get datetime stamp before any processing time elapses.
-        created_at = DateTime.now()
+        return cls._fields_from_str(event, created_at=cls._clock.now())
 
-        # Match event pattern.
-        match = re.match(r'(.+)->(.+)-(.+)', event)
-        if not match:
-            raise cls.InvalidFormatError(
-                'Expected format: "<start_date> -> <end_date> - <event_name>"'
-            )
+    @classmethod
+    def fields_from_strs(cls, events: t.Iterable[str]):
+        """Extracts the fields needed to instantiate many events from strings. All events are given
+        the same creation datetime stamp.
+
+        :param events: The events in string format.
+        :raises cls.InvalidFormatError: If a string is not in the expected format.
+        :raises cls.InvalidDateTimeFormatError: If a start or end is not in the expected format.
+        :return: A list of dicts with the named fields needed to create each event.
+        """
+        # Get datetime stamp before any processing time elapses.
+        created_at = cls._clock.now()
+        return [cls._fields_from_str(event, created_at) for event in events]
+
+    @staticmethod
+    def _is_fixed_layout_datetime(dt: str):
+        """Checks if a datetime string has exactly the layout "YYYY/MM/DD HH:mm"."""
+        return (
+            len(dt) == 16 and dt.isascii()
+            and dt[4] == dt[7] == '/' and dt[10] == ' ' and dt[13] == ':'
+            and (dt[:4] + dt[5:7] + dt[8:10] + dt[11:13] + dt[14:]).isdigit()
+        )
+
+    @classmethod
+    def _fields_from_str(cls, event: str, created_at: DateTime):
+        """Extracts the fields needed to instantiate an event from a string.
+
+        :param event: The event in string format.
+        :param created_at: The datetime stamp of when the event was created.
+        :raises cls.InvalidFormatError: If the string is not in the expected format.
+        :raises cls.InvalidDateTimeFormatError: If the start and end are not in the expected format.
+        :return: A dict with the named fields needed to create an event. event = Event(**fields).
+        """
+        # Get event fields at fixed offsets if event has exactly the expected layout:
+        # "YYYY/MM/DD HH:mm -> YYYY/MM/DD HH:mm - <event_name>".
+        if (
+            event[16:20] == ' -> ' and event[36:39] == ' - ' and event[39:].strip()
+            and cls._is_fixed_layout_datetime(event[:16])
+            and cls._is_fixed_layout_datetime(event[20:36])
+        ):
+            start = event[:16]
+            end = event[20:36]
+            name = event[39:].strip()
+        else:
+            # Match event pattern.
+            match = re.match(r'(.+)->(.+)-(.+)', event)
+            if not match:
+                raise cls.InvalidFormatError(
+                    'Expected format: "<start_date> -> <end_date> - <event_name>"'
+                )
 
-        # Get event fields.
-        start = match.group(1).strip()
-        end = match.group(2).strip()
-        name = match.group(3).strip()
+            # Get event fields.
+            start = match.group(1).strip()
+            end = match.group(2).strip()
+            name = match.group(3).strip()
 
         # Cast datetime strings to objects.
         def to_datetime(dt: str):
             try:
+                # Slicing is much faster than parsing, which is only needed for other layouts.
+                if cls._is_fixed_layout_datetime(dt):
+                    return DateTime(
+                        int(dt[:4]), int(dt[5:7]), int(dt[8:10]), int(dt[11:13]), int(dt[14:])
+                    )
                 return DateTime.strptime(dt, '%Y/%m/%d %H:%M')
             except ValueError as ex:
                 raise cls.InvalidDateTimeFormatError(
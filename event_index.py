@@ -0,0 +1,53 @@
+import typing as t
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+
+from event import Event
+
+
+class EventIndex(ABC):
+    """Finds where an event belongs among a date's events, which are ordered and do not overlap."""
+
+    @abstractmethod
+    def find_position(self, events: t.List[Event], event: Event) -> t.Optional[int]:
+        """Find the position at which an event can be inserted into a date's events.
+
+        :param events: The date's events, ordered and not overlapping.
+        :param event: The event to find a position for.
+        :return: The position to insert the event at. If the event overlaps with one of the date's
+            events, None is returned.
+        """
+
+
+class ListEventIndex(EventIndex):
+    """Scans a date's events one by one. Finding a position is O(n)."""
+
+    def find_position(self, events, event):
+        for i, current_event in enumerate(events):
+            # If event overlaps with current event, there is no position for it.
+            if event.overlaps_with(current_event, equals=False):
+                return None
+            # If event ends before current event starts, it goes before current event.
+            if event.end <= current_event.start:
+                return i
+
+        # If event starts after current event ends and no next event, it goes at the end.
+        return len(events)
+
+
+class BisectEventIndex(EventIndex):
+    """Binary searches a date's events. As they do not overlap, their starts and ends are both in
+    order. Finding a position is O(log n).
+    """
+
+    @staticmethod
+    def _end(event: Event):
+        return event.end
+
+    def find_position(self, events, event):
+        # Find the first event that ends after the event starts.
+        i = bisect_right(events, event.start, key=self._end)
+        # If that event starts before the event ends, they overlap.
+        if i < len(events) and events[i].start < event.end:
+            return None
+        return i
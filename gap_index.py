@@ -0,0 +1,126 @@
+import typing as t
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+
+
+class GapIndex:
+    """An index of the largest free gap per date, used to skip dates which are too booked.
+
+    This is a segment tree over day ordinals where each node holds the largest gap of the dates in
+    its range. Only dates whose gaps are known are stored. Any other valid weekday is assumed to have
+    the largest possible gap, which makes every stored value an upper bound of a date's largest gap.
+    Finding the first date with a large enough gap is O(log n) of the number of dates in the horizon.
+
+    Dates are only skipped once their gaps are known. Until then, a search stops at each of them and
+    the caller must compute the date's gap and update the index, so a search over dates whose gaps
+    are not known yet costs one gap computation per booked date.
+    """
+
+    # 2 ** 22 days covers every date's ordinal.
+    _DEPTH = 22
+    _SIZE = 2 ** _DEPTH
+
+    def __init__(self, valid_weekdays: t.Iterable[int], max_gap: TimeDelta) -> None:
+        """Create a gap index.
+
+        :param valid_weekdays: The weekdays which may have gaps. 0=Monday -> 6=Sunday.
+        :param max_gap: The largest possible gap of a date, such as the length of a working day.
+        """
+        self._valid_weekdays = frozenset(valid_weekdays)
+        self._max_gap = max_gap
+        # Nodes is a dict where the key is a node's ID and the value is the largest gap in its range.
+        # The root's ID is 1 and the children of a node are 2 * ID and 2 * ID + 1.
+        self._nodes: t.Dict[int, TimeDelta] = {}
+
+    def _is_valid_ordinal(self, ordinal: int):
+        # Ordinal 1 is a Monday.
+        return (ordinal - 1) % 7 in self._valid_weekdays
+
+    def _first_valid_ordinal(self, lo: int, hi: int):
+        """Get the first ordinal in [lo, hi) on a valid weekday."""
+        for ordinal in range(lo, min(hi, lo + 7)):
+            if self._is_valid_ordinal(ordinal):
+                return ordinal
+
+    def _get_node(self, node: int, lo: int, hi: int):
+        """Get the largest gap in a node's range, assuming the largest possible gap if unknown."""
+        gap = self._nodes.get(node)
+        if gap is None:
+            gap = TimeDelta() if self._first_valid_ordinal(lo, hi) is None else self._max_gap
+        return gap
+
+    def _update_parents(self, node: int):
+        """Recompute the largest gap of each of a node's parents, from the bottom up."""
+        size = 1
+        while node > 1:
+            node //= 2
+            size *= 2
+            left, right = 2 * node, 2 * node + 1
+            if left not in self._nodes and right not in self._nodes:
+                self._nodes.pop(node, None)
+            else:
+                lo = (node - 2 ** (node.bit_length() - 1)) * size
+                mid = lo + size // 2
+                self._nodes[node] = max(
+                    self._get_node(left, lo, mid),
+                    self._get_node(right, mid, lo + size)
+                )
+
+    def update(self, date: Date, gap: TimeDelta):
+        """Set the largest gap of a date. Dates on invalid weekdays are ignored.
+
+        :param date: The date to set the largest gap of.
+        :param gap: The largest gap of that date.
+        """
+        ordinal = date.toordinal()
+        if not self._is_valid_ordinal(ordinal):
+            return
+        node = self._SIZE + ordinal
+        if self._nodes.get(node) != gap:
+            self._nodes[node] = gap
+            self._update_parents(node)
+
+    def discard(self, date: Date):
+        """Forget the largest gap of a date, so it is assumed to be the largest possible gap.
+
+        :param date: The date to forget the largest gap of.
+        """
+        node = self._SIZE + date.toordinal()
+        if self._nodes.pop(node, None) is not None:
+            self._update_parents(node)
+
+    def find(self, date: Date, gap: TimeDelta):
+        """Find the first date, from a given date, which may have a gap at least as large as a given
+        gap. Dates whose largest gap is unknown are assumed to have the largest possible gap.
+
+        :param date: The first date to search from.
+        :param gap: The gap that must fit.
+        :return: The first date that may have a large enough gap. If no date can have a large enough
+            gap, None is returned.
+        """
+        if gap > self._max_gap:
+            return None
+        ordinal = self._find(1, 0, self._SIZE, date.toordinal(), gap)
+        return None if ordinal is None else Date.fromordinal(ordinal)
+
+    def _find(self, node: int, lo: int, hi: int, ordinal: int, gap: TimeDelta) -> t.Optional[int]:
+        # Range ends before the first ordinal.
+        if hi <= ordinal:
+            return None
+
+        # No dates in range are known. Any valid weekday may fit the gap.
+        node_gap = self._nodes.get(node)
+        if node_gap is None:
+            return self._first_valid_ordinal(max(lo, ordinal), hi)
+
+        # No dates in range have a large enough gap.
+        if node_gap < gap:
+            return None
+        if hi - lo == 1:
+            return lo
+
+        mid = (lo + hi) // 2
+        found = self._find(2 * node, lo, mid, ordinal, gap)
+        if found is None:
+            found = self._find(2 * node + 1, mid, hi, ordinal, gap)
+        return found
@@ -0,0 +1,263 @@
+import typing as t
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+import os
+import struct
+import zlib
+
+from event import Event
+from scheduler import Scheduler
+import snapshot
+
+_EPOCH = DateTime(year=1970, month=1, day=1)
+_MINUTE = TimeDelta(minutes=1)
+_MICROSECOND = TimeDelta(microseconds=1)
+# Each record is its payload's checksum and size, followed by the payload.
+_RECORD_HEADER = struct.Struct('<II')
+# A payload is the operation, the start and end in epoch minutes, the creation datetime stamp in
+# epoch microseconds, followed by the UTF-8 encoded name.
+_PAYLOAD = struct.Struct('<Bqqq')
+
+
+class Journal:
+    """An append-only log of the events scheduled since a scheduler's last snapshot, so that the
+    scheduler can be rebuilt after a crash without saving every event on every change.
+
+    Each scheduled event is logged at the span it was inserted into. Records are buffered and
+    written together by commit, which syncs them to disk once for the whole group. Events which
+    were not committed are lost on a crash. Once the log grows past a size, it is folded into a new
+    snapshot and emptied.
+    """
+
+    SCHEDULED = 0
+    RESCHEDULED = 1
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        log_path: str,
+        snapshot_path: str,
+        group_size: int = 100,
+        compact_size: int = 64 * 1024 * 1024
+    ) -> None:
+        """Create a journal of a scheduler. Use Journal.open to rebuild the scheduler first. If the
+        log ends with a record which was only partly written, the record is removed.
+
+        :param scheduler: The scheduler to log the events of.
+        :param log_path: Where to append records.
+        :param snapshot_path: Where to save the snapshot the log is folded into.
+        :param group_size: How many records to buffer before committing them.
+        :param compact_size: How many bytes the log may grow to before it is folded into a snapshot.
+        """
+        self.scheduler = scheduler
+        self.log_path = log_path
+        self.snapshot_path = snapshot_path
+        self.group_size = group_size
+        self.compact_size = compact_size
+        self._records: t.List[bytes] = []
+        # Records appended after a partly written record could not be read, so it is removed first.
+        if os.path.exists(log_path):
+            _remove_partly_written_record(log_path)
+        self._log = open(log_path, 'ab')
+
+    @classmethod
+    def open(
+        cls,
+        log_path: str,
+        snapshot_path: str,
+        scheduler: t.Optional[Scheduler] = None,
+        **kwargs
+    ):
+        """Rebuild a scheduler from its last snapshot and the records logged since, then journal it.
+
+        :param log_path: Where records were appended.
+        :param snapshot_path: Where the last snapshot was saved.
+        :param scheduler: The scheduler to rebuild, which must have no events. Defaults to a new
+            scheduler.
+        :param kwargs: The remaining arguments of the journal.
+        :return: A journal of the rebuilt scheduler.
+        """
+        if scheduler is None:
+            scheduler = Scheduler()
+        if os.path.exists(snapshot_path):
+            snapshot.load(snapshot_path, scheduler)
+        if os.path.exists(log_path):
+            replay(scheduler, log_path)
+        return cls(scheduler, log_path, snapshot_path, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def _check_whole_minutes(start: DateTime, end: DateTime):
+        """Check an event starts and ends on a whole minute before it is scheduled, so that it is
+        not scheduled without being logged.
+        """
+        if (start - _EPOCH) % _MINUTE or (end - _EPOCH) % _MINUTE:
+            raise ValueError('Events must start and end on a whole minute')
+
+    def _append(self, event: Event, operation: int):
+        payload = _PAYLOAD.pack(
+            operation,
+            (event.start - _EPOCH) // _MINUTE,
+            (event.end - _EPOCH) // _MINUTE,
+            (event.created_at - _EPOCH) // _MICROSECOND
+        ) + event.name.encode()
+        self._records.append(_RECORD_HEADER.pack(zlib.crc32(payload), len(payload)) + payload)
+        if len(self._records) >= self.group_size:
+            self.commit()
+
+    def schedule_event(self, event: Event) -> bool:
+        """Schedules an event and logs where it was inserted. See Scheduler.schedule_event.
+
+        :param event: The event to schedule.
+        :return: A flag denoting if the event was overlapping and rescheduled.
+        """
+        self._check_whole_minutes(event.start, event.end)
+        rescheduled = self.scheduler.schedule_event(event)
+        self._append(event, self.RESCHEDULED if rescheduled else self.SCHEDULED)
+        return rescheduled
+
+    def schedule_events(self, events: t.Iterable[Event]):
+        """Schedules many events at once and logs where each was inserted. See
+        Scheduler.schedule_events.
+
+        :param events: The events to schedule, in the order they were requested.
+        :return: A flag per event denoting if it was overlapping and rescheduled.
+        """
+        events = list(events)
+        for event in events:
+            self._check_whole_minutes(event.start, event.end)
+        rescheduled = self.scheduler.schedule_events(events)
+        for event, event_rescheduled in zip(events, rescheduled):
+            self._append(event, self.RESCHEDULED if event_rescheduled else self.SCHEDULED)
+        return rescheduled
+
+    def reschedule_invalid_event(
+        self,
+        start: DateTime,
+        end: DateTime,
+        name: str,
+        created_at: DateTime
+    ):
+        """Creates a new event at the next availability for an invalid event, adds it to the
+        schedule and logs where it was inserted. See Scheduler.reschedule_invalid_event.
+
+        :param start: The event's original start.
+        :param end: The event's original end.
+        :param name: The event's original name.
+        :param created_at: When the event was created.
+        :return: A valid event with its start and end set at the next availability.
+        """
+        self._check_whole_minutes(start, end)
+        event = self.scheduler.reschedule_invalid_event(start, end, name, created_at)
+        self._append(event, self.RESCHEDULED)
+        return event
+
+    def commit(self):
+        """Write the buffered records to the log and sync them to disk. If the log has grown past
+        its size, it is folded into a snapshot.
+        """
+        if self._records:
+            self._log.write(b''.join(self._records))
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._records.clear()
+        if os.fstat(self._log.fileno()).st_size > self.compact_size:
+            self.compact()
+
+    def compact(self):
+        """Fold the log into a new snapshot of the scheduler and empty the log.
+
+        The snapshot replaces the last one before the log is emptied. If a crash happens in between,
+        the logged events are already in the snapshot and are skipped when the log is replayed.
+        """
+        # Buffered records are folded into the snapshot too.
+        self._records.clear()
+
+        # The snapshot is saved next to the last one, then replaces it.
+        snapshot.save(self.scheduler, self.snapshot_path)
+
+        self._log.seek(0)
+        self._log.truncate()
+        os.fsync(self._log.fileno())
+
+    def close(self):
+        """Commit the buffered records and close the log."""
+        if not self._log.closed:
+            self.commit()
+            self._log.close()
+
+
+def _read_records(log: bytes) -> t.Iterator[t.Tuple[bytes, int]]:
+    """Read each record of a log in turn, stopping at a record which was only partly written.
+
+    :param log: The log's contents.
+    :return: An iterator which yields each record's payload and the offset the record ends at.
+    """
+    offset = 0
+    while offset + _RECORD_HEADER.size <= len(log):
+        checksum, size = _RECORD_HEADER.unpack_from(log, offset)
+        payload = log[offset + _RECORD_HEADER.size:offset + _RECORD_HEADER.size + size]
+        # Stop at a record which was only partly written.
+        if len(payload) < max(size, _PAYLOAD.size) or zlib.crc32(payload) != checksum:
+            return
+        offset += _RECORD_HEADER.size + size
+        yield payload, offset
+
+
+def _truncate_log(log_path: str, log: bytes, offset: int):
+    """Remove whatever follows the last whole record of a log, if anything does."""
+    if offset < len(log):
+        with open(log_path, 'r+b') as file:
+            file.truncate(offset)
+            os.fsync(file.fileno())
+
+
+def _remove_partly_written_record(log_path: str):
+    """Remove the record a log ends with if it was only partly written, so that records appended
+    next can be read.
+
+    :param log_path: Where records were appended.
+    """
+    with open(log_path, 'rb') as file:
+        log = file.read()
+    offset = 0
+    for _, offset in _read_records(log):
+        pass
+    _truncate_log(log_path, log, offset)
+
+
+def replay(scheduler: Scheduler, log_path: str):
+    """Insert the events logged in a journal into a scheduler, at the spans they were logged at. The
+    events were validated before they were logged, so they are not validated again. Events which
+    overlap with an event in the scheduler are skipped, as they are already in its snapshot.
+
+    If the log ends with a record which was only partly written, the record is removed.
+
+    :param scheduler: The scheduler to insert the events into.
+    :param log_path: Where records were appended.
+    :return: How many events were inserted.
+    """
+    with open(log_path, 'rb') as file:
+        log = file.read()
+
+    inserted = 0
+    offset = 0
+    for payload, offset in _read_records(log):
+        _, start, end, created_at = _PAYLOAD.unpack_from(payload)
+        event = scheduler.event_type.from_trusted(
+            start=_EPOCH + start * _MINUTE,
+            end=_EPOCH + end * _MINUTE,
+            name=payload[_PAYLOAD.size:].decode(),
+            created_at=_EPOCH + created_at * _MICROSECOND
+        )
+        inserted += scheduler.insert_event(event)
+
+    # Remove a partly written record, so that records appended next can be read.
+    _truncate_log(log_path, log, offset)
+
+    return inserted
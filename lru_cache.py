@@ -0,0 +1,79 @@
+import typing as t
+from collections import OrderedDict
+
+Key = t.TypeVar('Key')
+Value = t.TypeVar('Value')
+
+
+class LRUCache(t.Generic[Key, Value]):
+    """A cache holding up to a number of values. Once full, the value used least recently is
+    evicted to make room for a new one. Counts how many lookups were hits and misses.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Create an LRU cache.
+
+        :param maxsize: How many values the cache may hold. If 0, nothing is cached.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # Values are kept in order of use, from least to most recently used.
+        self._values: t.OrderedDict[Key, Value] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._values
+
+    def get(self, key: Key) -> t.Optional[Value]:
+        """Get a cached value and mark it as the most recently used.
+
+        :param key: The key of the value.
+        :return: The value, or None if it is not cached.
+        """
+        value = self._values.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._values.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Key, value: Value):
+        """Cache a value as the most recently used, evicting the least recently used if full.
+
+        :param key: The key of the value.
+        :param value: The value to cache. Must not be None.
+        """
+        if self.maxsize <= 0:
+            return
+        self._values[key] = value
+        self._values.move_to_end(key)
+        if len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+
+    def discard(self, key: Key):
+        """Remove a value from the cache, if it is cached.
+
+        :param key: The key of the value.
+        """
+        self._values.pop(key, None)
+
+    def clear(self):
+        """Remove every value from the cache. Hits and misses are still counted."""
+        self._values.clear()
+
+    def stats(self):
+        """Get how well the cache is doing.
+
+        :return: A dict with how many lookups were hits and misses, how many values are cached and
+            how many may be.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._values),
+            'maxsize': self.maxsize
+        }
@@ -1,13 +1,16 @@
 import typing as t
-from argparse import ArgumentParser
+from argparse import ArgumentParser, FileType
 from itertools import groupby
 from collections import defaultdict
 import logging
+import json
+import sys
 
 from pydantic import ValidationError
 
 from scheduler import Scheduler
 from event import Event
+from metrics import Metrics
 
 
 def print_schedule(schedule: Scheduler.Schedule):
@@ -31,6 +34,80 @@ def get_field_errors(error: ValidationError):
     return field_errors
 
 
+def is_reschedulable(error: ValidationError):
+    """Checks if an invalid event can be rescheduled, which it can if set on an invalid weekday or
+    time or in the past."""
+    field_errors = get_field_errors(error)
+    return Event.TimeDeltaTooLargeError not in field_errors['__root__'] and (
+        Event.InThePastError in field_errors['__root__']
+        or Event.InvalidWeekDayError in field_errors['start']
+        or Event.InvalidWeekDayError in field_errors['end']
+        or Event.InvalidTimeError in field_errors['start']
+        or Event.InvalidTimeError in field_errors['end']
+    )
+
+
+def stream_events(
+    scheduler: Scheduler,
+    event_strs: t.Iterable[str],
+    batch_size: int,
+    output: t.TextIO
+):
+    """Schedules events read one per line, in batches, and writes each scheduled event as soon as
+    its batch is scheduled. Only one batch of events is held at a time.
+
+    :param scheduler: The scheduler to schedule events with.
+    :param event_strs: The events in string format, one per line. Blank lines are skipped.
+    :param batch_size: The number of events to schedule at once.
+    :param output: Where to write the scheduled events.
+    """
+    batch: t.List[Event] = []
+
+    # Time parsing and validating each event if the scheduler observes metrics.
+    fields_from_str = Event.fields_from_str
+    create_event: t.Callable[..., Event] = scheduler.event_type
+    if scheduler.metrics is not None:
+        fields_from_str = scheduler.metrics.timed('parse', fields_from_str)
+        create_event = scheduler.metrics.timed('validate', create_event)
+
+    def schedule_batch():
+        try:
+            for event, rescheduled in zip(batch, scheduler.schedule_events(batch)):
+                print(('Rescheduled' if rescheduled else 'Scheduled') + ' Event:', event, file=output)
+        except Exception:
+            logging.exception(f'Could not schedule a batch of {len(batch)} events. Skipping it.')
+        finally:
+            # Some of a failed batch's events may be scheduled already, so never schedule them again.
+            batch.clear()
+        output.flush()
+
+    for event_str in event_strs:
+        event_str = event_str.strip()
+        if not event_str:
+            continue
+        try:
+            # Extract event fields from string.
+            event_fields = fields_from_str(event_str)
+            try:
+                # Create event using fields.
+                batch.append(create_event(**event_fields))
+                if len(batch) >= batch_size:
+                    schedule_batch()
+            except ValidationError as error:
+                logging.error(error)
+                if is_reschedulable(error):
+                    # Schedule events before this one so they are scheduled in order.
+                    schedule_batch()
+                    event = scheduler.reschedule_invalid_event(**event_fields)
+                    print('Rescheduled Event:', event, file=output)
+        except Event.Error as error:
+            logging.error(error)
+        except Exception:
+            logging.exception(f'Unknown error. Skipping this event: {event_str}')
+
+    schedule_batch()
+
+
 if __name__ == '__main__':
     logging.basicConfig(format='%(name)s: %(message)s')
 
@@ -44,6 +121,28 @@ if __name__ == '__main__':
             ' and <event_name>: Any valid character including spaces'
         )
     )
+    arg_parser.add_argument(
+        '--events-file',
+        type=FileType('r'),
+        help=(
+            'Schedule events read from a file, one per line in the same format as --input-events,'
+            ' without prompting. Use "-" to read from stdin.'
+        )
+    )
+    arg_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=1000,
+        help='The number of events read from --events-file to schedule at once.'
+    )
+    arg_parser.add_argument(
+        '--metrics',
+        action='store_true',
+        help=(
+            'Print how many times and for how long each stage of scheduling the events read from'
+            ' --events-file ran, as JSON to stderr.'
+        )
+    )
 
     known_args, unknown_args = arg_parser.parse_known_args()
     if known_args.input_events:
@@ -59,20 +158,13 @@ if __name__ == '__main__':
                 event_fields = Event.fields_from_str(event_str)
                 try:
                     # Create event using fields.
-                    event = Event(**event_fields)
+                    event = scheduler.event_type(**event_fields)
                     rescheduled = scheduler.schedule_event(event)
                     print(('Rescheduled' if rescheduled else 'Scheduled') + ' Event:', event)
                 except ValidationError as error:
                     logging.error(error)
-                    field_errors = get_field_errors(error)
                     # Reschedule event if set on invalid weekday or time.
-                    if Event.TimeDeltaTooLargeError not in field_errors['__root__'] and (
-                        Event.InThePastError in field_errors['__root__']
-                        or Event.InvalidWeekDayError in field_errors['start']
-                        or Event.InvalidWeekDayError in field_errors['end']
-                        or Event.InvalidTimeError in field_errors['start']
-                        or Event.InvalidTimeError in field_errors['end']
-                    ):
+                    if is_reschedulable(error):
                         # Reschedule event if datetimes are invalid.
                         event = scheduler.reschedule_invalid_event(**event_fields)
                         print('Rescheduled Event:', event)
@@ -85,3 +177,10 @@ if __name__ == '__main__':
                 break
 
         print_schedule(scheduler.schedule)
+
+    elif known_args.events_file:
+        scheduler = Scheduler(metrics=Metrics() if known_args.metrics else None)
+        with known_args.events_file as events_file:
+            stream_events(scheduler, events_file, known_args.batch_size, sys.stdout)
+        if scheduler.metrics is not None:
+            json.dump(scheduler.metrics.snapshot(), sys.stderr, indent=2)
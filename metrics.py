@@ -0,0 +1,112 @@
+import typing as t
+from functools import wraps
+from time import perf_counter_ns
+import threading
+
+
+class Metrics:
+    """Counts and sums observed values per metric, such as how long each stage of scheduling an
+    event took, and passes each observation on to an optional callback.
+
+    Stage timings are observed in nanoseconds. Other metrics, such as how many days were walked to
+    find an availability, are observed as counts. Values may be observed from many threads.
+    """
+
+    class Stat:
+        """How many values of a metric were observed, their total and the largest one."""
+
+        __slots__ = 'count', 'total', 'max'
+
+        def __init__(self) -> None:
+            self.count = 0
+            self.total = 0
+            self.max = 0
+
+    class Timer:
+        """Observes how long the block it is entered for takes, even if it raises."""
+
+        __slots__ = '_metrics', '_name', '_start'
+
+        def __init__(self, metrics: 'Metrics', name: str) -> None:
+            self._metrics = metrics
+            self._name = name
+
+        def __enter__(self):
+            self._start = perf_counter_ns()
+
+        def __exit__(self, *args):
+            self._metrics.observe(self._name, perf_counter_ns() - self._start)
+
+    def __init__(self, callback: t.Optional[t.Callable[[str, int], None]] = None) -> None:
+        """Create metrics.
+
+        :param callback: Called with the name of the metric and the value of each observation, for
+            example to export them to a tracing system.
+        """
+        self.callback = callback
+        self._stats: t.Dict[str, Metrics.Stat] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: int):
+        """Observe a value of a metric.
+
+        :param name: The name of the metric.
+        :param value: The observed value.
+        """
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = self._stats[name] = self.Stat()
+            stat.count += 1
+            stat.total += value
+            if value > stat.max:
+                stat.max = value
+        if self.callback is not None:
+            self.callback(name, value)
+
+    def timer(self, name: str):
+        """Get a context manager which observes how long the block it is entered for takes.
+
+        :param name: The name of the metric to observe the timing as.
+        :return: The timer.
+        """
+        return self.Timer(self, name)
+
+    def timed(self, name: str, function: t.Callable):
+        """Wrap a function so that how long each call takes is observed, even if it raises.
+
+        :param name: The name of the metric to observe the timings as.
+        :param function: The function to time.
+        :return: The wrapped function.
+        """
+        @wraps(function)
+        def timed_function(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.observe(name, perf_counter_ns() - start)
+        return timed_function
+
+    def snapshot(self):
+        """Get the metrics observed so far.
+
+        :return: A dict where the key is the name of a metric and the value is a dict with how many
+            values were observed, their total, mean and largest value.
+        """
+        with self._lock:
+            stats = list(self._stats.items())
+        return {
+            name: {
+                'count': stat.count,
+                'total': stat.total,
+                'mean': stat.total / stat.count,
+                'max': stat.max
+            }
+            for name, stat in stats
+        }
+
+    def reset(self):
+        """Forget the metrics observed so far."""
+        with self._lock:
+            self._stats.clear()
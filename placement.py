@@ -0,0 +1,124 @@
+import typing as t
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import itemgetter
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+
+from date_time_span import Span
+
+# Free slots by size is a list of the size and span of each of a date's free slots, ordered by size
+# and then by start.
+FreeSlotsBySize = t.List[t.Tuple[TimeDelta, Span]]
+
+
+class PlacementStrategy(ABC):
+    """Chooses which of a date's free slots an event is placed in, when it must be rescheduled."""
+
+    # Whether the strategy looks up free slots by size, so they must be kept in size order.
+    by_size = False
+
+    @abstractmethod
+    def place(
+        self,
+        free_slots: t.List[Span],
+        free_slots_by_size: t.Optional[FreeSlotsBySize],
+        start: DateTime,
+        timedelta: TimeDelta
+    ) -> t.Optional[DateTime]:
+        """Choose where an event starts among a date's free slots, no earlier than a given start.
+
+        :param free_slots: The date's free slots, in order.
+        :param free_slots_by_size: The date's free slots by size, if the strategy looks them up.
+        :param start: The earliest the event may start, which is on the date.
+        :param timedelta: The duration of the event.
+        :return: Where the event starts. If it fits in none of the free slots, None is returned.
+        """
+
+    @staticmethod
+    def _place_in_slot_at(free_slots: t.List[Span], start: DateTime, timedelta: TimeDelta):
+        """Get the size of the free slot which a start falls inside, from the start, if the event fits
+        in it. Free slots which start later are not affected by the start.
+        """
+        # Find the last free slot starting at or before the start.
+        i = bisect_right(free_slots, start, key=itemgetter(0)) - 1
+        if i >= 0 and free_slots[i].end - start >= timedelta:
+            return free_slots[i].end - start
+        return None
+
+
+class FirstFitPlacement(PlacementStrategy):
+    """Places an event in the earliest free slot it fits in. Finding the slot is O(n)."""
+
+    def place(self, free_slots, free_slots_by_size, start, timedelta):
+        # Skip availabilities which end before the start.
+        i = bisect_right(free_slots, start, key=itemgetter(1))
+        for availability_start, availability_end in islice(free_slots, i, None):
+            # If availability's duration is less than event's, get next availability.
+            if availability_end - availability_start < timedelta:
+                continue
+
+            # If availability's start is >= event's, set event's start to availability's.
+            if availability_start >= start:
+                return availability_start
+            # Else validate if event can fit inside availability from event's original start.
+            if availability_end - start >= timedelta:
+                return start
+        return None
+
+
+class BestFitPlacement(PlacementStrategy):
+    """Places an event in the smallest free slot it fits in, so that large free slots are kept for
+    long events. Ties go to the earliest free slot.
+
+    Finding the slot is one bisect by size, then a scan past the free slots which are large enough
+    but start before the start. Only the date searched from can have those, as later dates are
+    searched from midnight, so on later dates the scan stops at the first free slot and finding it
+    is O(log n) of the date's free slots. On the date searched from, it is O(n) at worst.
+    """
+
+    by_size = True
+
+    def place(self, free_slots, free_slots_by_size, start, timedelta):
+        size = self._place_in_slot_at(free_slots, start, timedelta)
+        best = None if size is None else (size, start)
+
+        # Find the smallest free slot the event fits in which starts after the start.
+        i = bisect_left(free_slots_by_size, (timedelta,))
+        for size, free_slot in islice(free_slots_by_size, i, None):
+            if best is not None and size >= best[0]:
+                break
+            if free_slot.start > start:
+                best = size, free_slot.start
+                break
+        return None if best is None else best[1]
+
+
+class WorstFitPlacement(PlacementStrategy):
+    """Places an event in the largest free slot, so that what is left of it is still large enough
+    for other events. Ties go to the earliest free slot.
+
+    Finding the slot scans down from the largest free slot past those which start before the start,
+    then bisects for the earliest free slot of its size. As with best fit, only the date searched
+    from can have free slots to scan past, so finding the slot is O(log n) of the date's free slots
+    on later dates and O(n) at worst on the date searched from.
+    """
+
+    by_size = True
+
+    def place(self, free_slots, free_slots_by_size, start, timedelta):
+        size = self._place_in_slot_at(free_slots, start, timedelta)
+        worst = None if size is None else (size, start)
+
+        # Find the largest free slot which starts after the start.
+        for size, free_slot in reversed(free_slots_by_size):
+            if size < timedelta or (worst is not None and size <= worst[0]):
+                break
+            if free_slot.start > start:
+                # Take the earliest free slot of that size which starts after the start.
+                i = bisect_right(free_slots_by_size, (size, Span(start, DateTime.max)))
+                worst = size, free_slots_by_size[i][1].start
+                break
+        return None if worst is None else worst[1]
+
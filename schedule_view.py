@@ -0,0 +1,90 @@
+import typing as t
+from datetime import date as Date
+from bisect import bisect_left, bisect_right
+
+from event import Event
+
+
+class EventsView(t.Sequence[Event]):
+    """A read-only view of a date's events. The events are shared, not copied, so they must not be
+    edited.
+    """
+
+    def __init__(self, events: t.Sequence[Event]) -> None:
+        self._events = events
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EventsView(self._events[index])
+        return self._events[index]
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self):
+        return iter(self._events)
+
+    def __eq__(self, events: object) -> bool:
+        if isinstance(events, EventsView):
+            events = events._events
+        if not isinstance(events, (list, tuple)):
+            return NotImplemented
+        return list(self._events) == list(events)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({list(self._events)!r})'
+
+
+class ScheduleView(t.Mapping[Date, EventsView]):
+    """A read-only view of a schedule, ordered by date. Only dates with events are included. The
+    schedule's events are shared, not copied, so they must not be edited.
+    """
+
+    def __init__(
+        self,
+        schedule: t.Mapping[Date, t.Sequence[Event]],
+        start: t.Optional[Date] = None,
+        end: t.Optional[Date] = None,
+        dates: t.Optional[t.Sequence[Date]] = None
+    ) -> None:
+        """Create a view of a schedule.
+
+        :param schedule: A dict where the key is a date and the value is a list of events in order.
+        :param start: The first date to include. If None, there is no first date.
+        :param end: The last date to include. If None, there is no last date.
+        :param dates: Each date in the schedule with events, in order. If given, only the dates
+            between start and end are looked at. If None, all dates are looked at and sorted.
+        """
+        self._schedule = schedule
+        self._start = start
+        self._end = end
+        self._dates = dates
+
+    def _includes(self, date: Date):
+        return (
+            (self._start is None or self._start <= date)
+            and (self._end is None or date <= self._end)
+            and bool(self._schedule.get(date))
+        )
+
+    def __getitem__(self, date: Date):
+        if not self._includes(date):
+            raise KeyError(date)
+        return EventsView(self._schedule[date])
+
+    def _get_dates(self):
+        """Get the included dates, in order."""
+        if self._dates is None:
+            return sorted(date for date in list(self._schedule) if self._includes(date))
+        first = 0 if self._start is None else bisect_left(self._dates, self._start)
+        last = len(self._dates) if self._end is None else bisect_right(self._dates, self._end)
+        return self._dates[first:last]
+
+    def __iter__(self):
+        return iter(self._get_dates())
+
+    def __len__(self) -> int:
+        return len(self._get_dates())
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self.items())!r})'
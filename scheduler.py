@@ -1,14 +1,30 @@
 import typing as t
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
+from itertools import groupby, islice
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter, attrgetter
+import heapq
+from contextlib import nullcontext
 from datetime import datetime as DateTime
 from datetime import timedelta as TimeDelta
 from datetime import date as Date
 from datetime import time as Time
 
 from event import Event
-from date_time_span import DateTimeSpan
+from date_time_span import DateTimeSpan, Span
+from event_index import EventIndex, BisectEventIndex
+from gap_index import GapIndex
+from lru_cache import LRUCache
+from placement import PlacementStrategy, FirstFitPlacement, FreeSlotsBySize
+from schedule_view import ScheduleView, EventsView
+from working_calendar import WorkingCalendar
+from clock import Clock, SystemClock, FrozenClock
+from metrics import Metrics
 import utilities as utils
 
+# Timer of stages when no metrics are observed, which does nothing.
+_NO_TIMER = nullcontext()
+
 
 class Scheduler:
     """This will schedule events based on availability."""
@@ -16,12 +32,235 @@ class Scheduler:
     Schedule = t.OrderedDict[Date, t.List[Event]]
 
     class Availability(DateTimeSpan):
-        """A span representing an availability in the schedule."""
-        pass
+        """A span representing an availability in the schedule. Availabilities cannot be edited, so
+        cached availabilities can be handed to every caller.
+        """
+
+        class Config:
+            allow_mutation = False
+
+    # autopep8: off
+    class RescheduleRetriesExceededError(RuntimeError): pass
+    # autopep8: on
+
+    class _DateEvents(t.List[Event]):
+        """A date's list of events which notifies its schedule when it is edited in place, so that
+        any state derived from it can be dropped. The scheduler inserts events with list.insert
+        instead, as it updates the derived state itself.
+        """
+
+        __slots__ = '_schedule', '_date'
+
+        def __init__(
+            self,
+            events: t.Iterable[Event],
+            schedule: 'Scheduler._EventsByDate',
+            date: Date
+        ) -> None:
+            super().__init__(events)
+            self._schedule = schedule
+            self._date = date
+
+        def __reduce__(self):
+            # Copies and pickles are plain lists, which notify nothing.
+            return list, (list(self),)
+
+    # Wrap each method which edits a list in place so that it notifies the schedule.
+    for name in [
+        'append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+        '__setitem__', '__delitem__', '__iadd__', '__imul__'
+    ]:
+        def notifying_method(self, *args, _method=getattr(list, name), **kwargs):
+            result = _method(self, *args, **kwargs)
+            self._schedule.on_change(self._date)
+            return result
+        setattr(_DateEvents, name, notifying_method)
+    del name, notifying_method
+
+    class _EventsByDate(t.Dict[Date, t.List[Event]]):
+        """Events per date which notifies when a date's list of events is replaced, removed or
+        edited in place, so that any state derived from it can be dropped. Like a defaultdict, a
+        missing date is given an empty list of events. Lists of events are copied when set.
+        """
+
+        on_change: t.Callable[[Date], None] = staticmethod(lambda date: None)
+
+        def _replace(self, date: Date, events: t.Iterable[Event]):
+            """Set a date's events without notifying, for when the derived state is updated by the
+            caller.
+            """
+            date_events = Scheduler._DateEvents(events, self, date)
+            super().__setitem__(date, date_events)
+            return date_events
+
+        def __missing__(self, date: Date):
+            return self._replace(date, [])
+
+        def __setitem__(self, date: Date, events: t.Iterable[Event]):
+            self._replace(date, events)
+            self.on_change(date)
+
+        def __delitem__(self, date: Date):
+            super().__delitem__(date)
+            self.on_change(date)
 
-    def __init__(self) -> None:
+        def __ior__(self, events_by_date: t.Mapping[Date, t.Iterable[Event]]):
+            self.update(events_by_date)
+            return self
+
+        def pop(self, date: Date, *args):
+            events = super().pop(date, *args)
+            self.on_change(date)
+            return events
+
+        def popitem(self):
+            date, events = super().popitem()
+            self.on_change(date)
+            return date, events
+
+        def setdefault(self, date: Date, events: t.Iterable[Event] = ()):
+            if date not in self:
+                self[date] = events
+            return self[date]
+
+        def update(self, *args, **kwargs):
+            for date, events in dict(*args, **kwargs).items():
+                self[date] = events
+
+        def clear(self):
+            dates = list(self)
+            super().clear()
+            for date in dates:
+                self.on_change(date)
+
+    def __init__(
+        self,
+        event_index: t.Optional[EventIndex] = None,
+        calendar: t.Optional[WorkingCalendar] = None,
+        clock: t.Optional[Clock] = None,
+        metrics: t.Optional[Metrics] = None,
+        availability_cache_size: int = 1024,
+        placement: t.Optional[PlacementStrategy] = None
+    ) -> None:
+        """Create a scheduler.
+
+        :param event_index: Finds where events belong in a date's events. Defaults to binary search.
+        :param calendar: The weekdays and times of day events are scheduled in. Defaults to the
+            calendar events are validated against.
+        :param clock: Where the current datetime is read from. Defaults to the system's clock.
+        :param metrics: Where to observe how long each stage of scheduling takes. Defaults to none,
+            in which case nothing is observed.
+        :param availability_cache_size: How many dates' availabilities are kept once looked up. If
+            0, availabilities are not cached.
+        :param placement: Chooses which free slot of a date the next availability is in. Defaults
+            to the earliest free slot that fits.
+        """
+        self.event_index = event_index or BisectEventIndex()
+        self.calendar = calendar or Event._calendar
+        self.clock = clock or SystemClock()
+        self.placement = placement or FirstFitPlacement()
+        # Events created by the scheduler are validated against its calendar.
+        self.event_type = Event.with_calendar(self.calendar)
+        # How many times an availability was taken before a rescheduled event could be inserted.
+        self.reschedule_retries = 0
+        # How many taken availabilities rescheduling one event may run into before giving up.
+        self.max_reschedule_retries = 100
         # Schedule is a dict where the key is a date and the value is a list of events in order.
-        self._schedule: t.DefaultDict[Date, t.List[Event]] = defaultdict(list)
+        self._schedule: t.Dict[Date, t.List[Event]] = self._EventsByDate()
+        self._schedule.on_change = self._on_schedule_change
+        # Free slots is a dict where the key is a date and the value is the lightweight span of each
+        # availability in order. They are derived from the schedule when a date is first looked up
+        # and then split as events are inserted.
+        self._free_slots: t.Dict[Date, t.List[Span]] = {}
+        # Free slots by size holds each date's free slots ordered by size, for placements which look
+        # them up by size, along with the list of free slots they were ordered from.
+        self._free_slots_by_size: t.Dict[Date, t.Tuple[t.List[Span], FreeSlotsBySize]] = {}
+        # Dates is a list of each date with events, in order.
+        self._dates: t.List[Date] = []
+        # Gap index holds the largest free slot of each date whose free slots are known.
+        self._gap_index = GapIndex(self.calendar.valid_weekdays, self.calendar.max_timedelta)
+        # Availability cache holds the availabilities of the dates looked up most recently.
+        self.availability_cache: LRUCache[Date, t.List[Scheduler.Availability]] = LRUCache(
+            availability_cache_size
+        )
+        self.metrics = metrics
+
+    def _timer(self, name: str):
+        """Get a context manager which observes how long a stage of scheduling takes, if this
+        scheduler observes metrics. Otherwise, it does nothing.
+
+        The metrics observed are:
+            schedule_event: How long scheduling an event took, in nanoseconds.
+            schedule_events: How long scheduling a batch of events took.
+            overlap_scan: How long checking if an event overlaps and inserting it took.
+            availability: How long computing a date's free slots took.
+            next_availability: How long searching for the next availability took.
+            days_walked: How many dates' free slots were looked at to find the next availability.
+                Dates the gap index skips are not looked at.
+            reschedule_depth: How many availabilities were tried before an overlapping event was
+                inserted.
+
+        :param name: The name of the stage.
+        :return: The context manager to run the stage in.
+        """
+        return _NO_TIMER if self.metrics is None else self.metrics.timer(name)
+
+    def _on_schedule_change(self, date: Date):
+        """Drop the state derived from a date's events after they were replaced or removed.
+
+        :param date: The date whose events changed.
+        """
+        self._discard_free_slots(date)
+        self._update_dates(date)
+
+    def _discard_free_slots(self, date: Date):
+        """Drop a date's free slots and everything derived from them, so that they are computed
+        from its events when next looked up.
+
+        :param date: The date whose free slots to drop.
+        """
+        self._free_slots.pop(date, None)
+        self._free_slots_by_size.pop(date, None)
+        self._gap_index.discard(date)
+        self.availability_cache.discard(date)
+
+    def _discard_stale_free_slots(self, event: Event):
+        """Drop a date's free slots if they still hold the span an event could not be inserted at,
+        as they no longer match the date's events. Otherwise, the span was taken since it was found
+        and the free slots were already updated.
+
+        :param event: The event which could not be inserted.
+        """
+        date = event.start.date()
+        free_slots = self._free_slots.get(date)
+        if free_slots is None:
+            return
+        i = bisect_right(free_slots, event.start, key=itemgetter(0)) - 1
+        if i >= 0 and event.end <= free_slots[i].end:
+            self._discard_free_slots(date)
+
+    def _update_dates(self, date: Date):
+        """Add a date to or remove a date from the ordered dates, depending on if it has events.
+
+        :param date: The date whose events changed.
+        """
+        i = bisect_left(self._dates, date)
+        indexed = i < len(self._dates) and self._dates[i] == date
+        if self._schedule.get(date):
+            if not indexed:
+                self._dates.insert(i, date)
+        elif indexed:
+            self._dates.pop(i)
+
+    def _on_event_inserted(self, event: Event):
+        """Update the state derived from a date's events after an event was inserted.
+
+        :param event: The event that was inserted into the schedule.
+        """
+        self._split_free_slot(event)
+        self.availability_cache.discard(event.start.date())
+        if len(self._schedule[event.start.date()]) == 1:
+            insort(self._dates, event.start.date())
 
     @property
     def schedule(self) -> Schedule:
@@ -36,107 +275,423 @@ class Scheduler:
             for date in ordered_dates
         ])
 
+    @property
+    def schedule_view(self):
+        """Create a read-only view of the schedule which shares its events instead of copying them.
+        The view stays up to date as events are scheduled.
+
+        :return: A read-only view of the schedule ordered by date.
+        """
+        return ScheduleView(self._schedule, dates=self._dates)
+
+    def snapshot(self):
+        """Create a read-only view of the schedule as it is now. Only the lists of events are
+        copied, not the events themselves.
+
+        :return: A read-only view of the current schedule ordered by date.
+        """
+        return ScheduleView({
+            date: tuple(events)
+            for date, events in list(self._schedule.items())
+            if events
+        })
+
+    def schedule_between(self, start: Date, end: Date):
+        """Create a read-only view of the schedule between two dates, inclusive. The view shares the
+        schedule's events and stays up to date as events are scheduled.
+
+        :param start: The first date to include.
+        :param end: The last date to include.
+        :return: A read-only view of the schedule between the dates ordered by date.
+        """
+        return ScheduleView(self._schedule, start, end, dates=self._dates)
+
+    def iter_schedule(self) -> t.Iterator[t.Tuple[Date, EventsView]]:
+        """Lazily iterate over the schedule without copying it.
+
+        :return: An iterator of each date and a read-only view of its events, ordered by date.
+        """
+        return iter(self.schedule_view.items())
+
+    def events_between(self, start: DateTime, end: DateTime) -> t.Iterator[Event]:
+        """Lazily get the events which overlap with a datetime span. Only the dates with events in
+        the span are looked at. The events are shared, not copied, so they must not be edited.
+
+        :param start: The start of the span.
+        :param end: The end of the span.
+        :return: An iterator of the events in the span, in order.
+        """
+        dates = self._dates
+        first_date = bisect_left(dates, start.date())
+        last_date = bisect_right(dates, end.date())
+        for date in islice(dates, first_date, last_date):
+            events = self._schedule[date]
+            # Skip events which end before the start.
+            i = bisect_right(events, start, key=attrgetter('end'))
+            for event in islice(events, i, None):
+                if event.start >= end:
+                    break
+                yield event
+
+    def availabilities_between(self, start: DateTime, end: DateTime) -> t.Iterator[Availability]:
+        """Lazily get the availabilities within a datetime span, cut to fit inside it. Only dates on
+        a valid weekday are looked at. Dates without events are not added to the schedule.
+
+        :param start: The start of the span.
+        :param end: The end of the span.
+        :return: An iterator of the availabilities in the span, in order.
+        """
+        date = start.date()
+        while date <= end.date():
+            if self.calendar.is_valid_weekday(date):
+                for free_slot in self._read_free_slots(date):
+                    availability_start = max(free_slot.start, start)
+                    availability_end = min(free_slot.end, end)
+                    if availability_start < availability_end:
+                        yield self.Availability.construct(
+                            start=availability_start,
+                            end=availability_end
+                        )
+            date += TimeDelta(days=1)
+
     def get_availabilities(self, date: Date):
-        """Get all the unused datetime spans for a given date.
+        """Get all the unused datetime spans for a given date. The availabilities of the dates
+        looked up most recently are cached until an event is inserted into them. Only the list they
+        are returned in is copied, as availabilities cannot be edited.
 
         :param date: The date to get availabilities for.
         :return: The availabilities for that date.
         """
-        availabilities: t.List[Scheduler.Availability] = []
-        start_of_day = DateTime.combine(date, Event._start_of_day)
-        end_of_day = DateTime.combine(date, Event._end_of_day)
+        availabilities = self.availability_cache.get(date)
+        if availabilities is None:
+            # Free slots are valid by construction, so they need not be validated.
+            availabilities = [
+                self.Availability.construct(start=start, end=end)
+                for start, end in self._get_free_slots(date)
+            ]
+            self.availability_cache.put(date, availabilities)
+        return list(availabilities)
 
-        events = self._schedule[date]
-        if events:
-            cursor = start_of_day
-            spans = DateTimeSpan.merge_many(events)[date]
-            for span, next_span in zip(spans, spans[1:] + [None]):
-                # Cursor is at start of span.
-                if cursor == span.start:
-                    cursor = span.end
-                    if next_span is not None:
-                        availabilities.append(self.Availability(start=cursor, end=next_span.start))
-                        cursor = next_span.end
-                    elif cursor != end_of_day:
-                        availabilities.append(self.Availability(start=cursor, end=end_of_day))
+    def _get_free_slots(self, date: Date):
+        """Get the start and end of each availability for a given date. They are computed the first
+        time a date with events is looked up and kept up to date as events are inserted. The free
+        slots of dates without events are not kept, so only as many are kept as dates have events.
+
+        :param date: The date to get free slots for.
+        :return: The start and end of each availability for that date, in order.
+        """
+        free_slots = self._free_slots.get(date)
+        if free_slots is None:
+            free_slots = self._compute_free_slots(date)
+            # A date without events is free all day, as the gap index assumes of unknown dates.
+            if self._schedule.get(date):
+                self._free_slots[date] = free_slots
+                self._gap_index.update(date, self._get_largest_free_slot(free_slots))
+        return free_slots
+
+    def _read_free_slots(self, date: Date):
+        """Get the start and end of each availability for a given date, for reads which never
+        wait. See _get_free_slots.
+
+        :param date: The date to get free slots for.
+        :return: The start and end of each availability for that date, in order.
+        """
+        return self._get_free_slots(date)
+
+    def _get_free_slots_by_size(self, date: Date, free_slots: t.List[Span]):
+        """Get a date's free slots ordered by size. They are ordered the first time a date's free
+        slots are looked up by size and kept up to date as free slots are split.
+
+        :param date: The date to get free slots by size for.
+        :param free_slots: The date's free slots.
+        :return: The size and span of each of the date's free slots, ordered by size and start.
+        """
+        ordered_free_slots = self._free_slots_by_size.get(date)
+        # Free slots are replaced instead of edited, so the same list means they are up to date.
+        if ordered_free_slots is None or ordered_free_slots[0] is not free_slots:
+            ordered_free_slots = free_slots, sorted(
+                (free_slot.timedelta, free_slot) for free_slot in free_slots
+            )
+            # Only keep free slots by size for as long as the free slots are kept.
+            if self._free_slots.get(date) is free_slots:
+                self._free_slots_by_size[date] = ordered_free_slots
+        return ordered_free_slots[1]
+
+    @staticmethod
+    def _get_largest_free_slot(free_slots: t.List[Span]):
+        return max((free_slot.timedelta for free_slot in free_slots), default=TimeDelta())
+
+    def _compute_free_slots(self, date: Date):
+        """Compute the start and end of each availability for a given date from its events.
+
+        :param date: The date to compute free slots for.
+        :return: The start and end of each availability for that date, in order.
+        """
+        with self._timer('availability'):
+            free_slots: t.List[Span] = []
+            start_of_day = self.calendar.start_of(date)
+            end_of_day = self.calendar.end_of(date)
 
+            # Events are kept in order, so their spans can be merged without sorting.
+            cursor = start_of_day
+            for span_start, span_end in DateTimeSpan.merge_sorted(self._schedule.get(date, [])):
                 # Cursor is behind span.
-                elif cursor < span.start:
-                    availabilities.append(self.Availability(start=cursor, end=span.start))
-                    cursor = span.end
-                    if next_span is None and cursor != end_of_day:
-                        availabilities.append(self.Availability(start=cursor, end=end_of_day))
+                if cursor < span_start:
+                    free_slots.append(Span(cursor, span_start))
+                if cursor < span_end:
+                    cursor = span_end
+            if cursor < end_of_day:
+                free_slots.append(Span(cursor, end_of_day))
+
+            return free_slots
+
+    def _split_free_slot(self, event: Event):
+        """Split the free slot an event was inserted into, if free slots are kept for its date.
+
+        :param event: The event that was inserted into the schedule.
+        """
+        date = event.start.date()
+        free_slots = self._free_slots.get(date)
+        if free_slots is None:
+            return
+
+        # Find the last free slot starting at or before the event.
+        i = bisect_right(free_slots, event.start, key=itemgetter(0)) - 1
+        if i >= 0 and event.end <= free_slots[i][1]:
+            split_free_slot = free_slots[i]
+            start, end = split_free_slot
+            new_free_slots = [
+                free_slot
+                for free_slot in [Span(start, event.start), Span(event.end, end)]
+                if free_slot.start < free_slot.end
+            ]
+            # Replace the date's free slots instead of editing them, so they never change while read.
+            self._free_slots[date] = free_slots[:i] + new_free_slots + free_slots[i + 1:]
+            self._gap_index.update(date, self._get_largest_free_slot(self._free_slots[date]))
+
+            # Reorder the date's free slots by size, if they are kept up to date. They are copied
+            # once and edited, as they are also replaced instead of edited. The copy is O(n) of the
+            # date's free slots, the same as replacing the free slots.
+            ordered_free_slots = self._free_slots_by_size.get(date)
+            if ordered_free_slots is not None and ordered_free_slots[0] is free_slots:
+                free_slots_by_size = ordered_free_slots[1].copy()
+                del free_slots_by_size[
+                    bisect_left(free_slots_by_size, (split_free_slot.timedelta, split_free_slot))
+                ]
+                for free_slot in new_free_slots:
+                    insort(free_slots_by_size, (free_slot.timedelta, free_slot))
+                self._free_slots_by_size[date] = self._free_slots[date], free_slots_by_size
         else:
-            availabilities.append(self.Availability(start=start_of_day, end=end_of_day))
+            # The event was not inside a free slot. Recompute the date's free slots when next needed.
+            self._free_slots.pop(date)
+            self._free_slots_by_size.pop(date, None)
+            self._gap_index.discard(date)
+
+    def get_fragmentation(self, start: Date, end: Date):
+        """Measure how fragmented the free time between two dates is, inclusive, as the share of it
+        outside each date's largest free slot. Events cannot span dates, so a date's free time is
+        never counted together with another's. Only dates on a valid weekday are looked at.
+
+        :param start: The first date to include.
+        :param end: The last date to include.
+        :return: 0 if each date's free time is in one free slot, up to nearly 1 if it is scattered
+            in many small free slots. If there is no free time, 0 is returned.
+        """
+        largest = total = TimeDelta()
+        date = start
+        while date <= end:
+            if self.calendar.is_valid_weekday(date):
+                free_slots = self._read_free_slots(date)
+                largest += self._get_largest_free_slot(free_slots)
+                total += sum((free_slot.timedelta for free_slot in free_slots), TimeDelta())
+            date += TimeDelta(days=1)
+        return 1 - largest / total if total else 0.0
+
+    def index_dates(self):
+        """Compute and keep the free slots of every date with events, so that the gap index knows
+        each date's largest free slot. Otherwise, each date is only indexed the first time it is
+        looked up, such as by a search. Call this after bulk loading events, so that the first
+        search skips booked dates instead of computing their free slots one by one.
+        """
+        for date in list(self._dates):
+            self._get_free_slots(date)
+
+    def get_next_available_date(self, date: Date, timedelta: TimeDelta):
+        """Get the first date, from a given date, with an availability at least as long as a given
+        duration. Dates which are indexed as too booked are skipped without being looked at one by
+        one. Dates are indexed the first time they are looked up, so the first search over a range
+        of dates which were not indexed yet still computes the free slots of each booked date in
+        turn, which is O(n) of the events in the range. See index_dates.
+
+        :param date: The first date to search from.
+        :param timedelta: The duration that must fit in an availability.
+        :return: The first date with a long enough availability. If the duration is longer than any
+            availability can be, None is returned.
+        """
+        return self._walk_to_next_available_date(date, timedelta)[0]
+
+    def _walk_to_next_available_date(self, date: Date, timedelta: TimeDelta):
+        """Get the first date, from a given date, with an availability at least as long as a given
+        duration. See get_next_available_date.
+
+        :param date: The first date to search from.
+        :param timedelta: The duration that must fit in an availability.
+        :return: The first date with a long enough availability, or None, and how many dates were
+            looked at and passed over before it.
+        """
+        days_walked = 0
+        while True:
+            date = self._gap_index.find(date, timedelta)
+            # Looking up a date's free slots makes its largest free slot known to the gap index.
+            if date is None or self._get_largest_free_slot(self._get_free_slots(date)) >= timedelta:
+                return date, days_walked
+            days_walked += 1
+            date += TimeDelta(days=1)
 
-        return availabilities
+    def _get_earliest_start(self, start: DateTime):
+        """Get when an event may start at the earliest, from its original start. Starts in the past
+        are moved to now, rounded up to the next whole minute.
+
+        :param start: The original start of the event.
+        :return: The later of the start and now.
+        """
+        now = self.clock.now()
+        if start < now:
+            return utils.round_up_datetime(now, TimeDelta(minutes=1))
+        return start
 
     def get_next_availability(self, start: DateTime, timedelta: TimeDelta):
         """Get the next availability for an event based on its original start and duration. A
-        valid availability is one that's in the future and on an allowed week day. 
+        valid availability is one that's in the future and on an allowed week day. It is on the
+        first date with a long enough availability, in the free slot chosen by the placement.
 
         :param start: The original start of the event.
         :param timedelta: The duration of the event.
         :return: When the event can next start and end.
         """
 
-        def set_start_to_next_valid_date():
-            nonlocal start
-            date = start.date() + TimeDelta(days=1)
-            while date.weekday() not in Event._valid_weekdays:
-                date += TimeDelta(days=1)
+        # Days walked counts each date whose free slots were looked at.
+        days_walked = 0
+
+        def set_start_to_next_available_date():
+            nonlocal start, days_walked
+            date, days_passed = self._walk_to_next_available_date(
+                start.date() + TimeDelta(days=1),
+                timedelta
+            )
+            days_walked += days_passed
+            if date is None:
+                raise ValueError('The duration is longer than any availability can be')
             start = DateTime.combine(date, Time())
 
-        def refresh_start():
-            nonlocal start
-            min_start = DateTime.now()
-            # Start must at least be now.
-            if start < min_start:
-                start = utils.round_up_datetime(min_start, TimeDelta(minutes=1))
-            # Start must be on a valid weekday.
-            if start.date().weekday() not in Event._valid_weekdays:
-                set_start_to_next_valid_date()
-
-        # Ensure start is at least now and on a valid weekday.
-        refresh_start()
-        while True:
-            # Get availabilities for start date.
-            date = start.date()
-            for availability in self.get_availabilities(date):
-                # If availability's duration is less than event's, get next availability.
-                if availability.timedelta < timedelta:
-                    continue
-
-                # Refresh start after elapsed processing time.
-                # If date has incremented, get availabilities for the next date.
-                refresh_start()
-                if start.date() != date:
-                    break
+        with self._timer('next_availability'):
+            try:
+                # Ensure start is at least now and on a valid weekday. Now is only read once per
+                # search.
+                start = self._get_earliest_start(start)
+                if not self.calendar.is_valid_weekday(start):
+                    set_start_to_next_available_date()
+
+                placement = self.placement
+                while True:
+                    # Get availabilities for start date.
+                    date = start.date()
+                    free_slots = self._get_free_slots(date)
+                    free_slots_by_size = (
+                        self._get_free_slots_by_size(date, free_slots) if placement.by_size else None
+                    )
+                    days_walked += 1
+
+                    # Place event in one of the availabilities, if any are long enough.
+                    placed_start = placement.place(free_slots, free_slots_by_size, start, timedelta)
+                    if placed_start is not None:
+                        # Return new start and end.
+                        return placed_start, placed_start + timedelta
+
+                    # At this point, no suitable availabilities were found.
+                    # Get availabilities for next date that may have a long enough availability.
+                    set_start_to_next_available_date()
+            finally:
+                if self.metrics is not None:
+                    self.metrics.observe('days_walked', days_walked)
+
+    def _insert_event(self, event: Event):
+        """Inserts an event into the schedule at its datetime span, if that span is free. Finding the
+        span and inserting the event happen together, so the span cannot be taken in between.
+
+        :param event: The event to insert.
+        :return: A flag denoting if the event was inserted.
+        """
+        with self._timer('overlap_scan'):
+            # Get all events for given date.
+            events = self._schedule[event.start.date()]
+
+            # If event overlaps with an existing event, it cannot be inserted.
+            i = self.event_index.find_position(events, event)
+            if i is None:
+                return False
+
+            # Else insert event in order. The derived state is updated below, so the list's change
+            # notification is skipped.
+            list.insert(events, i, event)
+            self._on_event_inserted(event)
+            return True
+
+    def insert_event(self, event: Event) -> bool:
+        """Inserts an event into the schedule at its datetime span, if that span is free, without
+        rescheduling it otherwise. For schedulers built on this one which decide themselves when
+        events are inserted, such as the async scheduler. See reschedule_attempts.
 
-                # If availability's start is >= event's, set event's start to availability's.
-                if availability.start >= start:
-                    start = availability.start
-                # Else validate if event can fit inside availability from event's original start.
-                elif (availability.end - start) < timedelta:
-                    continue
+        :param event: The event to insert.
+        :return: A flag denoting if the event was inserted.
+        """
+        return self._insert_event(event)
+
+    def reschedule_attempts(self, event: Event) -> t.Iterator[Event]:
+        """Moves an overlapping event to each availability it should be tried at, in turn. After
+        each, the caller tries to insert the event and stops iterating once it was inserted. If it
+        was not, the availability was taken, so the next one is searched for from it.
+
+        :param event: The overlapping event to reschedule.
+        :raises self.RescheduleRetriesExceededError: If more than max_reschedule_retries of the
+            availabilities found were taken.
+        :return: An iterator which yields the event each time it was moved.
+        """
+        for retries in range(self.max_reschedule_retries + 1):
+            if retries:
+                # If the availability was taken, make sure it is not found again, then search again
+                # from it instead of recursing.
+                self._discard_stale_free_slots(event)
+                self._count_reschedule_retry()
 
-                # Return new start and end.
-                return start, start + timedelta
+            # Set event's datetime span to next availability.
+            start, end = self.get_next_availability(event.start, event.timedelta)
+            event.start, event.end = start, end
+            yield event
+        raise self.RescheduleRetriesExceededError(
+            f'Could not insert the event at any of {self.max_reschedule_retries + 1} availabilities'
+        )
 
-            # At this point, no suitable availabilities were found.
-            # If date did not increment during processing, get availabilities for next valid date.
-            if start.date() == date:
-                set_start_to_next_valid_date()
+    def _count_reschedule_retry(self):
+        self.reschedule_retries += 1
 
     def reschedule_overlapping_event(self, event: Event):
         """Edits an overlapping event's start and end to the next availability and adds it to the schedule.
 
         :param event: The overlapping event to reschedule.
+        :raises self.RescheduleRetriesExceededError: If more than max_reschedule_retries of the
+            availabilities found were taken.
         """
-        # Set event's datetime span to next availability.
-        start, end = self.get_next_availability(event.start, event.timedelta)
-        event.start, event.end = start, end
-        self.schedule_event(event)
+        # Reschedule depth counts each availability tried.
+        reschedule_depth = 0
+        try:
+            for event in self.reschedule_attempts(event):
+                reschedule_depth += 1
+                if self._insert_event(event):
+                    return
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe('reschedule_depth', reschedule_depth)
 
     def reschedule_invalid_event(
         self,
@@ -154,7 +709,7 @@ class Scheduler:
         """
         # Create event at next availability.
         start, end = self.get_next_availability(start, timedelta=end - start)
-        event = Event(start=start, end=end, name=name, created_at=created_at)
+        event = self.event_type(start=start, end=end, name=name, created_at=created_at)
         self.schedule_event(event)
         return event
 
@@ -165,19 +720,83 @@ class Scheduler:
         :param event: The event to schedule.
         :return: A flag denoting if the event was overlapping and rescheduled.
         """
-        # Get all events for given date.
-        events = self._schedule[event.start.date()]
-
-        for i, current_event in enumerate(events):
-            # If event overlaps with current event, reschedule it.
-            if event.overlaps_with(current_event, equals=False):
-                self.reschedule_overlapping_event(event)
-                return True
-            # If event ends before current event starts, insert it before current event.
-            if event.end <= current_event.start:
-                events.insert(i, event)
+        with self._timer('schedule_event'):
+            if self._insert_event(event):
                 return False
 
-        # If event starts after current event ends and no next event, append event to end.
-        events.append(event)
-        return False
+            # If event overlaps with an existing event, reschedule it.
+            self.reschedule_overlapping_event(event)
+            return True
+
+    def schedule_events(self, events: t.Iterable[Event]):
+        """Schedules many events at once. The outcome is the same as scheduling each event in turn
+        with schedule_event. The events are sorted once and grouped by date. The events of each date
+        before the first date where any of them overlap with each other or the schedule are merged
+        into the schedule in a single pass. The events of that date and every later date are
+        scheduled one by one in the order given, as overlapping events may be rescheduled to any
+        later date. So a batch is only as fast as the one by one path from its first date with
+        overlaps onwards.
+
+        :param events: The events to schedule, in the order they were requested.
+        :return: A flag per event denoting if it was overlapping and rescheduled.
+        """
+        with self._timer('schedule_events'):
+            # Read the clock once for the whole batch.
+            clock = self.clock
+            self.clock = FrozenClock(clock.now())
+            try:
+                return self._schedule_events(list(events))
+            finally:
+                self.clock = clock
+
+    def _schedule_events(self, events: t.List[Event]):
+        """Schedules many events at once. See schedule_events.
+
+        :param events: The events to schedule, in the order they were requested.
+        :return: A flag per event denoting if it was overlapping and rescheduled.
+        """
+        # Sort events once and group them by date.
+        def key(event: Event):
+            return event.start, event.end
+        grouped_events = {
+            date: list(events_for_date)
+            for date, events_for_date in groupby(
+                sorted(events, key=key),
+                key=lambda event: event.start.date()
+            )
+        }
+
+        # Merge each date's events with the events already scheduled for that date.
+        merged_events = {
+            date: list(heapq.merge(self._schedule.get(date, []), new_events, key=key))
+            for date, new_events in grouped_events.items()
+        }
+
+        # Find the first date with overlapping events. Dates are grouped in order.
+        first_overlapping_date = next(
+            (
+                date
+                for date, events_for_date in merged_events.items()
+                if any(
+                    event.end > next_event.start
+                    for event, next_event in zip(events_for_date, events_for_date[1:])
+                )
+            ),
+            None
+        )
+
+        # Overlapping events are only ever rescheduled to later spans, so dates before the first date
+        # with overlaps are never reached by them. Their events are merged in a single pass, as the
+        # order they are scheduled in does not matter.
+        for date, events_for_date in merged_events.items():
+            if first_overlapping_date is not None and date >= first_overlapping_date:
+                break
+            self._schedule[date] = events_for_date
+        if first_overlapping_date is None:
+            return [False] * len(events)
+
+        # Schedule the events of the first date with overlaps and every later date in the order given.
+        return [
+            False if event.start.date() < first_overlapping_date else self.schedule_event(event)
+            for event in events
+        ]
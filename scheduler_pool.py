@@ -0,0 +1,343 @@
+import typing as t
+from functools import reduce
+from concurrent.futures import ProcessPoolExecutor
+import os
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+from datetime import time as Time
+
+from event import Event
+from date_time_span import DateTimeSpan, Span
+from event_index import EventIndex, BisectEventIndex
+from placement import PlacementStrategy, FirstFitPlacement
+from working_calendar import WorkingCalendar
+from clock import Clock, SystemClock, FrozenClock
+from metrics import Metrics
+from scheduler import Scheduler
+
+
+def _schedule_resource_events(
+    event_index: EventIndex,
+    calendar: WorkingCalendar,
+    placement: PlacementStrategy,
+    now: DateTime,
+    scheduled_spans: t.List[Span],
+    spans: t.List[Span]
+):
+    """Schedules a resource's events in a worker process. Only the events' spans are sent between
+    processes, as they are all that is needed to place them.
+
+    :param event_index: Finds where events belong in a date's events.
+    :param calendar: The weekdays and times of day events are scheduled in.
+    :param placement: Chooses which free slot of a date the next availability is in.
+    :param now: The current datetime, read once for all resources.
+    :param scheduled_spans: The spans of the resource's scheduled events, ordered by start.
+    :param spans: The spans of the events to schedule, in the order they were requested.
+    :return: The new span of each event, a flag per event denoting if it was rescheduled and how
+        many times an availability was taken before an event could be inserted.
+    """
+    scheduler = Scheduler(
+        event_index, calendar, FrozenClock(now), availability_cache_size=0, placement=placement
+    )
+    # Scheduled events do not overlap, so they are merged into the schedule in a single pass.
+    scheduler.schedule_events([
+        Event.from_trusted(start, end, name='', created_at=now) for start, end in scheduled_spans
+    ])
+    events = [Event.from_trusted(start, end, name='', created_at=now) for start, end in spans]
+    rescheduled = scheduler.schedule_events(events)
+    return [Span(event.start, event.end) for event in events], rescheduled, scheduler.reschedule_retries
+
+
+class SchedulerPool:
+    """Schedules events for many resources, such as rooms and people, which share a working calendar
+    and clock. Each resource is scheduled independently of the others.
+
+    Each resource is scheduled by a scheduler of its own, so its free slots, gap index, placement
+    and retry cap are the scheduler's. A resource's scheduler is only created once an event is
+    scheduled for it, so resources without events take up no space. All schedulers share the pool's
+    event index, calendar, clock, placement and metrics, and do not cache availabilities.
+    """
+
+    def __init__(
+        self,
+        event_index: t.Optional[EventIndex] = None,
+        calendar: t.Optional[WorkingCalendar] = None,
+        clock: t.Optional[Clock] = None,
+        metrics: t.Optional[Metrics] = None,
+        placement: t.Optional[PlacementStrategy] = None
+    ) -> None:
+        """Create a scheduler pool.
+
+        :param event_index: Finds where events belong in a date's events. Defaults to binary search.
+        :param calendar: The weekdays and times of day events are scheduled in. Defaults to the
+            calendar events are validated against.
+        :param clock: Where the current datetime is read from. Defaults to the system's clock.
+        :param metrics: Where to observe how long each stage of scheduling takes, for all resources.
+            Defaults to none, in which case nothing is observed.
+        :param placement: Chooses which free slot of a date the next availability is in, including
+            common availabilities. Defaults to the earliest free slot that fits.
+        """
+        self.event_index = event_index or BisectEventIndex()
+        self.calendar = calendar or Event._calendar
+        self.clock = clock or SystemClock()
+        self.metrics = metrics
+        self.placement = placement or FirstFitPlacement()
+        # Schedulers is a dict where the key is a resource's ID and the value is its scheduler.
+        self._schedulers: t.Dict[t.Hashable, Scheduler] = {}
+        # Resources without a scheduler are read from a scheduler which never has events.
+        self._empty_scheduler = self._create_scheduler()
+
+    def __contains__(self, resource_id: t.Hashable) -> bool:
+        return resource_id in self._schedulers
+
+    def __len__(self) -> int:
+        return len(self._schedulers)
+
+    @property
+    def resource_ids(self):
+        """The IDs of the resources with a scheduler."""
+        return list(self._schedulers)
+
+    def _create_scheduler(self):
+        return Scheduler(
+            self.event_index,
+            self.calendar,
+            self.clock,
+            self.metrics,
+            availability_cache_size=0,
+            placement=self.placement
+        )
+
+    def _get_scheduler(self, resource_id: t.Hashable):
+        """Get a resource's scheduler for reading, without creating it."""
+        return self._schedulers.get(resource_id, self._empty_scheduler)
+
+    def get_scheduler(self, resource_id: t.Hashable):
+        """Get a resource's scheduler, creating it if needed.
+
+        :param resource_id: The ID of the resource.
+        :return: The resource's scheduler.
+        """
+        scheduler = self._schedulers.get(resource_id)
+        if scheduler is None:
+            scheduler = self._schedulers[resource_id] = self._create_scheduler()
+        return scheduler
+
+    def snapshot(self, resource_id: t.Hashable):
+        """Create a read-only view of a resource's schedule as it is now. See Scheduler.snapshot.
+
+        :param resource_id: The ID of the resource.
+        :return: A read-only view of the resource's current schedule ordered by date.
+        """
+        return self._get_scheduler(resource_id).snapshot()
+
+    def schedule_event(self, resource_id: t.Hashable, event: Event) -> bool:
+        """Schedules an event for a resource. See Scheduler.schedule_event.
+
+        :param resource_id: The ID of the resource.
+        :param event: The event to schedule.
+        :return: A flag denoting if the event was overlapping and rescheduled.
+        """
+        return self.get_scheduler(resource_id).schedule_event(event)
+
+    def schedule_events(self, resource_id: t.Hashable, events: t.Iterable[Event]):
+        """Schedules many events for a resource. See Scheduler.schedule_events.
+
+        :param resource_id: The ID of the resource.
+        :param events: The events to schedule, in the order they were requested.
+        :return: A flag per event denoting if it was overlapping and rescheduled.
+        """
+        return self.get_scheduler(resource_id).schedule_events(events)
+
+    def get_availabilities(self, resource_id: t.Hashable, date: Date):
+        """Get all the unused datetime spans of a resource for a given date.
+
+        :param resource_id: The ID of the resource.
+        :param date: The date to get availabilities for.
+        :return: The availabilities for that date.
+        """
+        return self._get_scheduler(resource_id).get_availabilities(date)
+
+    def get_next_available_date(self, resource_id: t.Hashable, date: Date, timedelta: TimeDelta):
+        """Get the first date, from a given date, on which a resource has an availability at least as
+        long as a given duration. See Scheduler.get_next_available_date.
+
+        :param resource_id: The ID of the resource.
+        :param date: The first date to search from.
+        :param timedelta: The duration that must fit in an availability.
+        :return: The first date with a long enough availability. If the duration is longer than any
+            availability can be, None is returned.
+        """
+        return self._get_scheduler(resource_id).get_next_available_date(date, timedelta)
+
+    def _get_common_free_slots(self, schedulers: t.List[Scheduler], date: Date) -> t.List[Span]:
+        """Get the start and end of each span of a date in which every scheduler is available."""
+        return reduce(
+            DateTimeSpan.intersect_sorted,
+            (scheduler._get_free_slots(date) for scheduler in schedulers)
+        )
+
+    def _get_schedulers(self, resource_ids: t.Iterable[t.Hashable]):
+        schedulers = [self._get_scheduler(resource_id) for resource_id in resource_ids]
+        if not schedulers:
+            raise ValueError('At least one resource is needed')
+        return schedulers
+
+    def get_common_availabilities(self, resource_ids: t.Iterable[t.Hashable], date: Date):
+        """Get all the datetime spans for a given date in which every resource is available.
+
+        :param resource_ids: The IDs of the resources.
+        :param date: The date to get availabilities for.
+        :return: The availabilities every resource has for that date.
+        """
+        return [
+            Scheduler.Availability.construct(start=start, end=end)
+            for start, end in self._get_common_free_slots(self._get_schedulers(resource_ids), date)
+        ]
+
+    def _get_next_common_available_date(
+        self,
+        schedulers: t.List[Scheduler],
+        date: Date,
+        timedelta: TimeDelta
+    ):
+        """Get the first date, from a given date, on which every scheduler may have a long enough
+        availability. See get_next_common_available_date.
+        """
+        agreed, i = 0, 0
+        while agreed < len(schedulers):
+            next_date = schedulers[i].get_next_available_date(date, timedelta)
+            if next_date is None:
+                return None
+            if next_date == date:
+                agreed += 1
+            else:
+                # Every other resource must agree on the later date.
+                date, agreed = next_date, 1
+            i = (i + 1) % len(schedulers)
+        return date
+
+    def get_next_common_available_date(
+        self,
+        resource_ids: t.Iterable[t.Hashable],
+        date: Date,
+        timedelta: TimeDelta
+    ):
+        """Get the first date, from a given date, on which every resource may have an availability
+        at least as long as a given duration. Each resource's gap index skips the dates which are too
+        booked for it, until all resources agree on a date.
+
+        :param resource_ids: The IDs of the resources.
+        :param date: The first date to search from.
+        :param timedelta: The duration that must fit in an availability.
+        :return: The first date every resource may have a long enough availability on. If the
+            duration is longer than any availability can be, None is returned.
+        """
+        return self._get_next_common_available_date(self._get_schedulers(resource_ids), date, timedelta)
+
+    def get_next_common_availability(
+        self,
+        resource_ids: t.Iterable[t.Hashable],
+        start: DateTime,
+        timedelta: TimeDelta
+    ):
+        """Get the first span, from a given start, in which every resource is available for a given
+        duration. The span is in the future and on an allowed week day. The resources' free slots are
+        intersected only on the dates every resource may have a long enough availability on, and
+        the span is chosen among them by the pool's placement.
+
+        :param resource_ids: The IDs of the resources.
+        :param start: When the span may start at the earliest.
+        :param timedelta: The duration of the span.
+        :raises ValueError: If the duration is longer than any availability can be.
+        :return: When the span can start and end.
+        """
+        schedulers = self._get_schedulers(resource_ids)
+        # The schedulers share the pool's clock, so any of them gives the same earliest start.
+        start = schedulers[0]._get_earliest_start(start)
+
+        placement = self.placement
+        date = start.date()
+        while True:
+            date = self._get_next_common_available_date(schedulers, date, timedelta)
+            if date is None:
+                raise ValueError('The duration is longer than any availability can be')
+
+            # Start may be on an earlier date.
+            start = max(start, DateTime.combine(date, Time()))
+            free_slots = self._get_common_free_slots(schedulers, date)
+            free_slots_by_size = (
+                sorted((free_slot.timedelta, free_slot) for free_slot in free_slots)
+                if placement.by_size else None
+            )
+            placed_start = placement.place(free_slots, free_slots_by_size, start, timedelta)
+            if placed_start is not None:
+                return placed_start, placed_start + timedelta
+
+            # At this point, no common availability was long enough. Search from the next date.
+            date += TimeDelta(days=1)
+
+    def schedule_events_parallel(
+        self,
+        events: t.Mapping[t.Hashable, t.Iterable[Event]],
+        max_workers: t.Optional[int] = None
+    ):
+        """Schedules many events for many resources at once, scheduling each resource's events in a
+        separate process. Resources are scheduled independently, so the outcome is the same as
+        scheduling each resource's events in turn with schedule_events. The current datetime is
+        read once for all resources.
+
+        Sending events between processes has a cost, so this is only faster when there are many
+        resources with many events each. Metrics are not observed in the worker processes.
+
+        :param events: A dict where the key is a resource's ID and the value is the events to
+            schedule for that resource, in the order they were requested.
+        :param max_workers: How many processes to schedule with. Defaults to the number of CPUs.
+        :return: A dict where the key is a resource's ID and the value is a flag per event denoting
+            if it was overlapping and rescheduled.
+        """
+        # Read the clock once for all resources.
+        now = self.clock.now()
+        events = {
+            resource_id: list(events_for_resource)
+            for resource_id, events_for_resource in events.items()
+        }
+        resource_ids = [resource_id for resource_id in events if events[resource_id]]
+        max_workers = max_workers or os.cpu_count() or 1
+
+        def get_scheduled_spans(resource_id: t.Hashable):
+            return [
+                Span(event.start, event.end)
+                for _, events_for_date in self._get_scheduler(resource_id).iter_schedule()
+                for event in events_for_date
+            ]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                _schedule_resource_events,
+                [self.event_index] * len(resource_ids),
+                [self.calendar] * len(resource_ids),
+                [self.placement] * len(resource_ids),
+                [now] * len(resource_ids),
+                map(get_scheduled_spans, resource_ids),
+                (
+                    [Span(event.start, event.end) for event in events[resource_id]]
+                    for resource_id in resource_ids
+                ),
+                chunksize=max(1, len(resource_ids) // (max_workers * 4))
+            )
+
+            rescheduled: t.Dict[t.Hashable, t.List[bool]] = {
+                resource_id: [] for resource_id in events
+            }
+            for resource_id, (spans, rescheduled[resource_id], retries) in zip(resource_ids, results):
+                # Move each event to its new span. None of them overlap anymore, so they are merged
+                # into the resource's schedule in a single pass.
+                for event, (start, end) in zip(events[resource_id], spans):
+                    event.start, event.end = start, end
+                scheduler = self.get_scheduler(resource_id)
+                scheduler.schedule_events(events[resource_id])
+                scheduler.reschedule_retries += retries
+
+        return rescheduled
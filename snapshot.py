@@ -0,0 +1,183 @@
+import typing as t
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+from array import array
+from itertools import groupby
+import mmap
+import os
+import struct
+import sys
+
+from event import Event
+from scheduler import Scheduler
+
+MAGIC = b'SCHD'
+VERSION = 1
+_HEADER = struct.Struct('<4sHHqqq')
+_EPOCH = DateTime(year=1970, month=1, day=1)
+_MINUTE = TimeDelta(minutes=1)
+_MICROSECOND = TimeDelta(microseconds=1)
+
+
+class SnapshotError(ValueError):
+    """Raised if a file is not a snapshot or is in an unsupported version."""
+
+
+def save(scheduler: Scheduler, path: str):
+    """Save all of a scheduler's events to a snapshot. A snapshot is laid out in columns as:
+
+    - a header with the magic bytes, the version, the number of events, the number of distinct
+      names and the size of the encoded names;
+    - the start and end of each event, as int64 minutes since the epoch;
+    - the creation datetime stamp of each event, as int64 microseconds since the epoch;
+    - where each distinct name starts and ends in the encoded names, as int64;
+    - the index of each event's name, as uint32;
+    - each distinct name, UTF-8 encoded, one after the other.
+
+    Events are saved in the order they are scheduled in. All numbers are little-endian.
+
+    The snapshot is written next to the path, synced to disk and then moved to the path, so the path
+    always holds either the last complete snapshot or the new one, even after a crash.
+
+    :param scheduler: The scheduler to save the events of.
+    :param path: Where to save the snapshot.
+    :raises ValueError: If an event does not start or end on a whole minute.
+    """
+    starts, ends, created_ats = array('q'), array('q'), array('q')
+    name_ids = array('I')
+    # Names is a dict where the key is a name and the value is its index in the string table.
+    names: t.Dict[str, int] = {}
+    for _, events in scheduler.iter_schedule():
+        for event in events:
+            start, start_remainder = divmod(event.start - _EPOCH, _MINUTE)
+            end, end_remainder = divmod(event.end - _EPOCH, _MINUTE)
+            if start_remainder or end_remainder:
+                raise ValueError(f'Events must start and end on a whole minute: {event}')
+            starts.append(start)
+            ends.append(end)
+            created_ats.append((event.created_at - _EPOCH) // _MICROSECOND)
+            name_ids.append(names.setdefault(event.name, len(names)))
+
+    # Concatenate the encoded names, keeping where each one starts and ends.
+    encoded_names = [name.encode() for name in names]
+    name_offsets = array('q', [0])
+    for encoded_name in encoded_names:
+        name_offsets.append(name_offsets[-1] + len(encoded_name))
+
+    columns = [starts, ends, created_ats, name_offsets, name_ids]
+    if sys.byteorder != 'little':
+        for column in columns:
+            column.byteswap()
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, 0, len(starts), len(names), name_offsets[-1]))
+        for column in columns:
+            column.tofile(file)
+        file.write(b''.join(encoded_names))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+    _fsync_path(os.path.dirname(os.path.abspath(path)))
+
+
+def _fsync_path(path: str):
+    """Sync a file or directory to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _read_events(buffer: memoryview, event_type: t.Type[Event]):
+    """Read the events in a snapshot from a buffer. The columns are read in place and are released
+    before returning, so that the buffer can be closed.
+
+    :param buffer: The snapshot's bytes.
+    :param event_type: The type of event to create.
+    :raises SnapshotError: If the buffer is not a snapshot or is in an unsupported version.
+    :return: The events, in the order they were saved.
+    """
+    if len(buffer) < _HEADER.size:
+        raise SnapshotError('The file is too small to be a snapshot')
+    magic, version, _, event_count, name_count, names_size = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise SnapshotError('The file is not a snapshot')
+    if version != VERSION:
+        raise SnapshotError(f'Snapshot version {version} is not supported')
+
+    views: t.List[memoryview] = []
+    offset = _HEADER.size
+
+    def read_column(typecode: str, length: int) -> t.Sequence[int]:
+        nonlocal offset
+        end = offset + length * array(typecode).itemsize
+        if end > len(buffer):
+            raise SnapshotError('The snapshot is truncated')
+        view = buffer[offset:end]
+        views.append(view)
+        offset = end
+        if sys.byteorder != 'little':
+            column = array(typecode, view)
+            column.byteswap()
+            return column
+        column = view.cast(typecode)
+        views.append(column)
+        return column
+
+    try:
+        starts = read_column('q', event_count)
+        ends = read_column('q', event_count)
+        created_ats = read_column('q', event_count)
+        name_offsets = read_column('q', name_count + 1)
+        name_ids = read_column('I', event_count)
+        encoded_names = read_column('B', names_size)
+        # Each distinct name is decoded once.
+        names = [
+            bytes(encoded_names[name_offsets[i]:name_offsets[i + 1]]).decode()
+            for i in range(name_count)
+        ]
+
+        return [
+            event_type.from_trusted(
+                start=_EPOCH + start * _MINUTE,
+                end=_EPOCH + end * _MINUTE,
+                name=names[name_id],
+                created_at=_EPOCH + created_at * _MICROSECOND
+            )
+            for start, end, created_at, name_id in zip(starts, ends, created_ats, name_ids)
+        ]
+    finally:
+        for view in views:
+            view.release()
+
+
+def load(path: str, scheduler: t.Optional[Scheduler] = None):
+    """Load the events in a snapshot into a scheduler. The file is memory-mapped and its columns are
+    read in place. The events were validated before they were saved, so they are not validated or
+    checked for overlaps again.
+
+    :param path: Where the snapshot was saved.
+    :param scheduler: The scheduler to load the events into, which must have no events. Defaults
+        to a new scheduler.
+    :raises ValueError: If the scheduler already has events, as they would be replaced.
+    :raises SnapshotError: If the file is not a snapshot or is in an unsupported version.
+    :return: The scheduler with the events loaded.
+    """
+    if scheduler is None:
+        scheduler = Scheduler()
+    elif len(scheduler.schedule_view):
+        raise ValueError('Snapshots can only be loaded into a scheduler without events')
+
+    with open(path, 'rb') as file:
+        if not file.seek(0, 2):
+            raise SnapshotError('The file is too small to be a snapshot')
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            with memoryview(buffer) as view:
+                events = _read_events(view, scheduler.event_type)
+
+    # Events were saved in order, so each date's events are already in order.
+    for date, events_for_date in groupby(events, key=lambda event: event.start.date()):
+        scheduler._schedule[date] = list(events_for_date)
+    return scheduler
@@ -0,0 +1,117 @@
+from unittest import IsolatedAsyncioTestCase
+from datetime import datetime as DateTime
+from datetime import date as Date
+from datetime import time as Time
+import asyncio
+
+from async_scheduler import AsyncScheduler
+from scheduler import Scheduler
+from event import Event
+
+
+class AsyncSchedulerTests(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.date = Date(year=2032, month=11, day=11)
+        self.other_date = Date(year=2032, month=11, day=12)
+
+    def create_event(self, date: Date, start: Time, end: Time):
+        return Event(
+            start=DateTime.combine(date, start),
+            end=DateTime.combine(date, end),
+            name=f'Meeting between {start} and {end}'
+        )
+
+    async def test_schedule_event(self):
+        scheduler = AsyncScheduler()
+        event_0900_to_1000 = self.create_event(self.date, Time(hour=9), Time(hour=10))
+        event_0930_to_1030 = self.create_event(self.date, Time(hour=9, minute=30), Time(hour=10, minute=30))
+
+        # Assert event is scheduled at requested datetime span.
+        self.assertFalse(await scheduler.schedule_event(event_0900_to_1000))
+
+        # Assert overlapping event is rescheduled at next availability.
+        self.assertTrue(await scheduler.schedule_event(event_0930_to_1030))
+        self.assertEqual(event_0930_to_1030.start, DateTime.combine(self.date, Time(hour=10)))
+        self.assertEqual(
+            scheduler.scheduler.snapshot()[self.date],
+            (event_0900_to_1000, event_0930_to_1030)
+        )
+
+        # Assert availabilities are the same as the scheduler's.
+        self.assertListEqual(
+            await scheduler.get_availabilities(self.date),
+            scheduler.scheduler.get_availabilities(self.date)
+        )
+
+    async def test_schedule_event__same_decisions(self):
+        times = [(9, 10), (9, 11), (10, 12), (15, 18), (9, 18), (11, 12)]
+        async_scheduler = AsyncScheduler()
+        scheduler = Scheduler()
+
+        # Assert concurrent bookings end up where sequential bookings would.
+        results = await asyncio.gather(*(
+            async_scheduler.schedule_event(self.create_event(self.date, Time(hour=start), Time(hour=end)))
+            for start, end in times
+        ))
+        self.assertListEqual(results, [
+            scheduler.schedule_event(self.create_event(self.date, Time(hour=start), Time(hour=end)))
+            for start, end in times
+        ])
+        self.assertEqual(async_scheduler.scheduler.snapshot(), scheduler.snapshot())
+
+    async def test_schedule_event__locking(self):
+        calls = []
+
+        async def on_scheduled(event: Event, rescheduled: bool):
+            calls.append(('start', event.name))
+            await asyncio.sleep(0)
+            calls.append(('end', event.name))
+
+        scheduler = AsyncScheduler(on_scheduled=on_scheduled)
+        event_1 = self.create_event(self.date, Time(hour=9), Time(hour=10))
+        event_2 = self.create_event(self.date, Time(hour=10), Time(hour=11))
+        event_3 = self.create_event(self.other_date, Time(hour=9), Time(hour=10))
+
+        # Assert bookings on the same date wait for each other, but not bookings on other dates.
+        await asyncio.gather(*map(scheduler.schedule_event, [event_1, event_2, event_3]))
+        self.assertListEqual(calls, [
+            ('start', event_1.name),
+            ('start', event_3.name),
+            ('end', event_1.name),
+            ('end', event_3.name),
+            ('start', event_2.name),
+            ('end', event_2.name)
+        ])
+
+        # Assert locks are dropped once they are no longer used.
+        self.assertEqual(len(scheduler._locks), 0)
+
+    async def test_schedule_event__retry(self):
+        lock_taken = asyncio.Event()
+        release = asyncio.Event()
+
+        async def on_scheduled(event: Event, rescheduled: bool):
+            if event.name == 'Holding':
+                lock_taken.set()
+                await release.wait()
+
+        scheduler = AsyncScheduler(on_scheduled=on_scheduled)
+        scheduler.scheduler.insert_event(self.create_event(self.date, Time(hour=9), Time(hour=18)))
+        holding = self.create_event(self.other_date, Time(hour=9), Time(hour=10))
+        holding.name = 'Holding'
+        blocked = self.create_event(self.date, Time(hour=9), Time(hour=10))
+
+        # Assert availability taken while waiting for its date's lock is searched for again.
+        holding_task = asyncio.create_task(scheduler.schedule_event(holding))
+        await lock_taken.wait()
+        blocked_task = asyncio.create_task(scheduler.schedule_event(blocked))
+        await asyncio.sleep(0)
+        self.assertEqual(blocked.start, DateTime.combine(self.other_date, Time(hour=10)))
+        scheduler.scheduler.insert_event(
+            self.create_event(self.other_date, Time(hour=10), Time(hour=11))
+        )
+        release.set()
+        await holding_task
+        self.assertTrue(await blocked_task)
+        self.assertEqual(blocked.start, DateTime.combine(self.other_date, Time(hour=11)))
+        self.assertEqual(scheduler.scheduler.reschedule_retries, 1)
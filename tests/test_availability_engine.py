@@ -0,0 +1,97 @@
+from unittest import TestCase, skipIf
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+from datetime import time as Time
+import random
+
+from availability_engine import AvailabilityEngine, np
+from scheduler import Scheduler
+from event import Event
+from working_calendar import WorkingCalendar
+from clock import FrozenClock
+
+
+@skipIf(np is None, 'numpy is not installed')
+class AvailabilityEngineTests(TestCase):
+    def setUp(self) -> None:
+        self.date = Date(year=2032, month=11, day=11)
+        self.scheduler = Scheduler(clock=FrozenClock(DateTime(year=2032, month=11, day=1, hour=9)))
+        self.engine = AvailabilityEngine(self.scheduler)
+
+    def assert_matches_scheduler(self, start: Date, end: Date):
+        expected_availabilities = []
+        date = start
+        while date <= end:
+            if self.scheduler.calendar.is_valid_weekday(date):
+                expected_availabilities += self.scheduler.get_availabilities(date)
+            date += TimeDelta(days=1)
+        self.assertListEqual(self.engine.get_availabilities(start, end), expected_availabilities)
+
+    def test_get_free_slots(self):
+        self.scheduler.schedule_events([
+            Event(
+                start=DateTime.combine(self.date, Time(hour=9)),
+                end=DateTime.combine(self.date, Time(hour=10)),
+                name='Meeting at start of day'
+            ),
+            Event(
+                start=DateTime.combine(self.date, Time(hour=12)),
+                end=DateTime.combine(self.date, Time(hour=13)),
+                name='Lunch'
+            ),
+            Event(
+                start=DateTime.combine(self.date, Time(hour=13)),
+                end=DateTime.combine(self.date, Time(hour=18)),
+                name='Meeting until end of day'
+            )
+        ])
+
+        # Assert free slots of every valid date are computed as arrays.
+        free_slots = self.engine.get_free_slots(self.date, self.date + TimeDelta(days=4))
+        self.assertEqual(len(free_slots), 3)
+        self.assertListEqual(free_slots.starts.astype(DateTime).tolist(), [
+            DateTime.combine(self.date, Time(hour=10)),
+            DateTime.combine(self.date + TimeDelta(days=1), Time(hour=9)),
+            DateTime.combine(self.date + TimeDelta(days=4), Time(hour=9))
+        ])
+        self.assertListEqual(free_slots.timedeltas.astype(TimeDelta).tolist(), [
+            TimeDelta(hours=2),
+            TimeDelta(hours=9),
+            TimeDelta(hours=9)
+        ])
+        self.assertEqual(free_slots.dates[0], np.datetime64(self.date))
+
+        # Assert no dates on a valid weekday.
+        self.assertEqual(len(self.engine.get_free_slots(
+            Date(year=2032, month=11, day=13),
+            Date(year=2032, month=11, day=14)
+        )), 0)
+
+    def test_get_availabilities__matches_scheduler(self):
+        rng = random.Random(0)
+        for _ in range(400):
+            start = DateTime.combine(
+                self.date + TimeDelta(days=rng.randrange(0, 60)),
+                Time(hour=rng.randrange(9, 17), minute=rng.choice([0, 15, 30, 45]))
+            )
+            end = start + TimeDelta(minutes=rng.choice([15, 30, 60, 180]))
+            if start.weekday() < 5 and end.time() <= Time(hour=18):
+                self.scheduler.schedule_event(Event(start=start, end=end, name='Meeting'))
+
+        # Assert availabilities are the same as the scheduler's for each date.
+        self.assert_matches_scheduler(self.date - TimeDelta(days=3), self.date + TimeDelta(days=90))
+        self.assert_matches_scheduler(self.date + TimeDelta(days=10), self.date + TimeDelta(days=10))
+
+    def test_get_availabilities__calendar(self):
+        calendar = WorkingCalendar(valid_weekdays=[5, 6], start_of_day=Time(hour=10))
+        self.scheduler = Scheduler(calendar=calendar)
+        self.engine = AvailabilityEngine(self.scheduler)
+        self.scheduler._schedule[Date(year=2032, month=11, day=13)] = [Event.from_trusted(
+            start=DateTime(year=2032, month=11, day=13, hour=8),
+            end=DateTime(year=2032, month=11, day=13, hour=11),
+            name='Meeting before start of day'
+        )]
+
+        # Assert only the calendar's weekdays and times of day are included.
+        self.assert_matches_scheduler(self.date, self.date + TimeDelta(days=7))
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from benchmarks.suite import BENCHMARKS, run, compare
+from benchmarks.workloads import WORKLOADS, generate
+
+
+class BenchmarkTests(TestCase):
+    def test_generate(self):
+        for workload in WORKLOADS:
+            events = generate(workload, 100, seed=1)
+            self.assertEqual(len(events), 100)
+            # Assert workloads are reproducible and events fit inside a working day.
+            self.assertEqual(events, generate(workload, 100, seed=1))
+            for span, _ in events:
+                self.assertLess(span.start, span.end)
+                self.assertEqual(span.start.date(), span.end.date())
+                self.assertLess(span.start.weekday(), 5)
+                self.assertLessEqual(span.end.hour * 60 + span.end.minute, 18 * 60)
+
+    def test_run(self):
+        for benchmark in BENCHMARKS:
+            result = run(benchmark, 'uniform', 10)
+            self.assertGreater(result['throughput'], 0)
+            self.assertLessEqual(result['p50_us'], result['p95_us'])
+            self.assertLessEqual(result['p95_us'], result['p99_us'])
+            self.assertGreater(result['peak_memory'], 0)
+
+        result = run('schedule_event', 'heavy_overlap', 10, memory=False)
+        self.assertEqual(result['calls'], 10)
+        self.assertIsNone(result['peak_memory'])
+
+    def test_compare(self):
+        baseline = [
+            {'benchmark': 'a', 'workload': 'b', 'size': 1, 'throughput': 100, 'peak_memory': 100},
+            {'benchmark': 'a', 'workload': 'b', 'size': 2, 'throughput': 100, 'peak_memory': 100},
+            {'benchmark': 'a', 'workload': 'b', 'size': 3, 'throughput': 100, 'peak_memory': 100}
+        ]
+        results = [
+            {'benchmark': 'a', 'workload': 'b', 'size': 1, 'throughput': 90, 'peak_memory': 110},
+            {'benchmark': 'a', 'workload': 'b', 'size': 2, 'throughput': 70, 'peak_memory': None},
+            {'benchmark': 'a', 'workload': 'b', 'size': 3, 'throughput': 100, 'peak_memory': 130},
+            # Assert results missing from the baseline are not compared.
+            {'benchmark': 'a', 'workload': 'b', 'size': 4, 'throughput': 1, 'peak_memory': 1}
+        ]
+        comparisons = compare(results, baseline, tolerance=0.2)
+        self.assertEqual([key for key, *_ in comparisons], ['a/b/1', 'a/b/2', 'a/b/3'])
+        self.assertEqual([regressed for *_, regressed in comparisons], [False, True, True])
+        self.assertIsNone(comparisons[1][2])
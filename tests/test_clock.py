@@ -0,0 +1,29 @@
+from unittest import TestCase
+from datetime import datetime as DateTime
+
+from clock import Clock, SystemClock, FrozenClock
+
+
+class ClockTests(TestCase):
+    def test_clock(self):
+        # Assert clocks must implement now.
+        with self.assertRaises(TypeError):
+            Clock()
+
+    def test_system_clock(self):
+        before = DateTime.now()
+        now = SystemClock().now()
+        self.assertLessEqual(before, now)
+        self.assertLessEqual(now, DateTime.now())
+
+    def test_frozen_clock(self):
+        now = DateTime(year=2032, month=11, day=11, hour=9, minute=0)
+        clock = FrozenClock(now)
+        self.assertEqual(clock.now(), now)
+        self.assertEqual(clock.now(), now)
+
+        # Assert clock is frozen at the current datetime by default.
+        before = DateTime.now()
+        clock = FrozenClock()
+        self.assertEqual(clock.now(), clock.now())
+        self.assertLessEqual(before, clock.now())
@@ -1,10 +1,12 @@
+from unittest.mock import patch
 from datetime import timedelta as TimeDelta
 from datetime import datetime as DateTime
 from datetime import date as Date
 from datetime import time as Time
 
 from ._base import PyDanticTestCase
-from date_time_span import DateTimeSpan
+from date_time_span import DateTimeSpan, Span
+from event import Event
 
 
 class TimeSpanTests(PyDanticTestCase):
@@ -67,6 +69,12 @@ class TimeSpanTests(PyDanticTestCase):
         self.assertTrue(self.dts_0930_1000.overlaps_with(self.dts_0900_0930, equals=True))
         self.assertFalse(self.dts_0930_1000.overlaps_with(self.dts_0900_0930, equals=False))
 
+    def test_overlaps_with__contains(self):
+        self.assertTrue(self.dts_0830_0930.overlaps_with(self.dts_0900_0930, equals=False))
+        self.assertTrue(self.dts_0900_1000.overlaps_with(self.dts_0930_1000, equals=False))
+        self.assertTrue(self.dts_0830_0930.overlaps_with(self.dts_0900_0930, equals=True))
+        self.assertFalse(self.dts_0900_1000.overlaps_with(self.dts_1400_1500, equals=True))
+
     def test_merge(self):
         # Assert can merge datetime spans.
         date_time_span = DateTimeSpan.merge(self.dts_0900_1000, self.dts_0830_0930)
@@ -136,6 +144,82 @@ class TimeSpanTests(PyDanticTestCase):
             ]
         })
 
+    def test_merge_many__not_modified(self):
+        # Assert spans are not sorted in place.
+        spans = [self.dts_1400_1500, self.dts_0900_1000, self.dts_0830_0930]
+        date_time_spans = DateTimeSpan.merge_many(spans)
+        self.assertListEqual(spans, [self.dts_1400_1500, self.dts_0900_1000, self.dts_0830_0930])
+        self.assertDictEqual(date_time_spans, {
+            self.date: [
+                DateTimeSpan(
+                    start=DateTime.combine(self.date, Time(hour=8, minute=30)),
+                    end=DateTime.combine(self.date, Time(hour=10, minute=0))
+                ),
+                self.dts_1400_1500
+            ]
+        })
+
+    def test_merge_many__presorted(self):
+        spans = [self.dts_0830_0930, self.dts_0900_1000, self.dts_1000_1030, self.dts_1400_1500]
+
+        # Assert presorted spans are merged without being sorted again.
+        with patch('date_time_span.sorted', side_effect=AssertionError, create=True):
+            date_time_spans = DateTimeSpan.merge_many(iter(spans), presorted=True)
+        self.assertDictEqual(date_time_spans, {
+            self.date: [
+                DateTimeSpan(start=self.dts_0830_0930.start, end=self.dts_1000_1030.end),
+                self.dts_1400_1500
+            ]
+        })
+        self.assertDictEqual(date_time_spans, DateTimeSpan.merge_many(spans))
+
+    def test_merge_many__events(self):
+        events = [
+            Event(start=self.dts_0900_1000.start, end=self.dts_0900_1000.end, name='Meeting'),
+            Event(start=self.dts_1000_1030.start, end=self.dts_1000_1030.end, name='Stand-up')
+        ]
+
+        # Assert events are merged into plain spans, which can be printed.
+        date_time_spans = Event.merge_many(events)
+        self.assertIs(type(date_time_spans[self.date][0]), DateTimeSpan)
+        self.assertEqual(
+            str(date_time_spans[self.date][0]),
+            str(DateTimeSpan(start=self.dts_0900_1000.start, end=self.dts_1000_1030.end))
+        )
+        repr(date_time_spans[self.date][0])
+
+    def test_merge_sorted(self):
+        self.assertListEqual(DateTimeSpan.merge_sorted([]), [])
+        self.assertListEqual(DateTimeSpan.merge_sorted([
+            self.dts_0830_0930,
+            self.dts_0900_0930,
+            self.dts_0930_1000,
+            self.dts_1000_1030,
+            self.dts_1400_1500
+        ]), [
+            Span(self.dts_0830_0930.start, self.dts_1000_1030.end),
+            Span(self.dts_1400_1500.start, self.dts_1400_1500.end)
+        ])
+
+    def test_intersect_sorted(self):
+        self.assertListEqual(DateTimeSpan.intersect_sorted([], [self.dts_0900_1000]), [])
+        self.assertListEqual(DateTimeSpan.intersect_sorted([
+            self.dts_0830_0930,
+            self.dts_1000_1030,
+            self.dts_1400_1500
+        ], [
+            self.dts_0900_1000,
+            self.dts_1400_1500
+        ]), [
+            Span(self.dts_0900_0930.start, self.dts_0900_0930.end),
+            Span(self.dts_1400_1500.start, self.dts_1400_1500.end)
+        ])
+
+    def test_span(self):
+        span = Span(self.dts_0900_1000.start, self.dts_0900_1000.end)
+        self.assertEqual(span.timedelta, TimeDelta(hours=1))
+        self.assertFalse(hasattr(span, '__dict__'))
+
     def test_timedelta(self):
         self.assertEqual(self.dts_0900_1000.timedelta, TimeDelta(hours=1))
 
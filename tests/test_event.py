@@ -1,9 +1,15 @@
+import pickle
+from unittest.mock import Mock, patch
 from datetime import datetime as DateTime
 from datetime import date as Date
 from datetime import time as Time
 
+from pydantic import ValidationError
+
 from ._base import PyDanticTestCase
 from event import Event
+from working_calendar import WorkingCalendar
+from clock import FrozenClock
 
 
 class EventTests(PyDanticTestCase):
@@ -149,6 +155,114 @@ class EventTests(PyDanticTestCase):
             name='Meeting in the past'
         )
 
+    def test_with_calendar(self):
+        calendar = WorkingCalendar(valid_weekdays=[6, 0, 1, 2, 3])
+        event_type = Event.with_calendar(calendar)
+        self.assertIs(Event.with_calendar(WorkingCalendar()), Event)
+        self.assertIs(Event.with_calendar(WorkingCalendar(valid_weekdays=[6, 0, 1, 2, 3])), event_type)
+
+        # Assert event is validated against the calendar.
+        event = event_type(
+            start=DateTime(year=2032, month=11, day=14, hour=9, minute=0),
+            end=DateTime(year=2032, month=11, day=14, hour=10, minute=0),
+            name='Meeting on Sunday'
+        )
+        self.assertIsInstance(event, Event)
+        self.assert_raises_validation_error(
+            field_errors=[
+                ('start', Event.InvalidWeekDayError),
+                ('end', Event.InvalidWeekDayError)
+            ],
+            model_type=event_type,
+            start=DateTime(year=2032, month=11, day=12, hour=9, minute=0),
+            end=DateTime(year=2032, month=11, day=12, hour=10, minute=0),
+            name='Meeting on Friday'
+        )
+
+        # Assert the settings read before the calendar still alias the calendar's.
+        self.assertEqual(Event._valid_weekdays, [0, 1, 2, 3, 4])
+        self.assertEqual(event_type._valid_weekdays, [0, 1, 2, 3, 6])
+        self.assertEqual(event_type._start_of_day, Time(hour=9, minute=0))
+        self.assertEqual(event_type._end_of_day, Time(hour=18, minute=0))
+
+    def test_with_calendar__pickle(self):
+        calendar = WorkingCalendar(valid_weekdays=[6, 0, 1, 2, 3])
+        event_type = Event.with_calendar(calendar)
+        self.assertNotEqual(event_type.__qualname__, Event.__qualname__)
+        event = event_type(
+            start=DateTime(year=2032, month=11, day=14, hour=9, minute=0),
+            end=DateTime(year=2032, month=11, day=14, hour=10, minute=0),
+            name='Meeting on Sunday'
+        )
+        data = pickle.dumps(event)
+
+        # Assert event unpickles as the calendar's event type.
+        unpickled_event = pickle.loads(data)
+        self.assertIs(type(unpickled_event), event_type)
+        self.assertEqual(unpickled_event, event)
+        self.assertEqual(unpickled_event.created_at, event.created_at)
+
+        # Assert event unpickles where the calendar's event type was not created yet.
+        with patch.dict(Event._calendar_types, clear=True):
+            unpickled_event = pickle.loads(data)
+            self.assertIs(type(unpickled_event), Event.with_calendar(calendar))
+            self.assertIsNot(type(unpickled_event), event_type)
+            self.assertEqual(unpickled_event, event)
+
+    def test_from_trusted(self):
+        # Assert event is created without being validated.
+        event = Event.from_trusted(
+            start=DateTime(year=2000, month=11, day=11, hour=19, minute=0),
+            end=DateTime(year=2000, month=11, day=11, hour=20, minute=0),
+            name='Meeting in the past after end of day'
+        )
+        self.assertEqual(event.start, DateTime(year=2000, month=11, day=11, hour=19, minute=0))
+        self.assertIsInstance(event.created_at, DateTime)
+
+    def test_validate_many(self):
+        fields = [
+            {'start': self.event.start, 'end': self.event.end, 'name': self.event.name},
+            {'start': self.event.start, 'end': self.event.end, 'name': ''},
+            {'start': self.event.end, 'end': self.event.start, 'name': 'End before start'},
+            {
+                'start': DateTime(year=2032, month=11, day=13, hour=8, minute=0),
+                'end': DateTime(year=2032, month=11, day=13, hour=18, minute=0),
+                'name': 'Meeting on Saturday before 9am'
+            },
+            {
+                'start': DateTime(year=2000, month=11, day=10, hour=9, minute=0),
+                'end': DateTime(year=2000, month=11, day=10, hour=9, minute=30),
+                'name': 'Meeting in the past'
+            },
+            {'start': str(self.event.start), 'end': self.event.end, 'name': self.event.name}
+        ]
+
+        # Assert each event is created or raises the same errors as it would if created alone.
+        for event_fields, event in zip(fields, Event.validate_many(fields)):
+            try:
+                expected_event = Event(**event_fields)
+            except ValidationError as error:
+                self.assertIsInstance(event, ValidationError)
+                self.assertListEqual(
+                    [(error._loc, type(error.exc)) for error in event.raw_errors],
+                    [(error._loc, type(error.exc)) for error in error.raw_errors]
+                )
+            else:
+                self.assert_event_equal(event, expected_event)
+
+    def test_validate_many__clock(self):
+        # Assert events without a created_at are given the same creation datetime stamp, even those
+        # passed to the constructor.
+        now = DateTime(year=2032, month=8, day=20, hour=12, minute=0)
+        clock = Mock(now=Mock(side_effect=[now, now.replace(hour=13)]))
+        with patch.object(Event, '_clock', clock):
+            events = Event.validate_many([
+                {'start': self.event.start, 'end': self.event.end, 'name': self.event.name},
+                {'start': self.event.start, 'end': self.event.end, 'name': self.event.name.encode()}
+            ])
+        self.assertListEqual([event.created_at for event in events], [now, now])
+        clock.now.assert_called_once()
+
     def test__str__(self):
         # Assert stringified object is formatted as expected.
         self.assertEqual(str(self.event), self.event_str)
@@ -166,6 +280,43 @@ class EventTests(PyDanticTestCase):
         fields = Event.fields_from_str(self.event_str)
         self.assert_event_equal(Event(**fields), self.event)
 
+    def test_fields_from_str__other_layouts(self):
+        # Assert layouts other than the fixed layout are still accepted.
+        fields = Event.fields_from_str('2032/8/23 15:00->2032/08/23 16:00 -Meet Jamie for coffee')
+        self.assert_event_equal(Event(**fields), self.event)
+
+        # Assert names may contain hyphens in the fixed layout.
+        fields = Event.fields_from_str('2032/08/23 15:00 -> 2032/08/23 16:00 - Stand-up')
+        self.assertEqual(fields['name'], 'Stand-up')
+
+        # Assert short times padded to the fixed layout's length are still accepted.
+        fields = Event.fields_from_str('2032/08/23 15:0  -> 2032/08/23 16:00 - Meet Jamie for coffee')
+        self.assertEqual(fields['start'], DateTime.combine(self.date, self.start))
+        fields = Event.fields_from_str('2032/08/23 15:00 -> 2032/08/23 16:0  - Meet Jamie for coffee')
+        self.assertEqual(fields['end'], DateTime.combine(self.date, self.end))
+
+    def test_fields_from_str__clock(self):
+        # Assert creation datetime stamp is read from the event clock.
+        now = DateTime(year=2032, month=8, day=20, hour=12, minute=0)
+        with patch.object(Event, '_clock', FrozenClock(now)):
+            self.assertEqual(Event.fields_from_str(self.event_str)['created_at'], now)
+            self.assertEqual(Event(**{
+                'start': self.event.start,
+                'end': self.event.end,
+                'name': self.event.name
+            }).created_at, now)
+
+    def test_fields_from_strs(self):
+        # Assert all events are created from strings with the same creation datetime stamp.
+        fields = Event.fields_from_strs([self.event_str, self.event_str])
+        self.assertEqual(len(fields), 2)
+        self.assert_event_equal(Event(**fields[1]), self.event)
+        self.assertEqual(fields[0]['created_at'], fields[1]['created_at'])
+
+        # Assert invalid DateTime format.
+        with self.assertRaises(Event.InvalidDateTimeFormatError):
+            Event.fields_from_strs([self.event_str, '2022/13/23 15:00 -> 2022/08/23 16:00 - Hello'])
+
     def test_fields_from_str__invalid_format(self):
         # Assert invalid format.
         with self.assertRaises(Event.InvalidFormatError):
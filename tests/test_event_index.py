@@ -0,0 +1,59 @@
+from unittest import TestCase
+from datetime import datetime as DateTime
+from datetime import date as Date
+from datetime import time as Time
+
+from event import Event
+from event_index import EventIndex, ListEventIndex, BisectEventIndex
+
+
+class EventIndexTests(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.date = Date(year=2032, month=11, day=11)
+        cls.events = [
+            cls.event(Time(hour=9, minute=30), Time(hour=10, minute=0)),
+            cls.event(Time(hour=10, minute=30), Time(hour=11, minute=0)),
+            cls.event(Time(hour=12, minute=0), Time(hour=13, minute=0))
+        ]
+
+    @classmethod
+    def event(cls, start: Time, end: Time):
+        return Event(
+            start=DateTime.combine(cls.date, start),
+            end=DateTime.combine(cls.date, end),
+            name=f'Meeting between {start:%H:%M} and {end:%H:%M}'
+        )
+
+    def assert_find_position(self, event_index: EventIndex):
+        # Assert positions are found between, before and after events.
+        for position, start, end in [
+            (0, Time(hour=9, minute=0), Time(hour=9, minute=30)),
+            (1, Time(hour=10, minute=0), Time(hour=10, minute=30)),
+            (2, Time(hour=11, minute=0), Time(hour=12, minute=0)),
+            (3, Time(hour=13, minute=0), Time(hour=18, minute=0))
+        ]:
+            self.assertEqual(event_index.find_position(self.events, self.event(start, end)), position)
+
+        # Assert no position is found for overlapping events.
+        for start, end in [
+            (Time(hour=9, minute=0), Time(hour=9, minute=45)),
+            (Time(hour=9, minute=45), Time(hour=10, minute=15)),
+            (Time(hour=10, minute=0), Time(hour=13, minute=30)),
+            (Time(hour=12, minute=15), Time(hour=12, minute=45))
+        ]:
+            self.assertIsNone(event_index.find_position(self.events, self.event(start, end)))
+
+        # Assert first position is found when there are no events.
+        self.assertEqual(event_index.find_position([], self.events[0]), 0)
+
+    def test_event_index(self):
+        # Assert indexes must implement find_position.
+        with self.assertRaises(TypeError):
+            EventIndex()
+
+    def test_list_event_index__find_position(self):
+        self.assert_find_position(ListEventIndex())
+
+    def test_bisect_event_index__find_position(self):
+        self.assert_find_position(BisectEventIndex())
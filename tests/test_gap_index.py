@@ -0,0 +1,56 @@
+from unittest import TestCase
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+
+from gap_index import GapIndex
+
+
+class GapIndexTests(TestCase):
+    def setUp(self) -> None:
+        self.monday = Date(year=2032, month=11, day=8)
+        self.gap_index = GapIndex(valid_weekdays=[0, 1, 2, 3, 4], max_gap=TimeDelta(hours=9))
+
+    def test_find__unknown_dates(self):
+        # Assert unknown valid weekdays are assumed to have the largest possible gap.
+        self.assertEqual(self.gap_index.find(self.monday, TimeDelta(hours=9)), self.monday)
+
+        # Assert invalid weekdays are skipped.
+        saturday = self.monday + TimeDelta(days=5)
+        self.assertEqual(
+            self.gap_index.find(saturday, TimeDelta(hours=1)),
+            self.monday + TimeDelta(days=7)
+        )
+
+        # Assert no date is found for a gap larger than the largest possible gap.
+        self.assertIsNone(self.gap_index.find(self.monday, TimeDelta(hours=10)))
+
+    def test_find__known_dates(self):
+        # Fully book 6 weeks except for a 30 minute gap on Wednesday of week 4.
+        for day in range(6 * 7):
+            self.gap_index.update(self.monday + TimeDelta(days=day), TimeDelta())
+        wednesday = self.monday + TimeDelta(days=3 * 7 + 2)
+        self.gap_index.update(wednesday, TimeDelta(minutes=30))
+
+        # Assert fully booked dates are skipped.
+        self.assertEqual(self.gap_index.find(self.monday, TimeDelta(minutes=30)), wednesday)
+        self.assertEqual(
+            self.gap_index.find(self.monday, TimeDelta(hours=1)),
+            self.monday + TimeDelta(days=6 * 7)
+        )
+        self.assertEqual(
+            self.gap_index.find(wednesday + TimeDelta(days=1), TimeDelta(minutes=30)),
+            self.monday + TimeDelta(days=6 * 7)
+        )
+
+        # Assert discarded dates are assumed to have the largest possible gap again.
+        self.gap_index.discard(self.monday + TimeDelta(days=1))
+        self.assertEqual(
+            self.gap_index.find(self.monday, TimeDelta(hours=1)),
+            self.monday + TimeDelta(days=1)
+        )
+
+    def test_update__invalid_weekday(self):
+        # Assert gaps on invalid weekdays are ignored.
+        sunday = self.monday - TimeDelta(days=1)
+        self.gap_index.update(sunday, TimeDelta(hours=9))
+        self.assertEqual(self.gap_index.find(sunday, TimeDelta(hours=1)), self.monday)
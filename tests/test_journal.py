@@ -0,0 +1,137 @@
+from unittest import TestCase
+from unittest.mock import patch
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+from datetime import time as Time
+import os
+import tempfile
+
+from journal import Journal, replay
+from scheduler import Scheduler
+from event import Event
+from clock import FrozenClock
+import snapshot
+
+
+class JournalTests(TestCase):
+    def setUp(self) -> None:
+        self.date = Date(year=2032, month=11, day=11)
+        self.clock = FrozenClock(DateTime(year=2032, month=11, day=1, hour=9, minute=0))
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.log_path = os.path.join(directory.name, 'schedule.log')
+        self.snapshot_path = os.path.join(directory.name, 'schedule.snapshot')
+
+    def create_event(self, hour: int, name: str = 'Meeting', days: int = 0):
+        start = DateTime.combine(self.date + TimeDelta(days=days), Time(hour=hour))
+        return Event(start=start, end=start + TimeDelta(hours=1), name=name)
+
+    def open_journal(self, **kwargs):
+        return Journal.open(self.log_path, self.snapshot_path, Scheduler(clock=self.clock), **kwargs)
+
+    def test_open__replays_log(self):
+        with self.open_journal() as journal:
+            self.assertFalse(journal.schedule_event(self.create_event(9, 'Coffee ☕')))
+            self.assertTrue(journal.schedule_event(self.create_event(9, 'Rescheduled')))
+            self.assertListEqual(
+                journal.schedule_events([self.create_event(9, days=1), self.create_event(9)]),
+                [False, True]
+            )
+            expected_snapshot = journal.scheduler.snapshot()
+
+        # Assert scheduler is rebuilt from the log.
+        with self.open_journal() as journal:
+            self.assertEqual(journal.scheduler.snapshot(), expected_snapshot)
+            self.assertFalse(os.path.exists(self.snapshot_path))
+
+            # Assert new events are appended to the log.
+            journal.schedule_event(self.create_event(15))
+            expected_snapshot = journal.scheduler.snapshot()
+        with self.open_journal() as journal:
+            self.assertEqual(journal.scheduler.snapshot(), expected_snapshot)
+
+    def test_commit__group(self):
+        with patch('os.fsync') as fsync:
+            journal = self.open_journal(group_size=3)
+
+            # Assert records are synced to disk once per group.
+            for hour in [9, 10, 11, 12, 13]:
+                journal.schedule_event(self.create_event(hour))
+            self.assertEqual(fsync.call_count, 1)
+            self.assertEqual(len(journal._records), 2)
+
+            # Assert records which were not committed are lost on a crash.
+            self.assertEqual(replay(Scheduler(clock=self.clock), self.log_path), 3)
+            journal.close()
+            self.assertEqual(fsync.call_count, 2)
+        self.assertEqual(replay(Scheduler(clock=self.clock), self.log_path), 5)
+
+    def test_replay__partly_written_record(self):
+        with self.open_journal() as journal:
+            journal.schedule_event(self.create_event(9))
+            journal.schedule_event(self.create_event(10))
+        size = os.path.getsize(self.log_path)
+        with open(self.log_path, 'ab') as file:
+            file.write(b'\x01\x02\x03\x04\x05')
+
+        # Assert partly written record is skipped and removed.
+        with self.open_journal() as journal:
+            self.assertEqual(len(journal.scheduler.snapshot()[self.date]), 2)
+            self.assertEqual(os.path.getsize(self.log_path), size)
+            journal.schedule_event(self.create_event(11))
+        with self.open_journal() as journal:
+            self.assertEqual(len(journal.scheduler.snapshot()[self.date]), 3)
+
+    def test_init__partly_written_record(self):
+        with self.open_journal() as journal:
+            journal.schedule_event(self.create_event(9))
+        size = os.path.getsize(self.log_path)
+        with open(self.log_path, 'ab') as file:
+            file.write(b'\x01\x02\x03\x04\x05')
+
+        # Assert partly written record is removed without opening the journal through Journal.open.
+        with Journal(Scheduler(clock=self.clock), self.log_path, self.snapshot_path) as journal:
+            self.assertEqual(os.path.getsize(self.log_path), size)
+            journal.schedule_event(self.create_event(10))
+        scheduler = Scheduler(clock=self.clock)
+        with patch.object(scheduler, 'insert_event', wraps=scheduler.insert_event) as insert_event:
+            self.assertEqual(replay(scheduler, self.log_path), 2)
+            self.assertEqual(insert_event.call_count, 2)
+
+    def test_compact(self):
+        with self.open_journal(group_size=1, compact_size=200) as journal:
+            for hour in range(9, 18):
+                journal.schedule_event(self.create_event(hour))
+            expected_snapshot = journal.scheduler.snapshot()
+
+            # Assert log is folded into a snapshot once it grows past its size.
+            self.assertTrue(os.path.exists(self.snapshot_path))
+            self.assertLessEqual(os.path.getsize(self.log_path), 200)
+
+        with self.open_journal() as journal:
+            self.assertEqual(journal.scheduler.snapshot(), expected_snapshot)
+
+    def test_compact__crash_before_log_emptied(self):
+        with self.open_journal() as journal:
+            journal.schedule_event(self.create_event(9))
+            journal.schedule_event(self.create_event(10))
+            journal.commit()
+            # Save the snapshot without emptying the log.
+            snapshot.save(journal.scheduler, self.snapshot_path)
+            journal.schedule_event(self.create_event(11))
+            expected_snapshot = journal.scheduler.snapshot()
+
+        # Assert logged events already in the snapshot are skipped.
+        with self.open_journal() as journal:
+            self.assertEqual(journal.scheduler.snapshot(), expected_snapshot)
+
+    def test_schedule_event__not_whole_minute(self):
+        with self.open_journal() as journal:
+            event = self.create_event(9)
+            event.end += TimeDelta(seconds=30)
+
+            # Assert event is not scheduled if it cannot be logged.
+            with self.assertRaises(ValueError):
+                journal.schedule_event(event)
+            self.assertEqual(len(journal.scheduler.snapshot()), 0)
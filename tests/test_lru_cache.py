@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from lru_cache import LRUCache
+
+
+class LRUCacheTests(TestCase):
+    def test_get_and_put(self):
+        cache: LRUCache[str, int] = LRUCache(maxsize=2)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+
+        # Assert the least recently used value is evicted once full.
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertDictEqual(cache.stats(), {'hits': 3, 'misses': 1, 'size': 2, 'maxsize': 2})
+
+    def test_discard_and_clear(self):
+        cache: LRUCache[str, int] = LRUCache()
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.discard('a')
+        cache.discard('a')
+        self.assertNotIn('a', cache)
+        self.assertIn('b', cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_maxsize_0(self):
+        cache: LRUCache[str, int] = LRUCache(maxsize=0)
+        cache.put('a', 1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
@@ -6,8 +6,10 @@ from io import StringIO
 import subprocess
 import sys
 
-from main import print_schedule
+from main import print_schedule, stream_events
+from scheduler import Scheduler
 from event import Event
+from metrics import Metrics
 
 
 class MainTests(TestCase):
@@ -45,3 +47,65 @@ class MainTests(TestCase):
             ]
         })
         self.assertIn(sys.stdout.getvalue().replace('\n', '\r\n'), output.decode('utf-8'))
+
+    def test_stream_events(self):
+        output = StringIO()
+        scheduler = Scheduler()
+        stream_events(scheduler, [
+            '2032/08/23 15:00 -> 2032/08/23 16:00 - Meet Jamie for coffee\n',
+            '\n',
+            'Hello World\n',
+            '2032/08/23 15:30 -> 2032/08/23 16:00 - Dance party\n',
+            '2032/08/21 15:00 -> 2032/08/21 16:00 - Meeting on Saturday\n',
+            '2032/08/23 16:15 -> 2032/08/23 17:00 - Guitar lessons\n'
+        ], batch_size=2, output=output)
+
+        # Assert events are scheduled in order, skipping invalid events that cannot be rescheduled.
+        self.assertListEqual(output.getvalue().splitlines(), [
+            'Scheduled Event: 2032/08/23 15:00 -> 2032/08/23 16:00 - Meet Jamie for coffee',
+            'Rescheduled Event: 2032/08/23 16:00 -> 2032/08/23 16:30 - Dance party',
+            'Rescheduled Event: 2032/08/23 09:00 -> 2032/08/23 10:00 - Meeting on Saturday',
+            'Rescheduled Event: 2032/08/23 16:30 -> 2032/08/23 17:15 - Guitar lessons'
+        ])
+
+    def test_stream_events__failed_batch(self):
+        output = StringIO()
+        scheduler = Scheduler()
+        schedule_events = scheduler.schedule_events
+        batches = []
+
+        def fail_first_batch(events):
+            batches.append(list(events))
+            if len(batches) == 1:
+                schedule_events(events[:1])
+                raise RuntimeError('Failed mid batch')
+            return schedule_events(events)
+
+        scheduler.schedule_events = fail_first_batch
+        with self.assertLogs(level='ERROR') as logs:
+            stream_events(scheduler, [
+                '2032/08/23 09:00 -> 2032/08/23 10:00 - First\n',
+                '2032/08/23 10:00 -> 2032/08/23 11:00 - Second\n',
+                '2032/08/23 11:00 -> 2032/08/23 12:00 - Third\n'
+            ], batch_size=2, output=output)
+
+        # Assert a failed batch is logged with its error and its events are not scheduled again.
+        self.assertIn('Failed mid batch', logs.output[0])
+        self.assertListEqual([len(batch) for batch in batches], [2, 1])
+        self.assertListEqual(output.getvalue().splitlines(), [
+            'Scheduled Event: 2032/08/23 11:00 -> 2032/08/23 12:00 - Third'
+        ])
+        self.assertEqual(len(scheduler.snapshot()[Date(year=2032, month=8, day=23)]), 2)
+
+    def test_stream_events__metrics(self):
+        scheduler = Scheduler(metrics=Metrics())
+        stream_events(scheduler, [
+            '2032/08/23 15:00 -> 2032/08/23 16:00 - Meet Jamie for coffee\n',
+            'Hello World\n',
+            '2032/08/21 15:00 -> 2032/08/21 16:00 - Meeting on Saturday\n'
+        ], batch_size=2, output=StringIO())
+
+        # Assert parsing and validating are observed, even when they fail.
+        snapshot = scheduler.metrics.snapshot()
+        self.assertEqual(snapshot['parse']['count'], 3)
+        self.assertEqual(snapshot['validate']['count'], 2)
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from metrics import Metrics
+
+
+class MetricsTests(TestCase):
+    def test_observe(self):
+        observations = []
+        metrics = Metrics(callback=lambda name, value: observations.append((name, value)))
+        metrics.observe('days_walked', 1)
+        metrics.observe('days_walked', 3)
+        metrics.observe('reschedule_depth', 2)
+
+        self.assertDictEqual(metrics.snapshot(), {
+            'days_walked': {'count': 2, 'total': 4, 'mean': 2, 'max': 3},
+            'reschedule_depth': {'count': 1, 'total': 2, 'mean': 2, 'max': 2}
+        })
+        # Assert each observation is passed on to the callback.
+        self.assertListEqual(observations, [
+            ('days_walked', 1),
+            ('days_walked', 3),
+            ('reschedule_depth', 2)
+        ])
+
+        metrics.reset()
+        self.assertDictEqual(metrics.snapshot(), {})
+
+    def test_timed(self):
+        metrics = Metrics()
+
+        def fail():
+            raise ValueError()
+
+        self.assertEqual(metrics.timed('add', lambda a, b: a + b)(1, b=2), 3)
+        with self.assertRaises(ValueError):
+            metrics.timed('fail', fail)()
+
+        # Assert calls are timed even if they raise.
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['add']['count'], 1)
+        self.assertEqual(snapshot['fail']['count'], 1)
+        self.assertGreater(snapshot['add']['total'], 0)
+        self.assertEqual(metrics.timed('fail', fail).__name__, 'fail')
+
+    def test_timer(self):
+        metrics = Metrics()
+        with metrics.timer('block'):
+            pass
+        with self.assertRaises(ValueError):
+            with metrics.timer('block'):
+                raise ValueError()
+
+        # Assert blocks are timed even if they raise.
+        self.assertEqual(metrics.snapshot()['block']['count'], 2)
@@ -0,0 +1,74 @@
+from unittest import TestCase
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+import random
+
+from date_time_span import Span
+from placement import PlacementStrategy, FirstFitPlacement, BestFitPlacement, WorstFitPlacement
+
+
+class PlacementTests(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.start_of_day = DateTime(year=2032, month=11, day=11, hour=9, minute=0)
+
+    def get_free_slots(self, *minutes: int):
+        """Get free slots from pairs of start and end minutes after the start of the day."""
+        return [
+            Span(self.start_of_day + TimeDelta(minutes=start), self.start_of_day + TimeDelta(minutes=end))
+            for start, end in zip(minutes[::2], minutes[1::2])
+        ]
+
+    def place(self, placement, free_slots, start: int, timedelta: int):
+        free_slots_by_size = sorted((free_slot.timedelta, free_slot) for free_slot in free_slots)
+        placed_start = placement.place(
+            free_slots,
+            free_slots_by_size if placement.by_size else None,
+            self.start_of_day + TimeDelta(minutes=start),
+            TimeDelta(minutes=timedelta)
+        )
+        return None if placed_start is None else (placed_start - self.start_of_day) // TimeDelta(minutes=1)
+
+    def test_placement_strategy(self):
+        # Assert strategies must implement place.
+        with self.assertRaises(TypeError):
+            PlacementStrategy()
+
+    def test_place(self):
+        free_slots = self.get_free_slots(0, 60, 90, 120, 180, 300, 360, 390)
+        # Assert each placement picks its free slot, from the start.
+        self.assertEqual(self.place(FirstFitPlacement(), free_slots, 0, 30), 0)
+        self.assertEqual(self.place(BestFitPlacement(), free_slots, 0, 30), 90)
+        self.assertEqual(self.place(WorstFitPlacement(), free_slots, 0, 30), 180)
+
+        # Assert the free slot the start falls inside only fits from the start.
+        self.assertEqual(self.place(FirstFitPlacement(), free_slots, 30, 45), 180)
+        self.assertEqual(self.place(BestFitPlacement(), free_slots, 30, 30), 30)
+        self.assertEqual(self.place(BestFitPlacement(), free_slots, 200, 30), 360)
+        self.assertEqual(self.place(WorstFitPlacement(), free_slots, 200, 30), 200)
+
+        # Assert nothing is placed if no free slot is long enough.
+        for placement in [FirstFitPlacement(), BestFitPlacement(), WorstFitPlacement()]:
+            self.assertIsNone(self.place(placement, free_slots, 0, 150))
+            self.assertIsNone(self.place(placement, free_slots, 380, 30))
+
+    def test_place__brute_force(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            minutes = sorted(rng.sample(range(0, 540, 15), 2 * rng.randrange(1, 8)))
+            free_slots = self.get_free_slots(*minutes)
+            start = rng.randrange(0, 540, 15)
+            timedelta = rng.choice([15, 30, 45, 60])
+
+            # Get the start and size of each free slot the event fits in, from the start.
+            fits = [
+                (end - max(free_start, start), max(free_start, start))
+                for free_start, end in zip(minutes[::2], minutes[1::2])
+                if end - max(free_start, start) >= timedelta
+            ]
+            first = min((placed for _, placed in fits), default=None)
+            best = min(fits, default=(None, None))[1]
+            worst = min(((-size, placed) for size, placed in fits), default=(None, None))[1]
+            self.assertEqual(self.place(FirstFitPlacement(), free_slots, start, timedelta), first)
+            self.assertEqual(self.place(BestFitPlacement(), free_slots, start, timedelta), best)
+            self.assertEqual(self.place(WorstFitPlacement(), free_slots, start, timedelta), worst)
@@ -0,0 +1,63 @@
+from unittest import TestCase
+from datetime import datetime as DateTime
+from datetime import date as Date
+from datetime import time as Time
+
+from event import Event
+from schedule_view import ScheduleView, EventsView
+
+
+class ScheduleViewTests(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.date_1 = Date(year=2032, month=11, day=10)
+        cls.date_2 = Date(year=2032, month=11, day=11)
+        cls.date_3 = Date(year=2032, month=11, day=12)
+
+    def setUp(self) -> None:
+        self.events_1 = [self.event(self.date_1)]
+        self.events_2 = [self.event(self.date_2)]
+        self.schedule = {
+            self.date_3: [],
+            self.date_2: self.events_2,
+            self.date_1: self.events_1
+        }
+
+    def event(self, date: Date):
+        return Event(
+            start=DateTime.combine(date, Time(hour=9, minute=0)),
+            end=DateTime.combine(date, Time(hour=10, minute=0)),
+            name=f'Meeting on {date}'
+        )
+
+    def test_schedule_view(self):
+        view = ScheduleView(self.schedule)
+
+        # Assert dates with events are included in order.
+        self.assertListEqual(list(view), [self.date_1, self.date_2])
+        self.assertEqual(len(view), 2)
+        self.assertNotIn(self.date_3, view)
+        self.assertEqual(view[self.date_1], self.events_1)
+
+        # Assert events are shared and the view stays up to date.
+        self.assertIs(view[self.date_1][0], self.events_1[0])
+        self.events_1.append(self.event(self.date_1))
+        self.assertEqual(len(view[self.date_1]), 2)
+
+    def test_schedule_view__between(self):
+        view = ScheduleView(self.schedule, start=self.date_2, end=self.date_3)
+        self.assertListEqual(list(view), [self.date_2])
+        with self.assertRaises(KeyError):
+            view[self.date_1]
+
+    def test_events_view(self):
+        view = EventsView(self.events_2)
+        self.assertEqual(view, self.events_2)
+        self.assertEqual(view[:1], self.events_2)
+        self.assertIsInstance(view[:1], EventsView)
+
+        # Assert view cannot be edited.
+        with self.assertRaises(TypeError):
+            view[0] = self.event(self.date_1)
+        with self.assertRaises(AttributeError):
+            view.append(self.event(self.date_1))
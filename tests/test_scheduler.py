@@ -1,12 +1,21 @@
+import typing as t
 from unittest import TestCase
 from unittest.mock import patch, Mock
 from datetime import datetime as DateTime
 from datetime import timedelta as TimeDelta
 from datetime import date as Date
 from datetime import time as Time
+import copy
+import random
 
 from scheduler import Scheduler
 from event import Event
+from date_time_span import Span
+from event_index import ListEventIndex
+from working_calendar import WorkingCalendar
+from clock import FrozenClock
+from metrics import Metrics
+from placement import BestFitPlacement, WorstFitPlacement
 import utilities as utils
 
 
@@ -60,6 +69,11 @@ class SchedulerTests(TestCase):
             end=DateTime.combine(self.date, self.time_1130),
             name='Meeting between 10:30 and 11:30'
         )
+        self.event_1100_to_1130 = Event(
+            start=DateTime.combine(self.date, self.time_1100),
+            end=DateTime.combine(self.date, self.time_1130),
+            name='Meeting between 11:00 and 11:30'
+        )
         self.event_1700_to_1800 = Event(
             start=DateTime.combine(self.date, self.time_1700),
             end=DateTime.combine(self.date, self.time_1800),
@@ -91,6 +105,75 @@ class SchedulerTests(TestCase):
         schedule.pop(self.date)
         self.assertListEqual(self.scheduler._schedule[self.date], events)
 
+    def test_schedule_views(self):
+        self.scheduler.schedule_event(self.event_0930_to_1000)
+        snapshot = self.scheduler.snapshot()
+        view = self.scheduler.schedule_view
+        self.scheduler.schedule_event(self.event_0900_to_0930)
+
+        # Assert views share events and stay up to date but snapshots do not.
+        self.assertIs(view[self.date][1], self.event_0930_to_1000)
+        self.assertEqual(view[self.date], [self.event_0900_to_0930, self.event_0930_to_1000])
+        self.assertEqual(snapshot[self.date], [self.event_0930_to_1000])
+        self.assertListEqual(list(self.scheduler.iter_schedule()), [
+            (self.date, [self.event_0900_to_0930, self.event_0930_to_1000])
+        ])
+        self.assertEqual(len(self.scheduler.schedule_between(self.date, self.date)), 1)
+        self.assertEqual(len(self.scheduler.schedule_between(Date.min, Date(2032, 11, 10))), 0)
+
+    def test_events_between(self):
+        next_day = Date(year=2032, month=11, day=12)
+        event_next_day = Event(
+            start=DateTime.combine(next_day, self.time_0900),
+            end=DateTime.combine(next_day, self.time_1000),
+            name='Meeting on next day'
+        )
+        self.scheduler.schedule_events([
+            self.event_0900_to_0930,
+            self.event_1000_to_1030,
+            self.event_1700_to_1800,
+            event_next_day
+        ])
+        self.assertListEqual(self.scheduler._dates, [self.date, next_day])
+
+        # Assert only events overlapping with the span are returned in order.
+        events = self.scheduler.events_between(
+            DateTime.combine(self.date, self.time_0930),
+            DateTime.combine(next_day, self.time_0930)
+        )
+        self.assertListEqual(list(events), [
+            self.event_1000_to_1030,
+            self.event_1700_to_1800,
+            event_next_day
+        ])
+
+        # Assert dates are removed when their events are.
+        self.scheduler._schedule.pop(next_day)
+        self.assertListEqual(self.scheduler._dates, [self.date])
+
+    def test_availabilities_between(self):
+        self.scheduler.schedule_event(self.event_0900_to_1800)
+        saturday = Date(year=2032, month=11, day=13)
+        monday = Date(year=2032, month=11, day=15)
+
+        # Assert availabilities are cut to the span and invalid weekdays are skipped.
+        availabilities = self.scheduler.availabilities_between(
+            DateTime.combine(self.date, self.time_0900),
+            DateTime.combine(monday, self.time_1000)
+        )
+        self.assertListEqual(list(availabilities), [
+            Scheduler.Availability(
+                start=DateTime.combine(Date(year=2032, month=11, day=12), self.time_0900),
+                end=DateTime.combine(Date(year=2032, month=11, day=12), self.time_1800)
+            ),
+            Scheduler.Availability(
+                start=DateTime.combine(monday, self.time_0900),
+                end=DateTime.combine(monday, self.time_1000)
+            )
+        ])
+        self.assertNotIn(saturday, self.scheduler._schedule)
+        self.assertNotIn(monday, self.scheduler._free_slots)
+
     def test_get_availabilities__no_events(self):
         availabilities = self.scheduler.get_availabilities(self.date)
         self.assertListEqual(availabilities, [
@@ -121,6 +204,23 @@ class SchedulerTests(TestCase):
             )
         ])
 
+    def test_get_availabilities__events_at_start_of_day(self):
+        self.scheduler._schedule[self.date] = [
+            self.event_0900_to_0930,
+            self.event_1000_to_1030
+        ]
+        availabilities = self.scheduler.get_availabilities(self.date)
+        self.assertListEqual(availabilities, [
+            Scheduler.Availability(
+                start=DateTime.combine(self.date, self.time_0930),
+                end=DateTime.combine(self.date, self.time_1000)
+            ),
+            Scheduler.Availability(
+                start=DateTime.combine(self.date, self.time_1030),
+                end=DateTime.combine(self.date, self.time_1800)
+            )
+        ])
+
     def test_get_availabilities__event_at_start_of_day(self):
         self.scheduler._schedule[self.date] = [
             self.event_0900_to_0930
@@ -165,6 +265,111 @@ class SchedulerTests(TestCase):
         availabilities = self.scheduler.get_availabilities(self.date)
         self.assertListEqual(availabilities, [])
 
+    def test_get_availabilities__cache(self):
+        next_date = self.date + TimeDelta(days=1)
+        self.scheduler.schedule_event(self.event_0900_to_1000)
+        availabilities = self.scheduler.get_availabilities(self.date)
+        self.scheduler.get_availabilities(next_date)
+
+        # Assert availabilities are cached, without sharing the list they are returned in.
+        availability = availabilities[0]
+        availabilities.clear()
+        self.assertEqual(len(self.scheduler.get_availabilities(self.date)), 1)
+        self.assertDictEqual(self.scheduler.availability_cache.stats(), {
+            'hits': 1,
+            'misses': 2,
+            'size': 2,
+            'maxsize': 1024
+        })
+
+        # Assert cached availabilities cannot be edited by a caller.
+        with self.assertRaises(TypeError):
+            availability.start = DateTime.combine(self.date, self.time_1700)
+        self.assertEqual(
+            self.scheduler.get_availabilities(self.date)[0].start,
+            DateTime.combine(self.date, self.time_1000)
+        )
+
+        # Assert only the dates events are inserted into are invalidated.
+        self.scheduler.schedule_event(self.event_1700_to_1800)
+        self.assertNotIn(self.date, self.scheduler.availability_cache)
+        self.assertIn(next_date, self.scheduler.availability_cache)
+        self.assertListEqual(self.scheduler.get_availabilities(self.date), [
+            Scheduler.Availability(
+                start=DateTime.combine(self.date, self.time_1000),
+                end=DateTime.combine(self.date, self.time_1700)
+            )
+        ])
+        self.scheduler._schedule[next_date] = [self.event_0900_to_1800.copy(update={
+            'start': DateTime.combine(next_date, self.time_0900),
+            'end': DateTime.combine(next_date, self.time_1800)
+        })]
+        self.assertListEqual(self.scheduler.get_availabilities(next_date), [])
+
+        # Assert availabilities are not cached if the cache has no room.
+        scheduler = Scheduler(availability_cache_size=0)
+        scheduler.get_availabilities(self.date)
+        self.assertEqual(len(scheduler.availability_cache), 0)
+
+    def test_get_availabilities__free_slots_split(self):
+        # Assert free slots are only kept for dates with events.
+        self.scheduler.get_availabilities(self.date)
+        self.assertNotIn(self.date, self.scheduler._free_slots)
+
+        # Assert free slots are computed once and then split as events are inserted.
+        self.scheduler.schedule_event(self.event_1000_to_1030)
+        self.scheduler.get_availabilities(self.date)
+        self.scheduler.schedule_event(self.event_1700_to_1800)
+        self.assertListEqual(self.scheduler._free_slots[self.date], [
+            (DateTime.combine(self.date, self.time_0900), DateTime.combine(self.date, self.time_1000)),
+            (DateTime.combine(self.date, self.time_1030), DateTime.combine(self.date, self.time_1700))
+        ])
+        self.assertListEqual(
+            self.scheduler._free_slots[self.date],
+            self.scheduler._compute_free_slots(self.date)
+        )
+
+        # Assert free slots are dropped when a date's events are replaced.
+        self.scheduler._schedule[self.date] = [self.event_0900_to_1800]
+        self.assertNotIn(self.date, self.scheduler._free_slots)
+        self.assertListEqual(self.scheduler.get_availabilities(self.date), [])
+
+    def test_schedule__edits_drop_derived_state(self):
+        def assert_availabilities(*spans: t.Tuple[Time, Time]):
+            self.assertListEqual(self.scheduler.get_availabilities(self.date), [
+                Scheduler.Availability(
+                    start=DateTime.combine(self.date, start),
+                    end=DateTime.combine(self.date, end)
+                )
+                for start, end in spans
+            ])
+
+        self.scheduler.schedule_event(self.event_1000_to_1030)
+        assert_availabilities((self.time_0900, self.time_1000), (self.time_1030, self.time_1800))
+
+        # Assert editing a date's events in place drops the state derived from them.
+        self.scheduler._schedule[self.date].append(self.event_1700_to_1800)
+        assert_availabilities((self.time_0900, self.time_1000), (self.time_1030, self.time_1700))
+        del self.scheduler._schedule[self.date][0]
+        assert_availabilities((self.time_0900, self.time_1700))
+
+        # Assert every way of editing the schedule drops the state derived from it.
+        self.scheduler._schedule.update({self.date: [self.event_0900_to_1800]})
+        assert_availabilities()
+        self.scheduler._schedule.clear()
+        assert_availabilities((self.time_0900, self.time_1800))
+        self.assertListEqual(self.scheduler._dates, [])
+        self.scheduler._schedule.setdefault(self.date, [self.event_0900_to_1000])
+        assert_availabilities((self.time_1000, self.time_1800))
+        self.scheduler._schedule.popitem()
+        assert_availabilities((self.time_0900, self.time_1800))
+        self.scheduler._schedule |= {self.date: [self.event_0930_to_1000]}
+        assert_availabilities((self.time_0900, self.time_0930), (self.time_1000, self.time_1800))
+        self.assertListEqual(self.scheduler._dates, [self.date])
+
+        # Assert copies of a date's events are plain lists.
+        self.assertIs(type(copy.copy(self.scheduler._schedule[self.date])), list)
+
     def test_get_next_availability(self):
         self.scheduler._schedule[self.date] = [
             self.event_0930_to_1000,
@@ -175,38 +380,139 @@ class SchedulerTests(TestCase):
         self.assertEqual(start, DateTime.combine(self.date, self.time_1100))
         self.assertEqual(end, DateTime.combine(self.date, Time(hour=12, minute=0)))
 
-    @patch('scheduler.DateTime')
-    def test_get_next_availability__refresh_start_to_today(self, scheduler__DateTime: Mock):
-        # Mock DateTime's class methods.
+    def test_get_next_availability__fully_booked_weeks(self):
+        # Fully book the next 4 weeks.
+        for day in range(4 * 7):
+            date = self.date + TimeDelta(days=day)
+            self.scheduler._schedule[date] = [Event.construct(
+                start=DateTime.combine(date, self.time_0900),
+                end=DateTime.combine(date, self.time_1800),
+                name='Fully booked'
+            )]
+
+        # Assert fully booked dates are skipped.
+        start = DateTime.combine(self.date, self.time_0900)
+        start, end = self.scheduler.get_next_availability(start, TimeDelta(hours=1))
+        date = Date(year=2032, month=12, day=9)
+        self.assertEqual(start, DateTime.combine(date, self.time_0900))
+        self.assertEqual(end, DateTime.combine(date, self.time_1000))
+        self.assertEqual(self.scheduler.get_next_available_date(self.date, TimeDelta(hours=1)), date)
+
+    def test_index_dates(self):
+        for day in range(4 * 7):
+            date = self.date + TimeDelta(days=day)
+            self.scheduler._schedule[date] = [Event.construct(
+                start=DateTime.combine(date, self.time_0900),
+                end=DateTime.combine(date, self.time_1800),
+                name='Fully booked'
+            )]
+        self.scheduler.index_dates()
+
+        # Assert indexed dates are skipped without computing their free slots.
+        date = Date(year=2032, month=12, day=9)
+        with patch.object(
+            self.scheduler,
+            '_compute_free_slots',
+            wraps=self.scheduler._compute_free_slots
+        ) as compute_free_slots:
+            self.assertEqual(self.scheduler.get_next_available_date(self.date, TimeDelta(hours=1)), date)
+            compute_free_slots.assert_called_once_with(date)
+
+    def test_get_next_availability__placement(self):
+        clock = FrozenClock(DateTime.combine(self.date, Time()))
+        best_fit = Scheduler(clock=clock, placement=BestFitPlacement())
+        worst_fit = Scheduler(clock=clock, placement=WorstFitPlacement())
+        for scheduler in [self.scheduler, best_fit, worst_fit]:
+            scheduler._schedule[self.date] = [self.event_1000_to_1030, self.event_1100_to_1130]
+        self.scheduler.clock = clock
+
+        # Assert each placement picks its free slot.
+        start = DateTime.combine(self.date, self.time_0900)
+        timedelta = TimeDelta(minutes=30)
+        self.assertEqual(self.scheduler.get_next_availability(start, timedelta)[0], start)
+        self.assertEqual(
+            best_fit.get_next_availability(start, timedelta)[0],
+            DateTime.combine(self.date, self.time_1030)
+        )
+        self.assertEqual(
+            worst_fit.get_next_availability(start, timedelta)[0],
+            DateTime.combine(self.date, self.time_1130)
+        )
+
+        # Assert free slots by size are kept up to date as free slots are split.
+        best_fit.schedule_event(self.event_1000_to_1030.copy())
+        free_slots = best_fit._free_slots[self.date]
+        self.assertListEqual(free_slots, [
+            (start, DateTime.combine(self.date, self.time_1000)),
+            (DateTime.combine(self.date, self.time_1130), DateTime.combine(self.date, self.time_1800))
+        ])
+        self.assertIs(best_fit._free_slots_by_size[self.date][0], free_slots)
+        self.assertListEqual(
+            best_fit._free_slots_by_size[self.date][1],
+            sorted((free_slot.timedelta, free_slot) for free_slot in free_slots)
+        )
+        self.assertEqual(best_fit.get_next_availability(start, timedelta)[0], start)
+
+    def test_get_fragmentation(self):
+        next_date = self.date + TimeDelta(days=1)
+        self.assertEqual(self.scheduler.get_fragmentation(self.date, next_date), 0)
+
+        # Assert free time outside each date's largest free slot is measured.
+        self.scheduler.schedule_event(self.event_1000_to_1030)
+        self.scheduler.schedule_event(self.event_1100_to_1130)
+        self.assertAlmostEqual(self.scheduler.get_fragmentation(self.date, self.date), 1 - 390 / 480)
+        self.assertAlmostEqual(
+            self.scheduler.get_fragmentation(self.date, next_date),
+            1 - (390 + 540) / (480 + 540)
+        )
+
+        # Assert dates without free time or on invalid weekdays are not fragmented.
+        self.scheduler.schedule_event(self.event_0900_to_1800.copy(update={
+            'start': DateTime.combine(next_date, self.time_0900),
+            'end': DateTime.combine(next_date, self.time_1800)
+        }))
+        self.assertEqual(self.scheduler.get_fragmentation(next_date, next_date + TimeDelta(days=2)), 0)
+
+    def test_get_next_availability__refresh_start_to_today(self):
+        # Freeze the clock.
         now = DateTime.combine(self.date, Time(hour=11, minute=9, second=12))
-        now_returns = [now, now + TimeDelta(minutes=1)]
-        scheduler__DateTime.now.side_effect = now_returns
-        scheduler__DateTime.combine.side_effect = DateTime.combine
+        self.scheduler.clock = Mock(wraps=FrozenClock(now))
 
         # Assert event fits inside availability.
         start = DateTime.combine(Date(year=2000, month=1, day=1), self.time_1000)
         timedelta = TimeDelta(hours=1)
         start, end = self.scheduler.get_next_availability(start, timedelta)
-        expected_start = utils.round_up_datetime(now_returns[-1], TimeDelta(minutes=1))
+        expected_start = utils.round_up_datetime(now, TimeDelta(minutes=1))
         self.assertEqual(start, expected_start)
         self.assertEqual(end, expected_start + timedelta)
 
-    @patch('scheduler.DateTime')
-    def test_get_next_availability__refresh_start_to_next_day(self, scheduler__DateTime: Mock):
-        # Mock DateTime's class methods.
+        # Assert the clock is read once.
+        self.scheduler.clock.now.assert_called_once()
+
+    def test_get_next_availability__refresh_start_to_next_day(self):
+        # Freeze the clock.
         now = DateTime.combine(self.date, Time(hour=23, minute=59))
-        now_returns = [now, now + TimeDelta(minutes=1), now + TimeDelta(minutes=2)]
-        scheduler__DateTime.now.side_effect = now_returns
-        scheduler__DateTime.combine.side_effect = DateTime.combine
+        self.scheduler.clock = FrozenClock(now)
 
         # Assert availability for the next date is retrieved after start is refreshed.
         start = DateTime.combine(Date(year=2000, month=1, day=1), self.time_1000)
         timedelta = TimeDelta(hours=1)
         start, end = self.scheduler.get_next_availability(start, timedelta)
-        expected_start = DateTime.combine(now_returns[-1].date(), self.time_0900)
+        expected_start = DateTime.combine(now.date() + TimeDelta(days=1), self.time_0900)
         self.assertEqual(start, expected_start)
         self.assertEqual(end, expected_start + timedelta)
 
+    def test_schedule_events__frozen_clock(self):
+        # Assert the clock is read once per batch.
+        self.scheduler.clock = Mock(wraps=FrozenClock())
+        self.scheduler.schedule_events([
+            self.event_0900_to_1000,
+            self.event_0900_to_0930,
+            self.event_0930_to_1000
+        ])
+        self.scheduler.clock.now.assert_called_once()
+        self.assertIsInstance(self.scheduler.clock, Mock)
+
     def test_reschedule_invalid_event(self):
         name = 'some meeting'
         event = self.scheduler.reschedule_invalid_event(
@@ -223,6 +529,30 @@ class SchedulerTests(TestCase):
         ))
         self.assertListEqual(self.scheduler._schedule[date], [event])
 
+    def test_reschedule_invalid_event__calendar(self):
+        self.scheduler = Scheduler(calendar=WorkingCalendar(
+            valid_weekdays=[6, 0, 1, 2, 3],
+            start_of_day=Time(hour=8, minute=0),
+            end_of_day=Time(hour=17, minute=0)
+        ))
+        event = self.scheduler.reschedule_invalid_event(
+            created_at=DateTime.combine(self.date, Time(hour=0, minute=0)),
+            start=DateTime.combine(self.date, Time(hour=17, minute=0)),
+            end=DateTime.combine(self.date, Time(hour=18, minute=0)),
+            name='some meeting'
+        )
+
+        # Assert event is rescheduled to the start of the next working day on the calendar.
+        sunday = Date(year=2032, month=11, day=14)
+        self.assertEqual(event.start, DateTime.combine(sunday, Time(hour=8, minute=0)))
+        self.assertEqual(event.end, DateTime.combine(sunday, Time(hour=9, minute=0)))
+        self.assertListEqual(self.scheduler.get_availabilities(sunday), [
+            Scheduler.Availability(
+                start=DateTime.combine(sunday, Time(hour=9, minute=0)),
+                end=DateTime.combine(sunday, Time(hour=17, minute=0))
+            )
+        ])
+
     def test_reschedule_overlapping_event(self):
         self.scheduler._schedule[self.date] = [
             self.event_0930_to_1000
@@ -237,6 +567,80 @@ class SchedulerTests(TestCase):
             )
         ])
 
+    def test_reschedule_overlapping_event__retry(self):
+        self.scheduler._schedule[self.date] = [
+            self.event_0930_to_1000
+        ]
+
+        # Return a taken availability the first time.
+        self.scheduler.get_next_availability = Mock(side_effect=[
+            (DateTime.combine(self.date, self.time_0930), DateTime.combine(self.date, self.time_1030)),
+            (DateTime.combine(self.date, self.time_1000), DateTime.combine(self.date, self.time_1100))
+        ])
+
+        # Assert availability is searched for again without recursing.
+        with patch.object(self.scheduler, 'schedule_event') as schedule_event:
+            self.scheduler.reschedule_overlapping_event(self.event_0900_to_1000)
+            schedule_event.assert_not_called()
+        self.assertEqual(self.scheduler.reschedule_retries, 1)
+        self.assertListEqual(self.scheduler._schedule[self.date], [
+            self.event_0930_to_1000,
+            Event(
+                start=DateTime.combine(self.date, self.time_1000),
+                end=DateTime.combine(self.date, self.time_1100),
+                name=self.event_0900_to_1000.name
+            )
+        ])
+
+    def test_reschedule_overlapping_event__stale_free_slots(self):
+        self.scheduler._schedule[self.date] = [
+            self.event_0930_to_1000
+        ]
+
+        # Keep free slots which say the whole date is free, as if they were not updated.
+        self.scheduler._get_free_slots(self.date)
+        start_of_day = DateTime.combine(self.date, self.time_0900)
+        self.scheduler._free_slots[self.date] = [Span(start_of_day, start_of_day + TimeDelta(hours=9))]
+
+        # Assert the stale free slots are dropped and the availability is searched for again.
+        self.scheduler.reschedule_overlapping_event(self.event_0900_to_1000)
+        self.assertEqual(self.scheduler.reschedule_retries, 1)
+        self.assertListEqual(self.scheduler._schedule[self.date], [
+            self.event_0930_to_1000,
+            Event(
+                start=DateTime.combine(self.date, self.time_1000),
+                end=DateTime.combine(self.date, self.time_1100),
+                name=self.event_0900_to_1000.name
+            )
+        ])
+
+    def test_reschedule_attempts(self):
+        self.scheduler.insert_event(self.event_0930_to_1000)
+        attempts = self.scheduler.reschedule_attempts(self.event_0900_to_1000)
+
+        # Assert event is moved to the next availability.
+        event = next(attempts)
+        self.assertIs(event, self.event_0900_to_1000)
+        self.assertEqual(event.start, DateTime.combine(self.date, self.time_1000))
+
+        # Assert event is moved on if the availability is taken before it is inserted.
+        self.assertTrue(self.scheduler.insert_event(self.event_1000_to_1100))
+        self.assertFalse(self.scheduler.insert_event(event))
+        event = next(attempts)
+        self.assertEqual(event.start, DateTime.combine(self.date, self.time_1100))
+        self.assertTrue(self.scheduler.insert_event(event))
+        self.assertEqual(self.scheduler.reschedule_retries, 1)
+
+    def test_reschedule_overlapping_event__max_retries(self):
+        self.scheduler.max_reschedule_retries = 2
+
+        # Assert rescheduling gives up once every availability found was taken.
+        with patch.object(self.scheduler, '_insert_event', return_value=False) as insert_event:
+            with self.assertRaises(Scheduler.RescheduleRetriesExceededError):
+                self.scheduler.reschedule_overlapping_event(self.event_0900_to_1000)
+            self.assertEqual(insert_event.call_count, 3)
+        self.assertEqual(self.scheduler.reschedule_retries, 2)
+
     def test_schedule_event(self):
         # Assert events are added in the correct order.
         rescheduled = self.scheduler.schedule_event(self.event_0930_to_1000)
@@ -255,6 +659,57 @@ class SchedulerTests(TestCase):
             self.event_1030_to_1100
         ])
 
+    def test_schedule_event__metrics(self):
+        observations = []
+        scheduler = Scheduler(metrics=Metrics(lambda name, value: observations.append(name)))
+        scheduler.schedule_event(self.event_0900_to_1800)
+        scheduler.schedule_event(self.event_0900_to_1000)
+
+        # Assert each stage is observed, walking from the booked date to the next one.
+        snapshot = scheduler.metrics.snapshot()
+        self.assertEqual(snapshot['schedule_event']['count'], 2)
+        self.assertEqual(snapshot['overlap_scan']['count'], 3)
+        # The next date has no events, so its free slots are computed each time it is looked at.
+        self.assertEqual(snapshot['availability']['count'], 3)
+        self.assertEqual(snapshot['next_availability']['count'], 1)
+        self.assertDictEqual(snapshot['days_walked'], {'count': 1, 'total': 2, 'mean': 2, 'max': 2})
+        self.assertDictEqual(
+            snapshot['reschedule_depth'],
+            {'count': 1, 'total': 1, 'mean': 1, 'max': 1}
+        )
+        self.assertEqual(len(observations), sum(stat['count'] for stat in snapshot.values()))
+
+        # Assert stages are observed by the scheduler's methods, not by replacing them.
+        self.assertNotIn('schedule_event', vars(scheduler))
+        self.assertIsNone(self.scheduler.metrics)
+
+    def test_schedule_event__metrics__days_walked(self):
+        scheduler = Scheduler(metrics=Metrics())
+        # Book the date and the next one, whose free slots are only known once looked at.
+        next_date = self.date + TimeDelta(days=1)
+        scheduler.schedule_events([
+            self.event_0900_to_1800,
+            Event(
+                start=DateTime.combine(next_date, self.time_0900),
+                end=DateTime.combine(next_date, self.time_1800),
+                name='Meeting on the next date'
+            )
+        ])
+        scheduler.schedule_event(self.event_0900_to_1000)
+
+        # Assert each date looked at is counted, once, up to the Monday after the weekend.
+        self.assertEqual(self.event_0900_to_1000.start.date(), Date(year=2032, month=11, day=15))
+        self.assertDictEqual(
+            scheduler.metrics.snapshot()['days_walked'],
+            {'count': 1, 'total': 3, 'mean': 3, 'max': 3}
+        )
+
+    def test_schedule_event__list_event_index(self):
+        self.scheduler = Scheduler(event_index=ListEventIndex())
+        self.test_schedule_event()
+        rescheduled = self.scheduler.schedule_event(self.event_1000_to_1100)
+        self.assertTrue(rescheduled)
+
     def test_schedule_event__reschedule_overlapping_event__same_day(self):
         rescheduled = self.scheduler.schedule_event(self.event_0900_to_0930)
         self.assertFalse(rescheduled)
@@ -299,3 +754,100 @@ class SchedulerTests(TestCase):
                 )
             ]
         })
+
+    def test_schedule_events(self):
+        self.scheduler._schedule[self.date] = [
+            self.event_1000_to_1030
+        ]
+
+        # Assert non-overlapping events are merged into the schedule in order.
+        rescheduled = self.scheduler.schedule_events([
+            self.event_1700_to_1800,
+            self.event_0900_to_0930,
+            self.event_1030_to_1100
+        ])
+        self.assertListEqual(rescheduled, [False, False, False])
+        self.assertListEqual(self.scheduler._schedule[self.date], [
+            self.event_0900_to_0930,
+            self.event_1000_to_1030,
+            self.event_1030_to_1100,
+            self.event_1700_to_1800
+        ])
+
+    def test_schedule_events__overlapping_events(self):
+        def events():
+            return [
+                self.event_0900_to_1800.copy(),
+                self.event_1000_to_1100.copy(),
+                self.event_0900_to_0930.copy(),
+                self.event_1030_to_1130.copy(),
+                self.event_0930_to_1000.copy()
+            ]
+
+        # Assert overlapping events are scheduled the same as one at a time.
+        rescheduled = self.scheduler.schedule_events(events())
+        scheduler = Scheduler()
+        self.assertListEqual(rescheduled, [scheduler.schedule_event(event) for event in events()])
+        self.assertListEqual(rescheduled, [False, True, True, True, True])
+        self.assertDictEqual(self.scheduler._schedule, scheduler._schedule)
+
+    def test_schedule_events__overlapping_later_date(self):
+        next_date = self.date + TimeDelta(days=1)
+
+        def events():
+            return [
+                Event(
+                    start=DateTime.combine(next_date, self.time_0900),
+                    end=DateTime.combine(next_date, self.time_1800),
+                    name='Meeting on the next date'
+                ),
+                self.event_1000_to_1100.copy(),
+                Event(
+                    start=DateTime.combine(next_date, self.time_0900),
+                    end=DateTime.combine(next_date, self.time_1000),
+                    name='Overlapping meeting on the next date'
+                ),
+                self.event_0900_to_1000.copy()
+            ]
+
+        # Assert only the events from the first date with overlaps are scheduled one by one.
+        with patch.object(
+            self.scheduler,
+            'schedule_event',
+            wraps=self.scheduler.schedule_event
+        ) as schedule_event:
+            rescheduled = self.scheduler.schedule_events(events())
+            self.assertEqual(schedule_event.call_count, 2)
+
+        # Assert events are scheduled the same as one at a time, even if moved past their date.
+        scheduler = Scheduler()
+        self.assertListEqual(rescheduled, [scheduler.schedule_event(event) for event in events()])
+        self.assertListEqual(rescheduled, [False, False, True, False])
+        self.assertDictEqual(self.scheduler._schedule, scheduler._schedule)
+
+    def test_schedule_events__matches_one_at_a_time(self):
+        rng = random.Random(0)
+        dates = [self.date + TimeDelta(days=days) for days in range(10)]
+        for _ in range(20):
+            spans = [
+                (rng.choice(dates), rng.randrange(9, 17), rng.choice([30, 60, 180]))
+                for _ in range(rng.randrange(1, 40))
+            ]
+
+            def events():
+                return [
+                    Event.from_trusted(
+                        DateTime.combine(date, Time(hour=hour)),
+                        DateTime.combine(date, Time(hour=hour)) + TimeDelta(minutes=minutes),
+                        name='Meeting'
+                    )
+                    for date, hour, minutes in spans
+                ]
+
+            # Assert batches are scheduled the same as one at a time, whichever dates overlap.
+            scheduler, sequential_scheduler = Scheduler(), Scheduler()
+            self.assertListEqual(
+                scheduler.schedule_events(events()),
+                [sequential_scheduler.schedule_event(event) for event in events()]
+            )
+            self.assertEqual(scheduler.snapshot(), sequential_scheduler.snapshot())
@@ -0,0 +1,255 @@
+from unittest import TestCase
+from unittest.mock import patch
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+from datetime import time as Time
+import random
+
+from scheduler_pool import SchedulerPool
+from scheduler import Scheduler
+from event import Event
+from clock import FrozenClock
+from placement import BestFitPlacement
+from metrics import Metrics
+
+
+class SchedulerPoolTests(TestCase):
+    def setUp(self) -> None:
+        self.date = Date(year=2032, month=11, day=11)
+        self.pool = SchedulerPool(clock=FrozenClock(DateTime(year=2032, month=11, day=1, hour=9)))
+
+    def create_event(self, date: Date, start: Time, end: Time):
+        return Event(
+            start=DateTime.combine(date, start),
+            end=DateTime.combine(date, end),
+            name=f'Meeting between {start} and {end}'
+        )
+
+    def test_schedule_event(self):
+        # Assert resources only take up space once an event is scheduled.
+        self.assertEqual(len(self.pool.get_availabilities('room', self.date)), 1)
+        self.assertNotIn('room', self.pool)
+        self.assertFalse(self.pool.schedule_event(
+            'room',
+            self.create_event(self.date, Time(hour=9), Time(hour=10))
+        ))
+        self.assertIn('room', self.pool)
+        self.assertListEqual(self.pool.resource_ids, ['room'])
+
+        # Assert each resource's scheduler shares the pool's settings.
+        scheduler = self.pool.get_scheduler('room')
+        self.assertIs(self.pool.get_scheduler('room'), scheduler)
+        self.assertIs(scheduler.event_index, self.pool.event_index)
+        self.assertIs(scheduler.calendar, self.pool.calendar)
+        self.assertIs(scheduler.clock, self.pool.clock)
+        self.assertIs(scheduler.placement, self.pool.placement)
+        self.assertIs(scheduler.metrics, self.pool.metrics)
+
+        # Assert resources are scheduled independently.
+        self.assertFalse(self.pool.schedule_event(
+            'person',
+            self.create_event(self.date, Time(hour=9), Time(hour=10))
+        ))
+        event = self.create_event(self.date, Time(hour=9), Time(hour=10))
+        self.assertTrue(self.pool.schedule_event('room', event))
+        self.assertEqual(event.start, DateTime.combine(self.date, Time(hour=10)))
+        self.assertListEqual(self.pool.get_availabilities('room', self.date), [
+            Scheduler.Availability(
+                start=DateTime.combine(self.date, Time(hour=11)),
+                end=DateTime.combine(self.date, Time(hour=18))
+            )
+        ])
+        self.assertEqual(len(self.pool.snapshot('person')[self.date]), 1)
+        self.assertEqual(len(self.pool.snapshot('other')), 0)
+
+    def test_schedule_events__matches_scheduler(self):
+        rng = random.Random(2)
+        scheduler = Scheduler(clock=self.pool.clock)
+        dates = [self.date + TimeDelta(days=days) for days in range(7)]
+        spans = [
+            (rng.choice(dates), rng.randrange(0, 24), rng.choice([30, 60, 120, 300]))
+            for _ in range(200)
+        ]
+
+        def create_events():
+            return [
+                Event.from_trusted(
+                    DateTime.combine(date, Time(hour=hour)),
+                    DateTime.combine(date, Time(hour=hour)) + TimeDelta(minutes=minutes),
+                    name='Meeting'
+                )
+                for date, hour, minutes in spans
+            ]
+
+        # Assert events are scheduled the same as by a scheduler.
+        self.assertListEqual(
+            self.pool.schedule_events('room', create_events()),
+            scheduler.schedule_events(create_events())
+        )
+        self.assertEqual(self.pool.snapshot('room'), scheduler.snapshot())
+        for date in dates:
+            self.assertListEqual(
+                self.pool.get_availabilities('room', date),
+                scheduler.get_availabilities(date)
+            )
+
+    def test_schedule_event__placement_and_metrics(self):
+        self.pool = SchedulerPool(
+            clock=self.pool.clock,
+            metrics=Metrics(),
+            placement=BestFitPlacement()
+        )
+        self.pool.schedule_event('room', self.create_event(self.date, Time(hour=10), Time(hour=17)))
+
+        # Assert an overlapping event is placed in the smallest free slot it fits in.
+        event = self.create_event(self.date, Time(hour=10), Time(hour=11))
+        self.assertTrue(self.pool.schedule_event('room', event))
+        self.assertEqual(event.start, DateTime.combine(self.date, Time(hour=17)))
+        self.assertEqual(self.pool.metrics.snapshot()['schedule_event']['count'], 2)
+
+        # Assert rescheduling gives up once a resource's retry cap is exceeded.
+        scheduler = self.pool.get_scheduler('room')
+        scheduler.max_reschedule_retries = 0
+        with patch.object(scheduler, '_insert_event', return_value=False):
+            with self.assertRaises(Scheduler.RescheduleRetriesExceededError):
+                self.pool.schedule_event(
+                    'room',
+                    self.create_event(self.date, Time(hour=10), Time(hour=11))
+                )
+
+    def test_get_common_availabilities(self):
+        self.pool.schedule_event('room', self.create_event(self.date, Time(hour=9), Time(hour=10)))
+        self.pool.schedule_event('person', self.create_event(self.date, Time(hour=12), Time(hour=17)))
+
+        # Assert only the spans every resource is available in are returned.
+        self.assertListEqual(
+            self.pool.get_common_availabilities(['room', 'person', 'other'], self.date),
+            [
+                Scheduler.Availability(
+                    start=DateTime.combine(self.date, Time(hour=10)),
+                    end=DateTime.combine(self.date, Time(hour=12))
+                ),
+                Scheduler.Availability(
+                    start=DateTime.combine(self.date, Time(hour=17)),
+                    end=DateTime.combine(self.date, Time(hour=18))
+                )
+            ]
+        )
+
+        with self.assertRaises(ValueError):
+            self.pool.get_common_availabilities([], self.date)
+
+    def test_get_next_common_availability(self):
+        # Book each resource's whole day on different dates.
+        next_date = Date(year=2032, month=11, day=12)
+        self.pool.schedule_event('room', self.create_event(self.date, Time(hour=9), Time(hour=18)))
+        self.pool.schedule_event('person', self.create_event(next_date, Time(hour=9), Time(hour=17)))
+
+        # Assert the first span every resource is free in is found.
+        start = DateTime.combine(self.date, Time(hour=9))
+        self.assertEqual(
+            self.pool.get_next_common_availability(['room', 'person'], start, TimeDelta(hours=1)),
+            (DateTime.combine(next_date, Time(hour=17)), DateTime.combine(next_date, Time(hour=18)))
+        )
+
+        # Assert dates too booked for a resource are skipped.
+        self.assertEqual(
+            self.pool.get_next_common_available_date(['room', 'person'], self.date, TimeDelta(hours=2)),
+            Date(year=2032, month=11, day=15)
+        )
+
+        # Assert the span is chosen by the pool's placement, from the smallest common free slot.
+        monday = Date(year=2032, month=11, day=15)
+        self.pool.schedule_event('room', self.create_event(monday, Time(hour=11), Time(hour=12)))
+        self.pool.schedule_event('person', self.create_event(monday, Time(hour=13), Time(hour=17)))
+        self.pool.placement = BestFitPlacement()
+        self.assertEqual(
+            self.pool.get_next_common_availability(
+                ['room', 'person'],
+                DateTime.combine(monday, Time(hour=9)),
+                TimeDelta(hours=1)
+            ),
+            (DateTime.combine(monday, Time(hour=12)), DateTime.combine(monday, Time(hour=13)))
+        )
+
+        # Assert durations longer than any availability cannot be found.
+        with self.assertRaises(ValueError):
+            self.pool.get_next_common_availability(['room'], start, TimeDelta(hours=10))
+
+    def test_get_next_common_availability__matches_brute_force(self):
+        rng = random.Random(0)
+        resource_ids = ['a', 'b', 'c']
+        dates = [self.date + TimeDelta(days=days) for days in range(14)]
+        for _ in range(150):
+            date = rng.choice(dates)
+            if date.weekday() < 5:
+                start = Time(hour=rng.randrange(9, 17), minute=rng.choice([0, 15, 30, 45]))
+                end = (DateTime.combine(date, start) + TimeDelta(minutes=rng.choice([15, 30, 60]))).time()
+                self.pool.schedule_event(rng.choice(resource_ids), self.create_event(date, start, end))
+
+        def brute_force(start: DateTime, timedelta: TimeDelta):
+            # Try each minute in turn.
+            while True:
+                end = start + timedelta
+                if self.pool.calendar.is_valid_weekday(start) and all(
+                    any(
+                        availability.start <= start and end <= availability.end
+                        for availability in self.pool.get_availabilities(resource_id, start.date())
+                    )
+                    for resource_id in resource_ids
+                ):
+                    return start, end
+                start += TimeDelta(minutes=1)
+
+        # Assert the same span is found as by trying each minute.
+        for _ in range(20):
+            start = DateTime.combine(rng.choice(dates), Time(hour=rng.randrange(0, 24)))
+            timedelta = TimeDelta(minutes=rng.choice([15, 60, 120, 240]))
+            self.assertEqual(
+                self.pool.get_next_common_availability(resource_ids, start, timedelta),
+                brute_force(start, timedelta)
+            )
+
+    def test_schedule_events_parallel(self):
+        rng = random.Random(1)
+        resource_ids = ['a', 'b', 'c', 'd', 'e']
+        dates = [
+            date
+            for date in (self.date + TimeDelta(days=days) for days in range(7))
+            if date.weekday() < 5
+        ]
+        serial_pool = SchedulerPool(clock=self.pool.clock)
+
+        def create_events(spans):
+            return {
+                resource_id: [
+                    self.create_event(
+                        date,
+                        Time(hour=hour),
+                        (DateTime.combine(date, Time(hour=hour)) + TimeDelta(minutes=minutes)).time()
+                    )
+                    for date, hour, minutes in events
+                ]
+                for resource_id, events in spans.items()
+            }
+
+        for _ in range(2):
+            spans = {
+                resource_id: [
+                    (rng.choice(dates), rng.randrange(9, 17), rng.choice([30, 60, 120]))
+                    for _ in range(rng.randrange(0, 60))
+                ]
+                for resource_id in resource_ids
+            }
+            events, serial_events = create_events(spans), create_events(spans)
+
+            # Assert events are scheduled the same as when each resource is scheduled in turn.
+            rescheduled = self.pool.schedule_events_parallel(events, max_workers=2)
+            for resource_id in resource_ids:
+                self.assertListEqual(
+                    rescheduled[resource_id],
+                    serial_pool.schedule_events(resource_id, serial_events[resource_id])
+                )
+                self.assertListEqual(events[resource_id], serial_events[resource_id])
+                self.assertEqual(self.pool.snapshot(resource_id), serial_pool.snapshot(resource_id))
@@ -0,0 +1,137 @@
+from unittest import TestCase
+from unittest.mock import patch
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+from datetime import time as Time
+import os
+import tempfile
+
+from scheduler import Scheduler
+from event import Event
+from working_calendar import WorkingCalendar
+from clock import FrozenClock
+import snapshot
+
+
+class SnapshotTests(TestCase):
+    def setUp(self) -> None:
+        self.date = Date(year=2032, month=11, day=11)
+        self.clock = FrozenClock(DateTime(year=2032, month=11, day=1, hour=9, minute=0, second=30))
+        self.scheduler = Scheduler(clock=self.clock)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'schedule.snapshot')
+
+    def create_event(self, date: Date, start: Time, end: Time, name: str):
+        return Event(
+            start=DateTime.combine(date, start),
+            end=DateTime.combine(date, end),
+            name=name,
+            created_at=self.clock.now()
+        )
+
+    def test_save_and_load(self):
+        next_date = self.date + TimeDelta(days=1)
+        self.scheduler.schedule_events([
+            self.create_event(self.date, Time(hour=10), Time(hour=11), 'Stand-up'),
+            self.create_event(self.date, Time(hour=9), Time(hour=10), 'Café ☕'),
+            self.create_event(next_date, Time(hour=9), Time(hour=10), 'Stand-up'),
+            self.create_event(next_date, Time(hour=9), Time(hour=10), 'Rescheduled')
+        ])
+        snapshot.save(self.scheduler, self.path)
+
+        # Assert events are loaded as they were saved.
+        scheduler = snapshot.load(self.path, Scheduler(clock=self.clock))
+        self.assertEqual(scheduler.snapshot(), self.scheduler.snapshot())
+        for (_, events), (_, loaded_events) in zip(
+            self.scheduler.iter_schedule(),
+            scheduler.iter_schedule()
+        ):
+            for event, loaded_event in zip(events, loaded_events):
+                self.assertEqual(loaded_event.created_at, event.created_at)
+
+        # Assert loaded events are scheduled around.
+        self.assertListEqual(
+            scheduler.get_availabilities(self.date),
+            self.scheduler.get_availabilities(self.date)
+        )
+        self.assertTrue(scheduler.schedule_event(
+            self.create_event(next_date, Time(hour=9), Time(hour=10), 'Overlapping')
+        ))
+
+    def test_load__calendar(self):
+        calendar = WorkingCalendar(valid_weekdays=[6, 0, 1, 2, 3])
+        scheduler = Scheduler(calendar=calendar, clock=self.clock)
+        scheduler.schedule_event(scheduler.event_type(
+            start=DateTime(year=2032, month=11, day=14, hour=9),
+            end=DateTime(year=2032, month=11, day=14, hour=10),
+            name='Meeting on Sunday'
+        ))
+        snapshot.save(scheduler, self.path)
+
+        # Assert events are loaded as the scheduler's event type.
+        loaded_scheduler = snapshot.load(self.path, Scheduler(calendar=calendar))
+        self.assertIs(type(next(loaded_scheduler.events_between(
+            DateTime(year=2032, month=11, day=14),
+            DateTime(year=2032, month=11, day=15)
+        ))), scheduler.event_type)
+
+    def test_save__empty(self):
+        snapshot.save(self.scheduler, self.path)
+        self.assertEqual(len(snapshot.load(self.path).schedule), 0)
+
+    def test_save__not_whole_minute(self):
+        self.scheduler.schedule_event(Event(
+            start=DateTime.combine(self.date, Time(hour=9, second=30)),
+            end=DateTime.combine(self.date, Time(hour=10)),
+            name='Meeting'
+        ))
+        with self.assertRaises(ValueError):
+            snapshot.save(self.scheduler, self.path)
+
+    def test_save__replaces_last_snapshot(self):
+        self.scheduler.schedule_event(self.create_event(self.date, Time(hour=9), Time(hour=10), 'A'))
+        snapshot.save(self.scheduler, self.path)
+        self.scheduler.schedule_event(self.create_event(self.date, Time(hour=10), Time(hour=11), 'B'))
+
+        # Assert the last snapshot is kept whole if the new one cannot replace it.
+        with patch('os.replace', side_effect=OSError) as replace:
+            with self.assertRaises(OSError):
+                snapshot.save(self.scheduler, self.path)
+            replace.assert_called_once_with(self.path + '.tmp', self.path)
+        self.assertEqual(len(snapshot.load(self.path).schedule[self.date]), 1)
+
+        # Assert the new snapshot replaces the last one.
+        snapshot.save(self.scheduler, self.path)
+        self.assertEqual(len(snapshot.load(self.path).schedule[self.date]), 2)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+    def test_load__not_empty(self):
+        self.scheduler.schedule_event(self.create_event(self.date, Time(hour=9), Time(hour=10), 'A'))
+        snapshot.save(self.scheduler, self.path)
+
+        # Assert the events of a scheduler are not replaced.
+        with self.assertRaises(ValueError):
+            snapshot.load(self.path, self.scheduler)
+        self.assertEqual(len(self.scheduler.schedule[self.date]), 1)
+
+    def test_load__invalid(self):
+        # Assert empty file.
+        open(self.path, 'wb').close()
+        with self.assertRaises(snapshot.SnapshotError):
+            snapshot.load(self.path)
+
+        # Assert not a snapshot.
+        with open(self.path, 'wb') as file:
+            file.write(b'2032/11/11 09:00 -> 2032/11/11 10:00 - Meeting')
+        with self.assertRaises(snapshot.SnapshotError):
+            snapshot.load(self.path)
+
+        # Assert truncated snapshot.
+        self.scheduler.schedule_event(self.create_event(self.date, Time(hour=9), Time(hour=10), 'A'))
+        snapshot.save(self.scheduler, self.path)
+        with open(self.path, 'r+b') as file:
+            file.truncate(os.path.getsize(self.path) - 2)
+        with self.assertRaises(snapshot.SnapshotError):
+            snapshot.load(self.path)
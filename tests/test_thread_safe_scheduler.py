@@ -0,0 +1,181 @@
+from unittest import TestCase
+from datetime import datetime as DateTime
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+from datetime import time as Time
+import random
+import sys
+import threading
+
+from thread_safe_scheduler import ThreadSafeScheduler
+from scheduler import Scheduler
+from event import Event
+from clock import FrozenClock
+from metrics import Metrics
+from placement import BestFitPlacement
+
+
+class ThreadSafeSchedulerTests(TestCase):
+    def setUp(self) -> None:
+        self.date = Date(year=2032, month=11, day=11)
+        self.clock = FrozenClock(DateTime(year=2032, month=11, day=1, hour=9, minute=0))
+
+    def create_event(self, date: Date, hour: int, minutes: int, name: str):
+        start = DateTime.combine(date, Time(hour=hour))
+        return Event(start=start, end=start + TimeDelta(minutes=minutes), name=name)
+
+    def assert_consistent(self, scheduler: ThreadSafeScheduler):
+        for date, events in scheduler.snapshot().items():
+            # Assert no events are double-booked.
+            for event, next_event in zip(events, events[1:]):
+                self.assertLessEqual(event.end, next_event.start)
+            # Assert kept free slots match the events.
+            self.assertListEqual(scheduler._read_free_slots(date), scheduler._compute_free_slots(date))
+        self.assertListEqual(scheduler._dates, sorted(scheduler.snapshot()))
+
+    def test_schedule_event(self):
+        scheduler = ThreadSafeScheduler(clock=self.clock)
+        sequential_scheduler = Scheduler(clock=self.clock)
+        times = [(9, 60), (9, 120), (10, 90), (15, 180), (9, 540), (11, 60)]
+
+        # Assert events are scheduled the same as by a scheduler when used by one thread.
+        for hour, minutes in times:
+            self.assertEqual(
+                scheduler.schedule_event(self.create_event(self.date, hour, minutes, 'Meeting')),
+                sequential_scheduler.schedule_event(self.create_event(self.date, hour, minutes, 'Meeting'))
+            )
+        self.assertEqual(scheduler.snapshot(), sequential_scheduler.snapshot())
+        self.assertListEqual(
+            scheduler.get_availabilities(self.date),
+            sequential_scheduler.get_availabilities(self.date)
+        )
+        self.assert_consistent(scheduler)
+
+    def test_schedule_event__placement(self):
+        scheduler = ThreadSafeScheduler(clock=self.clock, placement=BestFitPlacement())
+        sequential_scheduler = Scheduler(clock=self.clock, placement=BestFitPlacement())
+        self.assertIsInstance(scheduler.placement, BestFitPlacement)
+
+        # Assert overlapping events are placed in the smallest free slot they fit in.
+        scheduler.schedule_event(self.create_event(self.date, 11, 360, 'Meeting'))
+        event = self.create_event(self.date, 11, 60, 'Overlapping meeting')
+        self.assertTrue(scheduler.schedule_event(event))
+        self.assertEqual(event.start, DateTime.combine(self.date, Time(hour=17)))
+
+        # Assert events are scheduled the same as by a scheduler with the same placement.
+        sequential_scheduler.schedule_events([
+            self.create_event(self.date, 11, 360, 'Meeting'),
+            self.create_event(self.date, 11, 60, 'Overlapping meeting')
+        ])
+        for hour, minutes in [(9, 60), (9, 30), (10, 60), (9, 120)]:
+            self.assertEqual(
+                scheduler.schedule_event(self.create_event(self.date, hour, minutes, 'Meeting')),
+                sequential_scheduler.schedule_event(self.create_event(self.date, hour, minutes, 'Meeting'))
+            )
+        self.assertEqual(scheduler.snapshot(), sequential_scheduler.snapshot())
+        self.assert_consistent(scheduler)
+
+    def test_schedule_event__metrics(self):
+        scheduler = ThreadSafeScheduler(clock=self.clock, metrics=Metrics())
+        scheduler.schedule_events([
+            self.create_event(self.date, 9, 60, 'Meeting'),
+            self.create_event(self.date, 9, 60, 'Overlapping meeting')
+        ])
+
+        # Assert the stages this scheduler overrides are observed too.
+        snapshot = scheduler.metrics.snapshot()
+        self.assertEqual(snapshot['schedule_events']['count'], 1)
+        self.assertEqual(snapshot['schedule_event']['count'], 2)
+        self.assertEqual(snapshot['overlap_scan']['count'], 3)
+        self.assertEqual(snapshot['reschedule_depth']['total'], 1)
+
+    def test_get_availabilities__never_locks(self):
+        scheduler = ThreadSafeScheduler(clock=self.clock)
+        scheduler.schedule_event(self.create_event(self.date, 9, 60, 'Meeting'))
+
+        # Assert availabilities are read while every lock is held by another thread.
+        for lock in scheduler._locks:
+            lock.acquire()
+        try:
+            availabilities = []
+            reader = threading.Thread(
+                target=lambda: availabilities.extend(scheduler.get_availabilities(self.date))
+            )
+            reader.start()
+            reader.join(timeout=5)
+            self.assertFalse(reader.is_alive())
+            self.assertEqual(availabilities[0].start, DateTime.combine(self.date, Time(hour=10)))
+        finally:
+            for lock in scheduler._locks:
+                lock.release()
+
+    def test_contention(self):
+        scheduler = ThreadSafeScheduler(clock=self.clock, stripes=4)
+        dates = [
+            date
+            for date in (self.date + TimeDelta(days=days) for days in range(7))
+            if date.weekday() < 5
+        ]
+        writers, events_per_writer = 8, 150
+        errors = []
+        barrier = threading.Barrier(writers + 2)
+        done = threading.Event()
+
+        # Create each writer's events up front, many of which overlap.
+        rng = random.Random(0)
+        writer_events = [
+            [
+                self.create_event(
+                    rng.choice(dates),
+                    rng.randrange(9, 17),
+                    rng.choice([15, 30, 60]),
+                    f'Writer {writer} meeting {i}'
+                )
+                for i in range(events_per_writer)
+            ]
+            for writer in range(writers)
+        ]
+
+        def write(events):
+            barrier.wait()
+            try:
+                for event in events:
+                    scheduler.schedule_event(event)
+            except Exception as ex:
+                errors.append(ex)
+
+        def read():
+            barrier.wait()
+            try:
+                while not done.is_set():
+                    for date in dates:
+                        availabilities = scheduler.get_availabilities(date)
+                        # Assert readers only see sorted availabilities which do not overlap.
+                        for availability, next_availability in zip(availabilities, availabilities[1:]):
+                            assert availability.end < next_availability.start
+            except Exception as ex:
+                errors.append(ex)
+
+        # Switch threads as often as possible to force contention.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        try:
+            threads = [threading.Thread(target=write, args=(events,)) for events in writer_events]
+            threads += [threading.Thread(target=read) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads[:writers]:
+                thread.join()
+            done.set()
+            for thread in threads[writers:]:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertListEqual(errors, [])
+
+        # Assert no events are lost or scheduled twice.
+        names = [event.name for events in scheduler.snapshot().values() for event in events]
+        self.assertEqual(len(names), writers * events_per_writer)
+        self.assertEqual(len(set(names)), writers * events_per_writer)
+        self.assert_consistent(scheduler)
@@ -0,0 +1,54 @@
+from unittest import TestCase
+from datetime import timedelta as TimeDelta
+from datetime import datetime as DateTime
+from datetime import date as Date
+from datetime import time as Time
+
+from working_calendar import WorkingCalendar
+
+
+class WorkingCalendarTests(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.calendar = WorkingCalendar()
+        cls.regional_calendar = WorkingCalendar(
+            valid_weekdays=[6, 0, 1, 2, 3],
+            start_of_day=Time(hour=8, minute=30),
+            end_of_day=Time(hour=17, minute=0)
+        )
+
+    def test_init__invalid(self):
+        with self.assertRaises(ValueError):
+            WorkingCalendar(valid_weekdays=[])
+        with self.assertRaises(ValueError):
+            WorkingCalendar(start_of_day=Time(hour=18), end_of_day=Time(hour=9))
+
+    def test_max_timedelta(self):
+        self.assertEqual(self.calendar.max_timedelta, TimeDelta(hours=9))
+        self.assertEqual(self.regional_calendar.max_timedelta, TimeDelta(hours=8, minutes=30))
+
+    def test_descriptions(self):
+        self.assertEqual(self.calendar.weekdays_description, 'between Monday and Friday')
+        self.assertEqual(self.calendar.times_description, 'between 9:00 and 18:00')
+        self.assertEqual(
+            self.regional_calendar.weekdays_description,
+            'on Monday, Tuesday, Wednesday, Thursday, Sunday'
+        )
+        self.assertEqual(self.regional_calendar.times_description, 'between 8:30 and 17:00')
+
+    def test_is_valid_weekday(self):
+        saturday = Date(year=2032, month=11, day=13)
+        sunday = Date(year=2032, month=11, day=14)
+        self.assertFalse(self.calendar.is_valid_weekday(sunday))
+        self.assertTrue(self.regional_calendar.is_valid_weekday(sunday))
+        self.assertFalse(self.regional_calendar.is_valid_weekday(saturday))
+
+    def test_start_of__end_of(self):
+        date = Date(year=2032, month=11, day=14)
+        self.assertEqual(self.regional_calendar.start_of(date), DateTime(2032, 11, 14, 8, 30))
+        self.assertEqual(self.regional_calendar.end_of(date), DateTime(2032, 11, 14, 17, 0))
+
+    def test__eq__(self):
+        self.assertEqual(self.calendar, WorkingCalendar())
+        self.assertNotEqual(self.calendar, self.regional_calendar)
+        self.assertEqual(hash(self.calendar), hash(WorkingCalendar()))
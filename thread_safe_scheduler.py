@@ -0,0 +1,184 @@
+import typing as t
+from datetime import timedelta as TimeDelta
+from datetime import date as Date
+from bisect import bisect_left
+from itertools import chain, islice
+import threading
+
+from event import Event
+from event_index import EventIndex
+from gap_index import GapIndex
+from schedule_view import ScheduleView
+from working_calendar import WorkingCalendar
+from clock import Clock
+from metrics import Metrics
+from placement import PlacementStrategy
+from scheduler import Scheduler
+
+
+class _SynchronizedGapIndex(GapIndex):
+    """A gap index which may be shared by many threads. Each call holds the index's lock, which is
+    only held for O(log n) of the number of dates in the horizon.
+    """
+
+    def __init__(self, valid_weekdays: t.Iterable[int], max_gap: TimeDelta) -> None:
+        super().__init__(valid_weekdays, max_gap)
+        self._lock = threading.Lock()
+
+    def update(self, date: Date, gap: TimeDelta):
+        with self._lock:
+            super().update(date, gap)
+
+    def discard(self, date: Date):
+        with self._lock:
+            super().discard(date)
+
+    def find(self, date: Date, gap: TimeDelta):
+        with self._lock:
+            return super().find(date, gap)
+
+
+class ThreadSafeScheduler(Scheduler):
+    """A scheduler which may be shared by many threads.
+
+    Writes lock only the dates they insert into. Dates are spread over a fixed number of locks, so
+    events inserted into different dates rarely wait for each other. A date's events and free slots
+    are replaced with updated copies instead of being edited, so reads never lock and always see a
+    date as it was before or after an insert, never in between.
+
+    Events scheduled at once are scheduled one by one, as each may lock different dates.
+    """
+
+    def __init__(
+        self,
+        event_index: t.Optional[EventIndex] = None,
+        calendar: t.Optional[WorkingCalendar] = None,
+        clock: t.Optional[Clock] = None,
+        metrics: t.Optional[Metrics] = None,
+        placement: t.Optional[PlacementStrategy] = None,
+        stripes: int = 64
+    ) -> None:
+        """Create a thread-safe scheduler.
+
+        :param event_index: Finds where events belong in a date's events. Defaults to binary search.
+        :param calendar: The weekdays and times of day events are scheduled in. Defaults to the
+            calendar events are validated against.
+        :param clock: Where the current datetime is read from. Defaults to the system's clock.
+        :param metrics: Where to observe how long each stage of scheduling takes. Defaults to none,
+            in which case nothing is observed.
+        :param placement: Chooses which free slot of a date the next availability is in. Defaults
+            to the earliest free slot that fits.
+        :param stripes: How many locks the dates are spread over.
+        """
+        # Availabilities are not cached, as the cache would have to be locked by readers.
+        super().__init__(
+            event_index,
+            calendar,
+            clock,
+            metrics,
+            availability_cache_size=0,
+            placement=placement
+        )
+        self._gap_index = _SynchronizedGapIndex(
+            self.calendar.valid_weekdays,
+            self.calendar.max_timedelta
+        )
+        # Locks are reentrant so a write can look up the free slots of the date it has locked.
+        self._locks = [threading.RLock() for _ in range(stripes)]
+        # Guards the state shared by all dates: the ordered dates and the retry counter.
+        self._shared_lock = threading.Lock()
+
+    def _get_lock(self, date: Date):
+        """Get the lock a date is striped to."""
+        return self._locks[date.toordinal() % len(self._locks)]
+
+    def _update_dates(self, date: Date):
+        with self._shared_lock:
+            dates = self._dates
+            i = bisect_left(dates, date)
+            indexed = i < len(dates) and dates[i] == date
+            # Replace the ordered dates instead of editing them, so they never change while read.
+            if self._schedule.get(date):
+                if not indexed:
+                    self._dates = dates[:i] + [date] + dates[i:]
+            elif indexed:
+                self._dates = dates[:i] + dates[i + 1:]
+
+    def _on_event_inserted(self, event: Event):
+        self._split_free_slot(event)
+        if len(self._schedule[event.start.date()]) == 1:
+            self._update_dates(event.start.date())
+
+    @property
+    def schedule_view(self):
+        # The ordered dates are replaced as dates are added, so the view looks the dates up itself.
+        return ScheduleView(self._schedule)
+
+    def schedule_between(self, start: Date, end: Date):
+        return ScheduleView(self._schedule, start, end)
+
+    def get_availabilities(self, date: Date):
+        """Get all the unused datetime spans for a given date. Never waits for a lock.
+
+        :param date: The date to get availabilities for.
+        :return: The availabilities for that date.
+        """
+        return [
+            self.Availability.construct(start=start, end=end)
+            for start, end in self._read_free_slots(date)
+        ]
+
+    def _read_free_slots(self, date: Date):
+        # Free slots are only kept by writes, which hold the date's lock.
+        free_slots = self._free_slots.get(date)
+        if free_slots is None:
+            free_slots = self._compute_free_slots(date)
+        return free_slots
+
+    def _get_free_slots(self, date: Date):
+        free_slots = self._free_slots.get(date)
+        if free_slots is None:
+            with self._get_lock(date):
+                free_slots = super()._get_free_slots(date)
+        return free_slots
+
+    def _insert_event(self, event: Event):
+        date = event.start.date()
+        with self._get_lock(date), self._timer('overlap_scan'):
+            # Get all events for given date.
+            events = self._schedule.get(date, [])
+
+            # If event overlaps with an existing event, it cannot be inserted.
+            i = self.event_index.find_position(events, event)
+            if i is None:
+                return False
+
+            # Keep the date's free slots, so they can be split instead of computed by readers.
+            self._get_free_slots(date)
+
+            # Else replace the date's events with a copy that has the event inserted in order. The
+            # derived state is updated below, so the schedule's change notification is skipped.
+            self._schedule._replace(
+                date,
+                chain(islice(events, i), [event], islice(events, i, None))
+            )
+            self._on_event_inserted(event)
+            return True
+
+    def _discard_stale_free_slots(self, event: Event):
+        with self._get_lock(event.start.date()):
+            super()._discard_stale_free_slots(event)
+
+    def _count_reschedule_retry(self):
+        with self._shared_lock:
+            self.reschedule_retries += 1
+
+    def schedule_events(self, events: t.Iterable[Event]):
+        """Schedules many events, one by one in the order given. The outcome is the same as
+        scheduling each event in turn with schedule_event.
+
+        :param events: The events to schedule, in the order they were requested.
+        :return: A flag per event denoting if it was overlapping and rescheduled.
+        """
+        with self._timer('schedule_events'):
+            return [self.schedule_event(event) for event in events]
@@ -0,0 +1,84 @@
+import typing as t
+from datetime import datetime as DateTime
+from datetime import date as Date
+from datetime import time as Time
+import calendar
+
+
+class WorkingCalendar:
+    """The weekdays and times of day events may be scheduled in. Everything derived from them is
+    computed once, when the calendar is created.
+    """
+
+    def __init__(
+        self,
+        valid_weekdays: t.Iterable[int] = (0, 1, 2, 3, 4),
+        start_of_day: Time = Time(hour=9, minute=0),
+        end_of_day: Time = Time(hour=18, minute=0)
+    ) -> None:
+        """Create a working calendar.
+
+        :param valid_weekdays: Which weekdays events can be created for. 0=Monday -> 6=Sunday.
+        :param start_of_day: What time of day events may start at the earliest.
+        :param end_of_day: What time of day events may end at the latest.
+        """
+        self.valid_weekdays = frozenset(valid_weekdays)
+        if not self.valid_weekdays:
+            raise ValueError('There must be at least one valid weekday')
+        if start_of_day >= end_of_day:
+            raise ValueError('The start of the day must be before the end of the day')
+        self.start_of_day = start_of_day
+        self.end_of_day = end_of_day
+        # The longest an event can be, which is the length of the day.
+        self.max_timedelta = (
+            DateTime.combine(Date.min, end_of_day)
+            - DateTime.combine(Date.min, start_of_day)
+        )
+
+    def __eq__(self, calendar: object) -> bool:
+        if not isinstance(calendar, WorkingCalendar):
+            return NotImplemented
+        return self._key == calendar._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        return '{name}(valid_weekdays={valid_weekdays}, start_of_day={start}, end_of_day={end})'.format(
+            name=self.__class__.__name__,
+            valid_weekdays=sorted(self.valid_weekdays),
+            start=self.start_of_day,
+            end=self.end_of_day
+        )
+
+    @property
+    def _key(self):
+        return self.valid_weekdays, self.start_of_day, self.end_of_day
+
+    @property
+    def weekdays_description(self):
+        """Describes the valid weekdays, such as "between Monday and Friday"."""
+        weekdays = sorted(self.valid_weekdays)
+        if weekdays == list(range(weekdays[0], weekdays[-1] + 1)) and len(weekdays) > 1:
+            return f'between {calendar.day_name[weekdays[0]]} and {calendar.day_name[weekdays[-1]]}'
+        return 'on ' + ', '.join(calendar.day_name[weekday] for weekday in weekdays)
+
+    @property
+    def times_description(self):
+        """Describes the valid times of day, such as "between 9:00 and 18:00"."""
+        return 'between {start.hour}:{start.minute:02} and {end.hour}:{end.minute:02}'.format(
+            start=self.start_of_day,
+            end=self.end_of_day
+        )
+
+    def is_valid_weekday(self, date: t.Union[Date, DateTime]):
+        """Check if a date is on a valid weekday."""
+        return date.weekday() in self.valid_weekdays
+
+    def start_of(self, date: Date):
+        """Get the start of the day for a date."""
+        return DateTime.combine(date, self.start_of_day)
+
+    def end_of(self, date: Date):
+        """Get the end of the day for a date."""
+        return DateTime.combine(date, self.end_of_day)